@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio variants of the CPU-bound unmarshaling and validation functions.
+
+Unmarshaling and validating big payloads could take long enough to stall the
+event loop. The functions of this module run small payloads inline and offload
+payloads bigger than ``async_offload_threshold`` bytes (or whose size is unknown)
+to an executor, the default executor of the event loop if not provided.
+
+NOTE: offloaded calls run in other threads, so process based executors are not supported.
+
+All the functions return a :class:`TimedResult`.
+"""
+import asyncio
+import threading
+import typing
+from functools import partial
+from timeit import default_timer
+
+from bravado_core import request as bravado_request
+from bravado_core import response as bravado_response
+from bravado_core import validate as bravado_validate
+from bravado_core.instrumentation import get_body_size
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from concurrent.futures import Executor
+
+    from bravado_core._compat_typing import JSONDict
+    from bravado_core.operation import Operation
+    from bravado_core.spec import Spec
+
+
+class TimedResult(
+    typing.NamedTuple(
+        'TimedResult',
+        [
+            ('value', typing.Any),
+            ('offloaded', bool),
+            ('wait_duration', float),
+            ('run_duration', float),
+        ],
+    ),
+):
+    """Outcome of an asynchronous call.
+
+    :param value: value returned by the synchronous function
+    :param offloaded: True if the call has been offloaded to an executor
+    :param wait_duration: seconds spent waiting for an executor worker (0 if not offloaded)
+    :param run_duration: seconds spent running the synchronous function
+    """
+
+
+async def _run(
+    swagger_spec,  # type: Spec
+    func,  # type: typing.Callable[[], typing.Any]
+    payload_size,  # type: typing.Optional[int]
+    executor,  # type: typing.Optional[Executor]
+    offload_threshold,  # type: typing.Optional[int]
+):
+    # type: (...) -> TimedResult
+    if offload_threshold is None:
+        offload_threshold = swagger_spec.config['async_offload_threshold']
+
+    if payload_size is not None and payload_size <= offload_threshold:
+        start_time = default_timer()
+        value = func()
+        return TimedResult(value=value, offloaded=False, wait_duration=0.0, run_duration=default_timer() - start_time)
+
+    submit_time = default_timer()
+    cancelled = threading.Event()
+
+    def run_in_executor():
+        # type: () -> typing.Tuple[typing.Any, float, float]
+        start_time = default_timer()
+        if cancelled.is_set():
+            # The caller has been cancelled while the call was waiting for a worker
+            return None, start_time, start_time
+        return func(), start_time, default_timer()
+
+    try:
+        value, start_time, end_time = await asyncio.get_running_loop().run_in_executor(executor, run_in_executor)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
+
+    return TimedResult(
+        value=value,
+        offloaded=True,
+        wait_duration=start_time - submit_time,
+        run_duration=end_time - start_time,
+    )
+
+
+async def unmarshal_response(response, op, executor=None, offload_threshold=None):
+    # type: (typing.Any, Operation, typing.Optional[Executor], typing.Optional[int]) -> TimedResult
+    """Asynchronous :func:`bravado_core.response.unmarshal_response`.
+
+    :type response: :class:`bravado_core.response.IncomingResponse`
+    :type op: :class:`bravado_core.operation.Operation`
+    :param executor: executor running offloaded calls. Default executor of the running loop if None
+    :param offload_threshold: payloads bigger than this number of bytes are offloaded to the
+        executor. Defaults to async_offload_threshold config
+    :rtype: :class:`TimedResult`
+    """
+    return await _run(
+        op.swagger_spec,
+        partial(bravado_response.unmarshal_response, response, op),
+        get_body_size(response),
+        executor,
+        offload_threshold,
+    )
+
+
+async def unmarshal_request(request, op, executor=None, offload_threshold=None):
+    # type: (typing.Any, Operation, typing.Optional[Executor], typing.Optional[int]) -> TimedResult
+    """Asynchronous :func:`bravado_core.request.unmarshal_request`.
+
+    :type request: :class:`bravado_core.request.IncomingRequest`
+    :type op: :class:`bravado_core.operation.Operation`
+    :param executor: check :func:`unmarshal_response`
+    :param offload_threshold: check :func:`unmarshal_response`
+    :rtype: :class:`TimedResult`
+    """
+    return await _run(
+        op.swagger_spec,
+        partial(bravado_request.unmarshal_request, request, op),
+        get_body_size(request),
+        executor,
+        offload_threshold,
+    )
+
+
+async def validate_schema_object(
+    swagger_spec,  # type: Spec
+    schema_object_spec,  # type: JSONDict
+    value,  # type: typing.Any
+    payload_size=None,  # type: typing.Optional[int]
+    executor=None,  # type: typing.Optional[Executor]
+    offload_threshold=None,  # type: typing.Optional[int]
+):
+    # type: (...) -> TimedResult
+    """Asynchronous :func:`bravado_core.validate.validate_schema_object`.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :param payload_size: size, in bytes, of the payload value has been decoded from.
+        The validation is offloaded if not provided
+    :param executor: check :func:`unmarshal_response`
+    :param offload_threshold: check :func:`unmarshal_response`
+    :rtype: :class:`TimedResult`
+    :raises ValidationError: when jsonschema validation fails.
+    """
+    return await _run(
+        swagger_spec,
+        partial(bravado_validate.validate_schema_object, swagger_spec, schema_object_spec, value),
+        payload_size,
+        executor,
+        offload_threshold,
+    )
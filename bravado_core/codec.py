@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Codecs used to encode and decode request and response bodies.
+
+By default bravado-core relies on ``simplejson`` to encode JSON bodies and on the
+``json()`` method of the request/response objects to decode them. Configuring
+a codec (``json_codec`` config) bodies are decoded directly from ``raw_bytes``.
+
+msgpack bodies are decoded from ``raw_bytes``, which could be bytes-like objects or
+file-like objects (decoded incrementally).
+"""
+import io
+import json
+import typing
+
+import msgpack
+import simplejson
+
+
+class JsonCodec(
+    typing.NamedTuple(
+        'JsonCodec',
+        [
+            ('name', typing.Text),
+            ('dumps', typing.Callable[[typing.Any], typing.Union[typing.Text, bytes]]),
+            ('loads', typing.Callable[[typing.Union[typing.Text, bytes]], typing.Any]),
+        ],
+    ),
+):
+    """JSON encoder and decoder.
+
+    :param name: name of the codec, for diagnostic purposes
+    :param dumps: function that encodes a python object into a JSON document (str or bytes)
+    :param loads: function that decodes a JSON document (bytes) into a python object.
+        Decoding errors have to be reported via ValueError (or subclasses)
+    """
+
+
+JSON_CODEC = JsonCodec(name='json', dumps=json.dumps, loads=json.loads)
+SIMPLEJSON_CODEC = JsonCodec(name='simplejson', dumps=simplejson.dumps, loads=simplejson.loads)
+
+
+def _orjson_codec():
+    # type: () -> JsonCodec
+    import orjson  # optional dependency, imported only if the codec is used
+    return JsonCodec(name='orjson', dumps=orjson.dumps, loads=orjson.loads)
+
+
+_JSON_CODEC_FACTORIES = {
+    JSON_CODEC.name: lambda: JSON_CODEC,
+    SIMPLEJSON_CODEC.name: lambda: SIMPLEJSON_CODEC,
+    'orjson': _orjson_codec,
+}  # type: typing.Dict[typing.Text, typing.Callable[[], JsonCodec]]
+
+
+def get_json_codec(json_codec):
+    # type: (typing.Union[None, typing.Text, JsonCodec]) -> typing.Optional[JsonCodec]
+    """Resolve the ``json_codec`` config value.
+
+    :param json_codec: None, the name of a known codec (json, simplejson or orjson)
+        or a :class:`JsonCodec` instance
+    :rtype: :class:`JsonCodec` or None
+    :raises ValueError: if the codec name is unknown
+    :raises ImportError: if the library implementing the codec is not installed
+    """
+    if json_codec is None or isinstance(json_codec, JsonCodec):
+        return json_codec
+
+    try:
+        json_codec_factory = _JSON_CODEC_FACTORIES[json_codec]
+    except KeyError:
+        raise ValueError(
+            'Unknown json_codec {0}. Known codecs: {1}'.format(
+                json_codec, ', '.join(sorted(_JSON_CODEC_FACTORIES)),
+            ),
+        )
+    return json_codec_factory()
+
+
+# Attribute of the request/response objects caching the decoded msgpack body
+_DECODED_MSGPACK_BODY_ATTRIBUTE = '_bravado_core_decoded_msgpack_body'
+
+
+# msgpack.Unpacker timestamp parameter to decode Timestamp extension values as datetime objects
+_MSGPACK_TIMESTAMP_AS_DATETIME = 3
+
+# First msgpack version supporting datetime objects (timestamp and datetime parameters)
+_MSGPACK_TIMESTAMPS_MIN_VERSION = (1, 0)
+
+
+def _check_msgpack_timestamps_support():
+    # type: () -> None
+    """Check that the installed msgpack version supports the ``msgpack_timestamps`` config.
+
+    :raises ValueError: if msgpack<1.0 is installed
+    """
+    if tuple(msgpack.version) < _MSGPACK_TIMESTAMPS_MIN_VERSION:
+        raise ValueError(
+            'msgpack_timestamps config requires msgpack>=1.0, installed version is {0}'.format(
+                '.'.join(str(version_part) for version_part in msgpack.version),
+            ),
+        )
+
+
+def _msgpack_unpacker(body, timestamps=False):
+    # type: (typing.Any, bool) -> msgpack.Unpacker
+    if not hasattr(body, 'read'):
+        # bytes objects are not copied by BytesIO
+        body = io.BytesIO(body)
+    if timestamps:
+        return msgpack.Unpacker(body, raw=False, timestamp=_MSGPACK_TIMESTAMP_AS_DATETIME)
+    return msgpack.Unpacker(body, raw=False)
+
+
+def encode_msgpack(value, timestamps=False):
+    # type: (typing.Any, bool) -> bytes
+    """Encode a value as msgpack document.
+
+    :param timestamps: encode datetime objects, which have to be timezone aware, via the
+        msgpack Timestamp extension type (requires msgpack>=1.0)
+    :type timestamps: bool
+    """
+    if timestamps:
+        return msgpack.packb(value, use_bin_type=True, datetime=True)
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def decode_msgpack(body, timestamps=False):
+    # type: (typing.Any, bool) -> typing.Any
+    """Decode a msgpack document.
+
+    :param body: msgpack document as bytes-like object (bytes, bytearray, memoryview)
+        or as file-like object, read incrementally
+    :param timestamps: decode msgpack Timestamp extension values as timezone aware
+        (UTC) datetime objects (requires msgpack>=1.0)
+    :type timestamps: bool
+    :raises ValueError: if body contains more than one msgpack object
+    :raises msgpack.UnpackException: if body is not a valid msgpack document
+    """
+    if not hasattr(body, 'read'):
+        if timestamps:
+            return msgpack.unpackb(body, raw=False, timestamp=_MSGPACK_TIMESTAMP_AS_DATETIME)
+        return msgpack.unpackb(body, raw=False)
+
+    unpacker = _msgpack_unpacker(body, timestamps)
+    value = unpacker.unpack()
+    try:
+        unpacker.skip()
+    except msgpack.OutOfData:
+        return value
+    raise msgpack.ExtraData(value, b'')
+
+
+def decode_msgpack_body(http_message, timestamps=False):
+    # type: (typing.Any, bool) -> typing.Any
+    """Decode the msgpack body (raw_bytes attribute) of a request or response like object.
+
+    The decoded body is cached on the object, so the body is decoded only once
+    even if multiple functions (ie. validation and unmarshaling) need it.
+    The cache is invalidated if raw_bytes is replaced.
+
+    :type http_message: :class:`bravado_core.request.IncomingRequest`,
+        :class:`bravado_core.response.IncomingResponse` or
+        :class:`bravado_core.response.OutgoingResponse`
+    :param timestamps: check :func:`decode_msgpack`
+    """
+    raw_bytes = http_message.raw_bytes
+    cached_decoded_body = getattr(http_message, _DECODED_MSGPACK_BODY_ATTRIBUTE, None)
+    if isinstance(cached_decoded_body, tuple) and cached_decoded_body[0] is raw_bytes:
+        return cached_decoded_body[1]
+
+    decoded_body = decode_msgpack(raw_bytes, timestamps)
+    try:
+        setattr(http_message, _DECODED_MSGPACK_BODY_ATTRIBUTE, (raw_bytes, decoded_body))
+    except AttributeError:  # pragma: no cover  # objects with __slots__
+        pass
+    return decoded_body
@@ -27,6 +27,11 @@ class MatchingResponseNotFound(SwaggerMappingError):
     """
 
 
+class UploadTooLargeError(SwaggerMappingError):
+    """Raised when an uploaded file exceeds the upload_max_size config.
+    """
+
+
 class SwaggerValidationError(SwaggerMappingError):
     """Raised when an error is encountered during validating user defined
     format values in a request or a response.
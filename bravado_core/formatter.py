@@ -6,11 +6,17 @@ https://github.com/swagger-api/swagger-spec/blob/master/versions/2.0.md#dataType
 from __future__ import unicode_literals
 
 import base64
+import datetime
+import decimal
 import functools
+import re
+import threading
 import typing
+import uuid
+import weakref
 
 import dateutil.parser
-import pytz
+import dateutil.tz
 import six
 
 from bravado_core import schema
@@ -35,6 +41,77 @@ def NO_OP(x):  # pragma: no cover
     return x
 
 
+# RFC 3339 full-date and date-time (seconds are required, fractions of second beyond microseconds are ignored)
+_RFC3339_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}\Z', re.ASCII)
+_RFC3339_DATE_TIME_RE = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})\d*)?'
+    r'(?:([Zz])|([+-])(\d{2}):(\d{2}))?\Z',
+    re.ASCII,
+)
+# (key, value) = (UTC offset in seconds, tzinfo). The same tzinfo objects returned by dateutil
+_TZINFOS = {0: dateutil.tz.UTC}  # type: typing.Dict[int, datetime.tzinfo]
+
+
+def _get_tzinfo(offset):
+    # type: (int) -> datetime.tzinfo
+    tzinfo = _TZINFOS.get(offset)
+    if tzinfo is None:
+        tzinfo = _TZINFOS[offset] = dateutil.tz.tzoffset(None, offset)
+    return tzinfo
+
+
+def _parse_date(value):
+    # type: (typing.Text) -> datetime.date
+    """Parse a date, via :meth:`datetime.date.fromisoformat` if value is an RFC 3339 full-date,
+    via dateutil otherwise (ie. non canonical representations)."""
+    if _RFC3339_DATE_RE.match(value):
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            pass  # dateutil raises a more descriptive error
+    return dateutil.parser.parse(value).date()
+
+
+def _parse_date_time(value):
+    # type: (typing.Union[typing.Text, datetime.datetime]) -> datetime.datetime
+    """Parse a date-time. RFC 3339 date-times are parsed directly, the others via dateutil.
+
+    NOTE: :meth:`datetime.datetime.fromisoformat` is not used as it does not accept all
+    the RFC 3339 date-times before Python 3.11 (ie. ``Z`` suffix or 1 digit fractions).
+    """
+    if isinstance(value, datetime.datetime):
+        # datetime values are already decoded by wire formats with a native timestamp type (ie. msgpack)
+        return value
+
+    match = _RFC3339_DATE_TIME_RE.match(value)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction, utc, offset_sign, offset_hour, offset_minute = match.groups()
+        if utc is not None:
+            tzinfo = dateutil.tz.UTC  # type: typing.Optional[datetime.tzinfo]
+        elif offset_sign is not None:
+            offset = int(offset_hour) * 3600 + int(offset_minute) * 60
+            tzinfo = _get_tzinfo(-offset if offset_sign == '-' else offset)
+        else:
+            tzinfo = None
+        try:
+            return datetime.datetime(
+                int(year), int(month), int(day), int(hour), int(minute), int(second),
+                int(fraction.ljust(6, '0')) if fraction else 0,
+                tzinfo,
+            )
+        except ValueError:
+            pass  # dateutil raises a more descriptive error
+    return dateutil.parser.parse(value)
+
+
+def _format_date_time(value):
+    # type: (datetime.datetime) -> typing.Text
+    # Naive datetime objects are considered UTC
+    if value.tzinfo is None:
+        return value.isoformat() + '+00:00'
+    return value.isoformat()
+
+
 def to_wire(
     swagger_spec,  # type: Spec
     primitive_spec,  # type: JSONDict
@@ -86,7 +163,10 @@ def to_python(
         return value
     format_name = schema.get_format(swagger_spec, primitive_spec)
     formatter = swagger_spec.get_format(format_name)
-    return formatter.to_python(value) if formatter else value
+    if not formatter:
+        return value
+    format_cache = get_format_cache(swagger_spec, format_name)
+    return format_cache.to_python(value) if format_cache else formatter.to_python(value)
 
 
 class SwaggerFormat(
@@ -158,7 +238,7 @@ DEFAULT_FORMATS = {
     'date': SwaggerFormat(
         format='date',
         to_wire=lambda d: d.isoformat(),  # type: ignore
-        to_python=lambda d: dateutil.parser.parse(d).date(),  # type: ignore
+        to_python=_parse_date,  # type: ignore
         validate=NO_OP,  # jsonschema validates date
         description='Converts [wire]string:date <=> python datetime.date',
     ),
@@ -172,8 +252,8 @@ DEFAULT_FORMATS = {
     ),
     'date-time': SwaggerFormat(
         format='date-time',
-        to_wire=lambda dt: (dt if dt.tzinfo else pytz.utc.localize(dt)).isoformat(),  # type: ignore
-        to_python=lambda dt: dateutil.parser.parse(dt),  # type: ignore
+        to_wire=_format_date_time,  # type: ignore
+        to_python=_parse_date_time,  # type: ignore
         validate=NO_OP,  # jsonschema validates date-time
         description=(
             'Converts string:date-time <=> python datetime.datetime'
@@ -200,4 +280,141 @@ DEFAULT_FORMATS = {
         validate=NO_OP,  # jsonschema validates integer
         description='Converts [wire]integer:int64 <=> python long',
     ),
-}
+}  # type: typing.Dict[typing.Text, SwaggerFormat]
+
+
+# Types of the conversion results cached by FormatCache. Tuples are cached if all their items have these types
+_IMMUTABLE_RESULT_TYPES = frozenset((
+    type(None), bool, int, float, complex, bytes, six.text_type, decimal.Decimal,
+    datetime.date, datetime.datetime, datetime.time, datetime.timedelta, uuid.UUID,
+))
+
+
+class FormatCacheStats(
+    typing.NamedTuple(
+        'FormatCacheStats',
+        [
+            ('hits', int),
+            ('misses', int),
+            ('size', int),
+            ('max_size', int),
+        ],
+    ),
+):
+    """Statistics of a :class:`FormatCache`.
+
+    :param hits: number of conversions returned by the cache
+    :param misses: number of conversions executed (including the ones with results that can't be cached)
+    :param size: number of cached conversions
+    :param max_size: maximum number of cached conversions
+    """
+
+    @property
+    def hit_rate(self):
+        # type: () -> float
+        """Ratio of the conversions returned by the cache, 0 if there were no conversions."""
+        conversions = self.hits + self.misses
+        return float(self.hits) / conversions if conversions else 0.0
+
+
+class _NotCacheableResult(Exception):
+    # Raised to prevent functools.lru_cache from caching mutable results
+    def __init__(self, result):
+        # type: (typing.Any) -> None
+        super(_NotCacheableResult, self).__init__()
+        self.result = result
+
+
+def _is_immutable_result(result):
+    # type: (typing.Any) -> bool
+    if result.__class__ in _IMMUTABLE_RESULT_TYPES:
+        return True
+    # ie. namedtuples of numbers
+    return isinstance(result, tuple) and all(item.__class__ in _IMMUTABLE_RESULT_TYPES for item in result)
+
+
+class FormatCache(object):
+    """Bounded LRU cache of the conversions of a format to python (check ``cached_formats`` config).
+
+    Only immutable results (strings, numbers, dates, UUIDs, decimals and tuples of them)
+    are cached, so the cached results can be returned multiple times.
+
+    :type swagger_format: :class:`SwaggerFormat`
+    :param max_size: maximum number of cached conversions
+    """
+
+    def __init__(self, swagger_format, max_size):
+        # type: (SwaggerFormat, int) -> None
+        self.swagger_format = swagger_format
+        self.max_size = max_size
+        # Wire values of different types are cached separately (ie. 1 and 1.0)
+        self._cached_to_python = functools.lru_cache(maxsize=max_size, typed=True)(self._to_python)
+
+    def _to_python(self, value):
+        # type: (typing.Any) -> typing.Any
+        result = self.swagger_format.to_python(value)
+        if not _is_immutable_result(result):
+            raise _NotCacheableResult(result)
+        return result
+
+    def to_python(self, value):
+        # type: (typing.Any) -> typing.Any
+        """Convert value via :attr:`SwaggerFormat.to_python`, or return the cached result."""
+        try:
+            return self._cached_to_python(value)
+        except _NotCacheableResult as e:
+            return e.result
+
+    def stats(self):
+        # type: () -> FormatCacheStats
+        cache_info = self._cached_to_python.cache_info()
+        return FormatCacheStats(
+            hits=cache_info.hits,
+            misses=cache_info.misses,
+            size=cache_info.currsize,
+            max_size=self.max_size,
+        )
+
+    def clear(self):
+        # type: () -> None
+        """Remove the cached conversions and reset the statistics."""
+        self._cached_to_python.cache_clear()
+
+
+_format_caches = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[Spec, typing.Dict[typing.Text, FormatCache]]
+_format_caches_lock = threading.Lock()
+
+
+def get_format_cache(swagger_spec, format_name):
+    # type: (Spec, typing.Text) -> typing.Optional[FormatCache]
+    """Cache of the conversions of format_name for swagger_spec, None if the format is not
+    cached (check ``cached_formats`` config) or not registered.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    """
+    max_size = swagger_spec.config['cached_formats'].get(format_name)
+    if not max_size:
+        return None
+    swagger_format = swagger_spec.get_format(format_name)
+    if swagger_format is None:
+        return None
+
+    with _format_caches_lock:
+        spec_format_caches = _format_caches.get(swagger_spec)
+        if spec_format_caches is None:
+            spec_format_caches = _format_caches[swagger_spec] = {}
+        format_cache = spec_format_caches.get(format_name)
+        # The format could have been registered again
+        if format_cache is None or format_cache.swagger_format is not swagger_format:
+            format_cache = spec_format_caches[format_name] = FormatCache(swagger_format, max_size)
+        return format_cache
+
+
+def get_format_caches(swagger_spec):
+    # type: (Spec) -> typing.Dict[typing.Text, FormatCache]
+    """Format caches of swagger_spec by format name, check :func:`get_format_cache`.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    """
+    with _format_caches_lock:
+        return dict(_format_caches.get(swagger_spec, {}))
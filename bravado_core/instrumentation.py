@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Timing of the phases of request and response processing.
+
+Callbacks registered via :meth:`bravado_core.spec.Spec.add_instrumentation_callback` are
+called at the end of every instrumented phase, even if it failed, with the arguments
+``(operation_id, phase, duration, payload_size)``:
+
+- ``operation_id``: id of the operation (check :attr:`bravado_core.operation.Operation.operation_id`)
+- ``phase``: one of the phase names below
+- ``duration``: duration of the phase in seconds
+- ``payload_size``: size, in bytes, of the body of the processed request or response,
+  None if unknown or if there is no body
+
+Phases are nested: ie. the ``decode_body``, ``validate_body`` and ``unmarshal_body``
+phases are reported while a ``unmarshal_response`` phase is running (and before it
+is reported).
+
+If no callbacks are registered the phases are not timed, so instrumentation costs
+nothing more than an attribute lookup per phase.
+"""
+import logging
+import typing
+from timeit import default_timer
+
+import six
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core.operation import Operation
+    from bravado_core.spec import Spec
+
+    InstrumentationCallback = typing.Callable[
+        [typing.Optional[typing.Text], typing.Text, float, typing.Optional[int]],
+        typing.Any,
+    ]
+
+
+log = logging.getLogger(__name__)
+
+# bravado_core.request.unmarshal_request: the whole request
+UNMARSHAL_REQUEST = 'unmarshal_request'
+# bravado_core.response.unmarshal_response: the whole response
+UNMARSHAL_RESPONSE = 'unmarshal_response'
+# bravado_core.response.validate_response: the whole response
+VALIDATE_RESPONSE = 'validate_response'
+# bravado_core.param.marshal_param: every parameter
+MARSHAL_PARAM = 'marshal_param'
+# Decoding of JSON and msgpack request and response bodies
+DECODE_BODY = 'decode_body'
+# Encoding of JSON and msgpack body parameters
+ENCODE_BODY = 'encode_body'
+# Validation of decoded request and response bodies
+VALIDATE_BODY = 'validate_body'
+# Unmarshaling of decoded request and response bodies
+UNMARSHAL_BODY = 'unmarshal_body'
+
+
+def get_body_size(http_message):
+    # type: (typing.Any) -> typing.Optional[int]
+    """Size, in bytes, of the body of a request or response like object. None if unknown."""
+    raw_bytes = getattr(http_message, 'raw_bytes', None)
+    if isinstance(raw_bytes, (bytes, bytearray, memoryview)):
+        return len(raw_bytes)
+
+    headers = getattr(http_message, 'headers', None) or {}
+    content_length = headers.get('Content-Length', headers.get('content-length'))
+    try:
+        return int(content_length) if content_length is not None else None
+    except ValueError:
+        return None
+
+
+def _get_payload_size(payload):
+    # type: (typing.Any) -> typing.Optional[int]
+    if payload is None:
+        return None
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return len(payload)
+    if isinstance(payload, six.text_type):
+        return len(payload.encode('utf-8'))
+    if isinstance(payload, dict):
+        # Outgoing request dictionary, check bravado_core.param.marshal_param
+        return _get_payload_size(payload.get('data'))
+    return get_body_size(payload)
+
+
+def _report(callbacks, op, phase, duration, payload):
+    # type: (typing.Sequence[InstrumentationCallback], typing.Optional[Operation], typing.Text, float, typing.Any) -> None
+    operation_id = getattr(op, 'operation_id', None) if op is not None else None
+    payload_size = _get_payload_size(payload)
+    for callback in callbacks:
+        try:
+            callback(operation_id, phase, duration, payload_size)
+        except Exception:
+            # Instrumentation must not break request processing
+            log.exception('Instrumentation callback %r failed', callback)
+
+
+def run_phase(
+    swagger_spec,  # type: Spec
+    op,  # type: typing.Optional[Operation]
+    phase,  # type: typing.Text
+    func,  # type: typing.Callable[..., typing.Any]
+    args,  # type: typing.Tuple[typing.Any, ...]
+    payload=None,  # type: typing.Any
+):
+    # type: (...) -> typing.Any
+    """Call ``func(*args)`` and report its duration to the instrumentation callbacks of swagger_spec.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :type op: :class:`bravado_core.operation.Operation`
+    :param phase: name of the phase
+    :param payload: request or response like object, outgoing request dictionary or body
+        processed by the phase. Its size is evaluated only if the phase is reported.
+    """
+    # Read via getattr as Spec like objects (ie. mocks in tests) could not have the attribute
+    callbacks = getattr(swagger_spec, 'instrumentation_callbacks', None)
+    if not callbacks:
+        return func(*args)
+
+    start_time = default_timer()
+    try:
+        return func(*args)
+    finally:
+        _report(callbacks, op, phase, default_timer() - start_time, payload)
+
+
+def instrument(
+    swagger_spec,  # type: Spec
+    op,  # type: typing.Optional[Operation]
+    phase,  # type: typing.Text
+    func,  # type: typing.Callable[..., typing.Any]
+    first_arg_is_payload=False,  # type: bool
+):
+    # type: (...) -> typing.Callable[..., typing.Any]
+    """Wrap func so that its calls are reported as phase (check :func:`run_phase`).
+
+    :param first_arg_is_payload: report the size of the first argument of the calls
+        (ie. a request like object) as payload size
+    """
+    def instrumented_func(*args):
+        # type: (typing.Any) -> typing.Any
+        return run_phase(swagger_spec, op, phase, func, args, args[0] if first_arg_is_payload else None)
+
+    return instrumented_func
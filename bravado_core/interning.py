@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Structural sharing of identical values produced by unmarshaling.
+
+If ``intern_values`` config is enabled, :func:`bravado_core.unmarshal.unmarshal_schema_object`
+(and so the unmarshaling of responses) hash-conses the unmarshaled values: identical
+immutable leaves (strings, numbers, dates) and identical small sub-objects are
+represented by the same python object.
+
+Shared values must not be modified, so sub-objects are frozen when they are shared:
+
+- models are made read-only (modifying them raises TypeError),
+- objects unmarshaled as dictionaries are exposed as :class:`types.MappingProxyType`,
+- arrays are exposed as tuples.
+
+Use ``copy.deepcopy`` to get a modifiable copy of a shared value. The top-level value
+returned by unmarshaling is never frozen, only the values nested in it.
+
+Sub-objects are shared only if all their values are shared too and they have at most
+:data:`MAX_INTERNED_ITEMS` items, so big arrays and objects are never frozen.
+
+Values are shared within a single unmarshaling call. If ``intern_cache_size`` config is
+set they are shared across calls as well, via a per Spec LRU cache of at most
+``intern_cache_size`` values.
+"""
+import contextlib
+import contextvars
+import datetime
+import threading
+import types
+import typing
+import weakref
+from collections import OrderedDict
+
+from six import iteritems
+
+from bravado_core.model import _MODEL_DICT_SLOT
+from bravado_core.model import Model
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core.spec import Spec
+
+
+# Sub-objects with more items are not shared
+MAX_INTERNED_ITEMS = 16
+
+# Immutable values shared by their value. NOTE: datetime and time objects are not shared
+# as equal values could have different timezones
+_LEAF_TYPES = frozenset((bool, int, float, bytes, str, datetime.date))
+# Key of the None value (None is a singleton, so it is never stored in the tables)
+_NONE_KEY = (type(None), None)
+
+
+def _leaf_key(value_type, value):
+    # type: (type, typing.Any) -> typing.Hashable
+    if value_type is float and not value:
+        # 0.0 == -0.0
+        return float, repr(value)
+    return value_type, value
+
+
+class InternTable(object):
+    """Table of the shared values.
+
+    :param max_size: maximum number of values stored in the table, least recently used
+        values are evicted first. None means unbounded.
+    """
+
+    def __init__(self, max_size=None):
+        # type: (typing.Optional[int]) -> None
+        self.max_size = max_size
+        # (key, value) = (structural key, shared value)
+        self._values = OrderedDict()  # type: typing.MutableMapping[typing.Hashable, typing.Any]
+        # (key, value) = (id of a shared sub-object, structural key)
+        # Shared sub-objects are kept alive by _values, so their ids are not reused
+        self._keys = {}  # type: typing.Dict[int, typing.Hashable]
+        # Tables shared across calls could be used by multiple threads
+        self._lock = threading.Lock() if max_size is not None else None
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._values)
+
+    def is_shared(self, value):
+        # type: (typing.Any) -> bool
+        """Check if value is a shared (and so frozen) sub-object."""
+        return id(value) in self._keys
+
+    def intern(self, value):
+        # type: (typing.Any) -> typing.Any
+        """Return the shared value identical to value, value itself (frozen if it is a
+        sub-object) if it is the first occurrence, or value unchanged if it can't be shared."""
+        if self._lock is None:
+            return self._intern(value)
+        with self._lock:
+            return self._intern(value)
+
+    def _key(self, value):
+        # type: (typing.Any) -> typing.Optional[typing.Hashable]
+        value_type = value.__class__
+        if value_type in _LEAF_TYPES:
+            return _leaf_key(value_type, value)
+        if value is None:
+            return _NONE_KEY
+        return self._keys.get(id(value))
+
+    def _item_keys(self, items):
+        # type: (typing.Iterable[typing.Tuple[typing.Any, typing.Any]]) -> typing.Optional[typing.Tuple[typing.Hashable, ...]]
+        item_keys = []
+        for name, item in items:
+            item_key = self._key(item)
+            if item_key is None:
+                # Items that could not be shared
+                return None
+            item_keys.append((name, item_key))
+        return tuple(item_keys)
+
+    def _intern(self, value):
+        # type: (typing.Any) -> typing.Any
+        value_type = value.__class__
+        if value_type in _LEAF_TYPES:
+            return self._lookup(_leaf_key(value_type, value), value)
+
+        if value_type is list:
+            if len(value) > MAX_INTERNED_ITEMS:
+                return value
+            item_keys = self._item_keys(enumerate(value))
+            if item_keys is None:
+                return value
+            return self._lookup((tuple, item_keys), tuple(value), is_sub_object=True)
+
+        if value_type is dict:
+            if len(value) > MAX_INTERNED_ITEMS:
+                return value
+            item_keys = self._item_keys(iteritems(value))
+            if item_keys is None:
+                return value
+            return self._lookup((dict, item_keys), types.MappingProxyType(value), is_sub_object=True)
+
+        # Models storing the property values in a dictionary (not SlottedModel and SparseModel)
+        if getattr(value_type, '_Model__dict', None) is _MODEL_DICT_SLOT:
+            property_values = value._Model__dict
+            if len(property_values) > MAX_INTERNED_ITEMS:
+                return value
+            item_keys = self._item_keys(iteritems(property_values))
+            if item_keys is None:
+                return value
+            shared_value = self._lookup((value_type, item_keys), value, is_sub_object=True)
+            if shared_value is value:
+                # Freeze the model
+                object.__setattr__(value, '_Model__dict', types.MappingProxyType(property_values))
+            return shared_value
+
+        return value
+
+    def _lookup(self, key, value, is_sub_object=False):
+        # type: (typing.Hashable, typing.Any, bool) -> typing.Any
+        values = self._values
+        shared_value = values.get(key)
+        if shared_value is not None:
+            if self.max_size is not None:
+                values.move_to_end(key)  # type: ignore  # values is an OrderedDict
+            return shared_value
+
+        values[key] = value
+        if is_sub_object:
+            self._keys[id(value)] = key
+        if self.max_size is not None and len(values) > self.max_size:
+            evicted_key, evicted_value = values.popitem(last=False)  # type: ignore  # values is an OrderedDict
+            self._keys.pop(id(evicted_value), None)
+        return value
+
+
+_current_intern_table = contextvars.ContextVar(
+    'bravado_core_intern_table', default=None,
+)  # type: contextvars.ContextVar[typing.Optional[InternTable]]
+_shared_intern_tables = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[Spec, InternTable]
+_shared_intern_tables_lock = threading.Lock()
+
+
+def get_shared_intern_table(swagger_spec):
+    # type: (Spec) -> InternTable
+    """Table of the values shared across unmarshaling calls (``intern_cache_size`` config)."""
+    with _shared_intern_tables_lock:
+        intern_table = _shared_intern_tables.get(swagger_spec)
+        if intern_table is None:
+            intern_table = InternTable(max_size=swagger_spec.config['intern_cache_size'])
+            _shared_intern_tables[swagger_spec] = intern_table
+        return intern_table
+
+
+@contextlib.contextmanager
+def interning(swagger_spec):
+    # type: (Spec) -> typing.Iterator[InternTable]
+    """Context manager sharing the values unmarshaled, for swagger_spec, in its scope.
+
+    Nested scopes use the table of the outermost scope.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    """
+    intern_table = _current_intern_table.get()
+    if intern_table is not None:
+        yield intern_table
+        return
+
+    if swagger_spec.config['intern_cache_size']:
+        intern_table = get_shared_intern_table(swagger_spec)
+    else:
+        intern_table = InternTable()
+    token = _current_intern_table.set(intern_table)
+    try:
+        yield intern_table
+    finally:
+        _current_intern_table.reset(token)
+
+
+def intern_value(value):
+    # type: (typing.Any) -> typing.Any
+    """Share value via the table of the current :func:`interning` scope, if any."""
+    intern_table = _current_intern_table.get()
+    if intern_table is None:
+        return value
+    return intern_table.intern(value)
+
+
+def thaw(intern_table, value):
+    # type: (InternTable, typing.Any) -> typing.Any
+    """Return a modifiable shallow copy of value if it is a shared sub-object, value otherwise."""
+    if not intern_table.is_shared(value):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, types.MappingProxyType):
+        return dict(value)
+    thawed_model = object.__new__(value.__class__)  # type: Model
+    object.__setattr__(thawed_model, '_Model__dict', dict(value._Model__dict))
+    return thawed_model
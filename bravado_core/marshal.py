@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
+import datetime
 import typing
 import warnings
 from functools import partial
 
+import pytz
 from six import iteritems
 
 from bravado_core import _decorators
 from bravado_core import schema
 from bravado_core.exception import SwaggerMappingError
+from bravado_core.formatter import DEFAULT_FORMATS
 from bravado_core.model import Model
 from bravado_core.model import MODEL_MARKER
 from bravado_core.schema import collapsed_properties
@@ -16,6 +19,7 @@ from bravado_core.schema import get_type_from_schema
 from bravado_core.schema import is_dict_like
 from bravado_core.schema import is_list_like
 from bravado_core.schema import SWAGGER_PRIMITIVES
+from bravado_core.schema_profiler import profile_method
 from bravado_core.util import memoize_by_id
 
 
@@ -28,14 +32,15 @@ if getattr(typing, 'TYPE_CHECKING', False):
 
 
 _NOT_FOUND = object()
+DATE_TIME_FORMAT = DEFAULT_FORMATS['date-time']
 _handle_null_value = partial(
     _decorators.handle_null_value,
     is_marshaling_operation=True,
 )
 
 
-def marshal_schema_object(swagger_spec, schema_object_spec, value):
-    # type: (Spec, JSONDict, typing.Any) -> typing.Any
+def marshal_schema_object(swagger_spec, schema_object_spec, value, native_datetimes=False):
+    # type: (Spec, JSONDict, typing.Any, bool) -> typing.Any
     """Marshal the value using the given schema object specification.
 
     Marshaling includes:
@@ -45,12 +50,20 @@ def marshal_schema_object(swagger_spec, schema_object_spec, value):
     :type swagger_spec: :class:`bravado_core.spec.Spec`
     :type schema_object_spec: dict
     :type value: int, long, string, unicode, boolean, list, dict, Model type
+    :param native_datetimes: keep date-time values as (timezone aware) datetime objects
+        instead of converting them to strings. Useful for wire formats with a native
+        timestamp type (ie. msgpack, check msgpack_timestamps config)
+    :type native_datetimes: bool
 
     :return: marshaled value
     :rtype: int, long, string, unicode, boolean, list, dict
     :raises: SwaggerMappingError
     """
-    marshaling_method = _get_marshaling_method(swagger_spec=swagger_spec, object_schema=schema_object_spec)
+    marshaling_method = _get_marshaling_method(
+        swagger_spec=swagger_spec,
+        object_schema=schema_object_spec,
+        native_datetimes=native_datetimes,
+    )
     return marshaling_method(value)
 
 
@@ -152,8 +165,8 @@ def marshal_model(swagger_spec, model_spec, model_value):
 
 @_decorators.wrap_recursive_call_exception
 @memoize_by_id
-def _get_marshaling_method(swagger_spec, object_schema, required=False):
-    # type: (Spec, JSONDict, bool) -> MarshalingMethod
+def _get_marshaling_method(swagger_spec, object_schema, required=False, native_datetimes=False):
+    # type: (Spec, JSONDict, bool, bool) -> MarshalingMethod
     """
     Determine the method needed to marshal values of a defined object_schema
     The returned method will accept a single positional parameter that represent the value
@@ -161,7 +174,16 @@ def _get_marshaling_method(swagger_spec, object_schema, required=False):
 
     :type swagger_spec: :class:`bravado_core.spec.Spec`
     :type object_schema: dict
+    :param native_datetimes: check :func:`marshal_schema_object`
     """
+    marshaling_method = _get_marshaling_method_for_schema(swagger_spec, object_schema, required, native_datetimes)
+    if swagger_spec.config['schema_profiling']:
+        return profile_method(swagger_spec, object_schema, marshaling_method)
+    return marshaling_method
+
+
+def _get_marshaling_method_for_schema(swagger_spec, object_schema, required, native_datetimes):
+    # type: (Spec, JSONDict, bool, bool) -> MarshalingMethod
     object_schema = swagger_spec.deref(object_schema)
     null_decorator = _handle_null_value(
         swagger_spec=swagger_spec,
@@ -171,13 +193,13 @@ def _get_marshaling_method(swagger_spec, object_schema, required=False):
     object_type = get_type_from_schema(swagger_spec, object_schema)
 
     if object_type == 'array':
-        return null_decorator(_marshaling_method_array(swagger_spec, object_schema))
+        return null_decorator(_marshaling_method_array(swagger_spec, object_schema, native_datetimes))
     elif object_type == 'file':
         return null_decorator(_marshaling_method_file(swagger_spec, object_schema))
     elif object_type == 'object':
-        return null_decorator(_marshaling_method_object(swagger_spec, object_schema))
+        return null_decorator(_marshaling_method_object(swagger_spec, object_schema, native_datetimes))
     elif object_type in SWAGGER_PRIMITIVES:
-        return null_decorator(_marshaling_method_primitive_type(swagger_spec, object_schema))
+        return null_decorator(_marshaling_method_primitive_type(swagger_spec, object_schema, native_datetimes))
     elif object_type is None:
         return _no_op_marshaling
     else:
@@ -225,8 +247,8 @@ def _marshal_array(marshal_array_item_function, value):
     ]
 
 
-def _marshaling_method_array(swagger_spec, object_schema):
-    # type: (Spec, JSONDict) -> MarshalingMethod
+def _marshaling_method_array(swagger_spec, object_schema, native_datetimes=False):
+    # type: (Spec, JSONDict, bool) -> MarshalingMethod
     """
     Determine the marshaling method needed for a schema of a type array.
 
@@ -241,7 +263,7 @@ def _marshaling_method_array(swagger_spec, object_schema):
 
     return partial(
         _marshal_array,
-        _get_marshaling_method(swagger_spec=swagger_spec, object_schema=item_schema),
+        _get_marshaling_method(swagger_spec=swagger_spec, object_schema=item_schema, native_datetimes=native_datetimes),
     )
 
 
@@ -259,6 +281,7 @@ def _marshal_object(
     possible_discriminated_type_name_to_model,  # type: typing.Dict[typing.Text, Model]
     required_properties,  # type: typing.Set[typing.Text]
     nullable_properties,  # type: typing.Set[typing.Text]
+    native_datetimes,  # type: bool
     model_value,  # type: typing.Any
 ):
     # type: (...) -> typing.Any
@@ -272,6 +295,7 @@ def _marshal_object(
     :param possible_discriminated_type_name_to_model: Mapping of the possible dereferenced Model names and Model instances.
     :param required_properties: Set of required properties of the object schema
     :param nullable_properties: Set of nullable properties of the object schema
+    :param native_datetimes: Keep date-time values as datetime objects
     :param model_value: Python dictionary or Model to marshal as JSON Object
 
     :raises: SwaggerMappingError
@@ -287,7 +311,11 @@ def _marshal_object(
         discriminator_value = model_value[discriminator_property]
         discriminated_model = possible_discriminated_type_name_to_model.get(discriminator_value)
         if discriminated_model is not None:
-            marshaling_function = _get_marshaling_method(swagger_spec=swagger_spec, object_schema=discriminated_model._model_spec)
+            marshaling_function = _get_marshaling_method(
+                swagger_spec=swagger_spec,
+                object_schema=discriminated_model._model_spec,
+                native_datetimes=native_datetimes,
+            )
             return marshaling_function(model_value)
 
     marshaled_value = dict()
@@ -309,8 +337,8 @@ def _marshal_object(
     return marshaled_value
 
 
-def _marshaling_method_object(swagger_spec, object_schema):
-    # type: (Spec, JSONDict) -> MarshalingMethod
+def _marshaling_method_object(swagger_spec, object_schema, native_datetimes=False):
+    # type: (Spec, JSONDict, bool) -> MarshalingMethod
     """
     Determine the marshaling method needed for a schema of a type object.
 
@@ -342,6 +370,7 @@ def _marshaling_method_object(swagger_spec, object_schema):
             swagger_spec=swagger_spec,
             object_schema=prop_schema,
             required=prop_name in required_properties,
+            native_datetimes=native_datetimes,
         )
         for prop_name, prop_schema in iteritems(properties)
     }
@@ -353,6 +382,7 @@ def _marshaling_method_object(swagger_spec, object_schema):
             additional_properties_marshaling_function = _get_marshaling_method(
                 swagger_spec=swagger_spec,
                 object_schema=additional_properties_schema,
+                native_datetimes=native_datetimes,
             )
 
     discriminator_property = object_schema.get('discriminator')
@@ -379,6 +409,7 @@ def _marshaling_method_object(swagger_spec, object_schema):
         possible_discriminated_type_name_to_model,
         required_properties,
         nullable_properties,
+        native_datetimes,
     )
 
 
@@ -402,8 +433,16 @@ def _marshal_primitive_type(primitive_type, swagger_format, value):
         )
 
 
-def _marshaling_method_primitive_type(swagger_spec, object_schema):
-    # type: (Spec, JSONDict) -> MarshalingMethod
+def _marshal_native_datetime(value):
+    # type: (typing.Any) -> typing.Any
+    if not isinstance(value, datetime.datetime):
+        # Let the default formatter deal with unexpected values (ie. raising SwaggerMappingError)
+        return _marshal_primitive_type('string', DATE_TIME_FORMAT, value)
+    return value if value.tzinfo else pytz.utc.localize(value)
+
+
+def _marshaling_method_primitive_type(swagger_spec, object_schema, native_datetimes=False):
+    # type: (Spec, JSONDict, bool) -> MarshalingMethod
     """
     Determine the marshaling method needed for a schema of a primitive type.
 
@@ -412,10 +451,13 @@ def _marshaling_method_primitive_type(swagger_spec, object_schema):
 
     :param swagger_spec: Spec object
     :param object_schema: Schema of the primitive type
+    :param native_datetimes: Keep date-time values as datetime objects, if handled by the default formatter
     """
     format_name = schema.get_format(swagger_spec, object_schema)
     swagger_format = swagger_spec.get_format(format_name) if format_name is not None else None
     primitive_type = get_type_from_schema(swagger_spec, object_schema)
+    if native_datetimes and swagger_format is DATE_TIME_FORMAT:
+        return _marshal_native_datetime
     if swagger_format is not None and primitive_type is not None:
         return partial(
             _marshal_primitive_type,
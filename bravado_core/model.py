@@ -1,15 +1,22 @@
 # -*- coding: utf-8 -*-
 import abc
 import functools
+import itertools
 import logging
+import pickle
 import re
+import types
 import typing
+import weakref
 from copy import deepcopy
 from warnings import warn
 
 from six import add_metaclass
+from six import binary_type
+from six import integer_types
 from six import iteritems
 from six import string_types
+from six import text_type
 from swagger_spec_validator.ref_validators import attach_scope
 
 from bravado_core.schema import collapsed_properties
@@ -18,9 +25,10 @@ from bravado_core.schema import is_list_like
 from bravado_core.schema import is_ref
 from bravado_core.schema import SWAGGER_PRIMITIVES
 from bravado_core.util import determine_object_type
+from bravado_core.util import fingerprint
+from bravado_core.util import is_same_content
 from bravado_core.util import lazy_class_attribute
 from bravado_core.util import ObjectType
-from bravado_core.util import strip_xscope
 
 if getattr(typing, 'TYPE_CHECKING', False):
     from bravado_core._compat_typing import JSONDict
@@ -33,6 +41,20 @@ log = logging.getLogger(__name__)
 # differentiated from 'object' types.
 MODEL_MARKER = 'x-model'
 
+# Immutable values that are returned by deepcopy as they are
+_IMMUTABLE_TYPES = frozenset((type(None), bool, float, binary_type, text_type) + integer_types)
+# Property values that are never converted by Model._as_dict (dicts are not inspected for models)
+_AS_DICT_NOT_CONVERTED_TYPES = _IMMUTABLE_TYPES | {dict}
+# Marker of the property values not set
+_NOT_SET = object()
+
+# Model types whose instances can be pickled, check register_model_types
+_ModelKey = typing.Tuple[typing.Text, typing.Text]  # (spec fingerprint, model name)
+# (key, value) = (model key, model type)
+_registered_model_types = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary[_ModelKey, typing.Type[Model]]
+# (key, value) = (model type, model key)
+_registered_model_keys = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[typing.Type[Model], _ModelKey]
+
 
 def _get_model_name(model_dict):
     """Determine model name from model dictionary representation and Swagger Path"""
@@ -206,15 +228,19 @@ def _collect_models(container, json_reference, models, swagger_spec):
                 swagger_spec=swagger_spec,
                 model_name=model_name,
                 model_spec=model_spec,
+                bases=_get_model_bases(swagger_spec),
                 json_reference=re.sub('/{MODEL_MARKER}$'.format(MODEL_MARKER=MODEL_MARKER), '', json_reference),
             )
         elif (
-            # the condition with strip_xscope is the most selective check
-            # but it implies memory allocation, so additional lightweight checks
-            # are added to avoid strip_xscope check
+            # the fingerprint comparison is the most selective check (x-scope metadata are ignored)
+            # but it requires to traverse model_spec, so additional lightweight checks
+            # are added to avoid evaluating model_spec fingerprint.
+            # Matching fingerprints are confirmed by a deep comparison.
             id(model_type._model_spec) != id(model_spec) and
-            model_type._model_spec != model_spec and
-            strip_xscope(model_type._model_spec) != strip_xscope(model_spec)
+            model_type._model_spec != model_spec and (
+                model_type._model_spec_fingerprint != fingerprint(model_spec) or
+                not is_same_content(model_type._model_spec, model_spec)
+            )
         ):
             return _raise_or_warn_duplicated_model(
                 swagger_spec=swagger_spec,
@@ -232,43 +258,33 @@ def _collect_models(container, json_reference, models, swagger_spec):
 
 
 class ModelMeta(abc.ABCMeta):
+    """Metaclass of the model types.
+
+    Model types generated by different Spec objects for the same model (same json reference
+    and origin url) are considered the same type by isinstance/issubclass checks, and models
+    are considered subclasses of the models they inherit from (via allOf).
+
+    Those checks are set membership tests on the precomputed :attr:`Model._ancestor_references`
+    and they don't go through the ABC machinery, so ``_abc_cache`` does not grow with the
+    number of model types checked.
+    """
+
     def __instancecheck__(cls, instance):
         return cls.__subclasscheck__(instance.__class__)
 
     def __subclasscheck__(cls, subclass):
-        def _is_same_model(m1, m2):
-            """
-            Checks whether the two models are representing the same Model.
-            This method is needed to ensure that two different model type instances,
-            generated by the same swagger specs are considered equal.
-            """
-            try:
-                return m1._json_reference == m2._json_reference and m1._swagger_spec.origin_url == m2._swagger_spec.origin_url
-            except AttributeError:
-                return False
+        # NOTE: `isinstance(subclass, type)` short circuits the check in case of `subclass is None`,
+        # this happens while the Python interpreter loads typing annotations
+        if isinstance(subclass, type) and cls in subclass.__mro__:
+            return True
 
-        is_subclass = super(ModelMeta, cls).__subclasscheck__(subclass)
-        # NOTE: `and subclass` is added in order to short circuit issubclass check in case of
-        # `subclass is None`, this happens while the Python interpreter loads typing annotations
-        if not is_subclass and subclass:
-            try:
-                # Check whether cls is part any subclass._inherits_from
-                is_subclass = _is_same_model(cls, subclass) or any(
-                    _is_same_model(cls, value)
-                    for key, value in iteritems(subclass._swagger_spec.definitions)
-                    if key in subclass._inherits_from
-                )
-                if is_subclass:
-                    # The super method added subclass into _abc_negative_cache for faster lookup
-                    # As we determined that subclass is a valid subclass of cls we need to ensure
-                    # that the subclass is part of the already seen subclasses of cls
-                    cls._abc_negative_cache.remove(subclass)
-                    cls._abc_cache.add(subclass)
-            except AttributeError:
-                # Attribute error is possible if the passed subclass is not a `bravado_core.model.Model` class or subclass
-                pass
+        ancestor_references = getattr(subclass, '_ancestor_references', None)
+        if ancestor_references is not None:
+            # subclass is a model type
+            return getattr(cls, '_model_reference', None) in ancestor_references
 
-        return is_subclass
+        # Not model types (ie. dict) or virtual subclasses registered via ABCMeta.register
+        return super(ModelMeta, cls).__subclasscheck__(subclass)
 
 
 @add_metaclass(ModelMeta)
@@ -325,6 +341,12 @@ class Model(object):
         List of the models from which the current model inherits from.
         The list will be non-empty only for schemas with allOf
 
+    .. attribute:: _ancestor_references
+
+        Class attribute, computed once per class. Frozenset of the references
+        (origin url of the spec, json reference) of the model and of all the
+        models it inherits from. Used by isinstance/issubclass checks.
+
     """
 
     # Implementation details:
@@ -387,6 +409,39 @@ class Model(object):
     def _properties(self):
         return collapsed_properties(self._model_spec, self._swagger_spec)
 
+    @lazy_class_attribute
+    def _model_spec_fingerprint(self):
+        return fingerprint(self._model_spec)
+
+    @lazy_class_attribute
+    def _model_reference(self):
+        """Identity of the model across Spec objects: (origin url of the spec, json reference)."""
+        if self._swagger_spec is None:
+            # Model base classes are not models. NOTE: the attribute must not be cached on them
+            # otherwise it would shadow the lazy attribute of the generated model types
+            raise AttributeError('{0} is not a model type'.format(self.__name__))
+        return self._swagger_spec.origin_url, self._json_reference
+
+    @lazy_class_attribute
+    def _ancestor_references(self):
+        """References (check :attr:`_model_reference`) of the model and of all the models it
+        inherits from, directly or indirectly."""
+        ancestor_references = set()
+        model_types = [self]
+        while model_types:
+            model_type = model_types.pop()
+            model_reference = model_type._model_reference
+            if model_reference in ancestor_references:
+                continue
+            ancestor_references.add(model_reference)
+            definitions = model_type._swagger_spec.definitions
+            model_types.extend(
+                definitions[model_name]
+                for model_name in model_type._inherits_from
+                if model_name in definitions
+            )
+        return frozenset(ancestor_references)
+
     @lazy_class_attribute
     def _inherits_from(self):
         inherits_from_generator = (
@@ -400,6 +455,17 @@ class Model(object):
             if inherits_from is not None
         ]
 
+    @lazy_class_attribute
+    def _model_free_properties(self):
+        """Names of the properties whose schema does not allow models (primitive values
+        or arrays of primitive values), so :meth:`_as_dict` does not look for models in them."""
+        deref = self._swagger_spec.deref
+        return frozenset(
+            property_name
+            for property_name, property_spec in iteritems(self._properties)
+            if _is_model_free_schema(deref, property_spec)
+        )
+
     def __contains__(self, obj):
         """Has a property set (including additional)."""
         return obj in self.__dict
@@ -451,7 +517,11 @@ class Model(object):
 
         :type property_name: str
         """
-        self.__dict[property_name] = val
+        try:
+            self.__dict[property_name] = val
+        except TypeError:
+            _raise_if_frozen(self)
+            raise
 
     def __delitem__(self, property_name):
         """Unset a property by name.
@@ -461,10 +531,14 @@ class Model(object):
 
         :type property_name: str
         """
-        if property_name in self._properties:
-            self.__dict[property_name] = None
-        else:
-            del self.__dict[property_name]
+        try:
+            if property_name in self._properties:
+                self.__dict[property_name] = None
+            else:
+                del self.__dict[property_name]
+        except TypeError:
+            _raise_if_frozen(self)
+            raise
 
     def __eq__(self, other):
         """Check for equality with another instance.
@@ -475,11 +549,7 @@ class Model(object):
         if not isinstance(other, self.__class__):
             return False
 
-        # Ignore any '_raw' keys
-        def norm_dict(d):
-            return dict((k, d[k]) for k in d if k != '_raw')
-
-        return norm_dict(self.__dict) == norm_dict(other.__dict)
+        return _are_property_values_equal(self.__dict, other.__dict)
 
     def __dir__(self):
         """Return only property names (including additional)."""
@@ -495,10 +565,66 @@ class Model(object):
         return "{0}({1})".format(self.__class__.__name__, ', '.join(s))
 
     def __deepcopy__(self, memo=None):
-        """Deep copy all properties, but not metadata like the Swagger or Model spec attributes."""
+        """Deep copy all properties, but not metadata like the Swagger or Model spec attributes.
+
+        The property values are copied as they are, the model is not initialized again.
+        """
         if memo is None:  # pragma: no cover  # This should never happening, but better safe than sorry
             memo = {}
-        return self.__class__(**deepcopy(self.__dict, memo=memo))
+        model = object.__new__(self.__class__)
+        # Register the copy before copying the property values, so cyclic references are preserved
+        memo[id(self)] = model
+        object.__setattr__(
+            model,
+            '_Model__dict',
+            {
+                attr_name: attr_val if attr_val.__class__ in _IMMUTABLE_TYPES else deepcopy(attr_val, memo)
+                for attr_name, attr_val in iteritems(self.__dict)
+            },
+        )
+        return model
+
+    def __copy__(self):
+        """Shallow copy: the copy refers to the same property values, the model is not initialized again."""
+        model = object.__new__(self.__class__)
+        model.__setstate__(self.__getstate__())
+        return model
+
+    def __getstate__(self):
+        """Property values by name (including additional), as a new dictionary."""
+        return dict(self.__dict)
+
+    def __setstate__(self, state):
+        """Restore the property values returned by :meth:`__getstate__`.
+
+        :type state: dict
+        """
+        if state.__class__ is tuple:
+            # Shared model pickled by __reduce__, check bravado_core.interning
+            object.__setattr__(self, '_Model__dict', types.MappingProxyType(state[0]))
+        else:
+            object.__setattr__(self, '_Model__dict', state)
+
+    def __reduce__(self):
+        """Pickle the property values only.
+
+        The model type is identified by the fingerprint of its Swagger spec and by its name
+        (check :func:`register_model_types`), so instances are unpickled without unmarshaling
+        them again, as long as a Spec with the same content has been built by the unpickling process.
+        """
+        model_key = _registered_model_keys.get(self.__class__)
+        if model_key is None:
+            raise pickle.PicklingError(
+                "Can't pickle {0} instance: the model type has not been created by Spec.build".format(
+                    self.__class__.__name__,
+                ),
+            )
+        state = self.__getstate__()
+        if getattr(self.__class__, '_Model__dict', None) is _MODEL_DICT_SLOT and \
+                isinstance(self.__dict, types.MappingProxyType):
+            # Shared models stay frozen once unpickled
+            return _create_unpickled_model, (model_key,), (state, True)
+        return _create_unpickled_model, (model_key,), state
 
     @property
     def _additional_props(self):
@@ -515,31 +641,18 @@ class Model(object):
 
         :rtype: dict
         """
+        if recursive:
+            return _model_as_dict(self, additional_properties)
 
-        dct = dict()
-        for attr_name, attr_val in iteritems(self.__dict):
-            if attr_name not in self._properties and not additional_properties:
-                continue
-
-            if recursive:
-                is_list = is_list_like(attr_val)
-
-                attribute = attr_val if is_list else [attr_val]
-
-                new_attr_val = []
-                for attr in attribute:
-                    if isinstance(attr, Model):
-                        attr = attr._as_dict(
-                            additional_properties=additional_properties,
-                            recursive=recursive,
-                        )
-                    new_attr_val.append(attr)
+        if additional_properties:
+            return dict(self.__dict)
 
-                attr_val = new_attr_val if is_list else new_attr_val[0]
-
-            dct[attr_name] = attr_val
-
-        return dct
+        properties = self._properties
+        return {
+            attr_name: attr_val
+            for attr_name, attr_val in iteritems(self.__dict)
+            if attr_name in properties
+        }
 
     # provide the same interface as a namedtuple
     _asdict = _as_dict
@@ -611,6 +724,584 @@ class Model(object):
         return isinstance(obj, cls)
 
 
+def _raise_if_frozen(model):
+    # type: (Model) -> None
+    if isinstance(model._Model__dict, types.MappingProxyType):
+        raise TypeError(
+            '{0} instance is shared by other values (intern_values config) and it can not be modified. '
+            'Use copy.deepcopy to get a modifiable copy.'.format(model.__class__.__name__),
+        )
+
+
+def _is_model_free_schema(deref, schema):
+    # type: (typing.Callable[[typing.Any], typing.Any], typing.Any) -> bool
+    schema = deref(schema)
+    if not is_dict_like(schema):
+        return False
+    if schema.get('type') == 'array':
+        schema = deref(schema.get('items'))
+        if not is_dict_like(schema):
+            return False
+    return schema.get('type') in SWAGGER_PRIMITIVES and 'allOf' not in schema
+
+
+def _are_property_values_equal(dct, other_dct):
+    # type: (typing.Dict[typing.Text, typing.Any], typing.Dict[typing.Text, typing.Any]) -> bool
+    """Compare the property values of two models ignoring the '_raw' property, without copying them."""
+    if '_raw' not in dct and '_raw' not in other_dct:
+        return dct == other_dct
+
+    if len(dct) - ('_raw' in dct) != len(other_dct) - ('_raw' in other_dct):
+        return False
+    for attr_name, attr_val in iteritems(dct):
+        if attr_name == '_raw':
+            continue
+        other_attr_val = other_dct.get(attr_name, _NOT_SET)
+        if other_attr_val is _NOT_SET or not (attr_val is other_attr_val or attr_val == other_attr_val):
+            return False
+    return True
+
+
+def _model_as_dict(model, additional_properties):
+    # type: (Model, bool) -> typing.Dict[typing.Text, typing.Any]
+    """Iterative implementation of ``Model._as_dict(recursive=True)``.
+
+    Models found in the property values, or in the items of list-like property values,
+    are converted as well. The dictionaries are created when the models are found and
+    filled when the models are popped from the stack.
+    """
+    dct = {}  # type: typing.Dict[typing.Text, typing.Any]
+    stack = [(model, dct)]
+    while stack:
+        model, model_dct = stack.pop()
+        properties = model._properties
+        model_free_properties = model._model_free_properties
+        for attr_name, attr_val in iteritems(model._Model__dict):
+            if not additional_properties and attr_name not in properties:
+                continue
+
+            if attr_val.__class__ in _AS_DICT_NOT_CONVERTED_TYPES:
+                pass
+            elif is_list_like(attr_val):
+                if attr_name in model_free_properties:
+                    attr_val = list(attr_val)
+                else:
+                    items = []
+                    for item in attr_val:
+                        if item.__class__ not in _AS_DICT_NOT_CONVERTED_TYPES and isinstance(item, Model):
+                            item = _convert_model(item, additional_properties, stack)
+                        items.append(item)
+                    attr_val = items
+            elif isinstance(attr_val, Model):
+                attr_val = _convert_model(attr_val, additional_properties, stack)
+
+            model_dct[attr_name] = attr_val
+
+    return dct
+
+
+def _convert_model(model, additional_properties, stack):
+    # type: (typing.Any, bool, typing.List[typing.Tuple[typing.Any, typing.Dict[typing.Text, typing.Any]]]) -> typing.Any
+    if not isinstance(model.__class__, ModelMeta):
+        # Virtual subclass registered via Model.register
+        return model._as_dict(additional_properties=additional_properties, recursive=True)
+    dct = {}  # type: typing.Dict[typing.Text, typing.Any]
+    stack.append((model, dct))
+    return dct
+
+
+# Slot of Model storing the property values. SlottedModel uses it for non slotted properties only
+_MODEL_DICT_SLOT = Model.__dict__['_Model__dict']
+
+
+def register_model_types(swagger_spec):
+    # type: (Spec) -> None
+    """Register the model types of swagger_spec, so that their instances can be pickled.
+
+    Model types are identified by the fingerprint of the Swagger spec and by the model name,
+    so model instances can be unpickled by any process that has built a Spec with the same
+    content. If multiple Spec instances have the same content, the last registered one is used.
+
+    NOTE: this is called by :meth:`bravado_core.spec.Spec.build` and when a Spec is unpickled.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    """
+    spec_fingerprint = swagger_spec.fingerprint
+    for model_name, model_type in iteritems(swagger_spec.definitions):
+        model_key = (spec_fingerprint, model_name)
+        _registered_model_types[model_key] = model_type
+        _registered_model_keys[model_type] = model_key
+
+
+def _create_unpickled_model(model_key):
+    # type: (_ModelKey) -> Model
+    """Create an empty instance of a registered model type, filled by pickle via __setstate__."""
+    model_type = _registered_model_types.get(model_key)
+    if model_type is None:
+        raise pickle.UnpicklingError(
+            "Can't unpickle {1} instance: no Spec with fingerprint {0} has been built. "
+            'Build the Spec before unpickling its models.'.format(*model_key),
+        )
+    return object.__new__(model_type)
+
+
+class SlottedModel(Model):
+    """Base class for Swagger models with a slot for each property.
+
+    Model types are created with this base class if ``slotted_models`` config is enabled.
+
+    Properties defined in the model spec (check :attr:`_properties`) are stored in
+    per-class slots, so instances don't carry a dictionary and reading a property as
+    attribute is a plain slot read. Additional properties, and properties whose name
+    can't be a slot (ie. not identifiers, starting with an underscore or conflicting with
+    the attributes of this class), are stored in an overflow dictionary, created only
+    if needed.
+
+    The public interface is the same of :class:`.Model`.
+
+    .. attribute:: _property_slots
+
+        Class attribute mapping the slotted property names, in :attr:`_properties`
+        order, to their slot descriptors.
+    """
+
+    # Implementation details:
+    #
+    # The overflow dictionary is stored in the _Model__dict slot, None if there are
+    # no overflow properties. _Model__dict is shadowed by a property returning all the
+    # property values as dictionary, so the methods of Model reading the property values
+    # (__eq__, __repr__, _as_dict, etc.) are working unmodified.
+
+    __slots__ = ()
+
+    _property_slots = {}  # type: typing.Dict[typing.Text, types.MemberDescriptorType]
+
+    def __init__(self, **kwargs):
+        """Initialize from property values in keyword arguments.
+
+        :param \\**kwargs: Property values by name.
+        """
+        self.__init_from_dict(kwargs)
+
+    def __init_from_dict(self, dct, include_missing_properties=None):
+        if include_missing_properties is None:
+            include_missing_properties = self._swagger_spec.config['include_missing_properties']
+
+        properties = self._properties
+        additional = set(dct).difference(properties)
+        if additional and self._model_spec.get('additionalProperties') is False:
+            raise AttributeError(
+                "Model {0} does not have attributes for: {1}".format(
+                    type(self), list(additional),
+                ),
+            )
+
+        property_slots = self._property_slots
+        overflow = None  # type: typing.Optional[typing.Dict[typing.Text, typing.Any]]
+        for attr_name in properties:
+            if include_missing_properties or attr_name in dct:
+                property_slot = property_slots.get(attr_name)
+                if property_slot is not None:
+                    property_slot.__set__(self, dct.get(attr_name))
+                else:
+                    if overflow is None:
+                        overflow = {}
+                    overflow[attr_name] = dct.get(attr_name)
+
+        if additional:
+            if overflow is None:
+                overflow = {}
+            for attr_name in additional:
+                overflow[attr_name] = dct[attr_name]
+
+        _MODEL_DICT_SLOT.__set__(self, overflow)
+
+    @property
+    def _Model__dict(self):
+        """Property values by name (including additional), in :meth:`__iter__` order."""
+        property_slots = self._property_slots
+        overflow = _MODEL_DICT_SLOT.__get__(self, None)
+        dct = {}
+        for attr_name in self._properties:
+            if attr_name in property_slots:
+                value = getattr(self, attr_name, _NOT_SET)
+                if value is not _NOT_SET:
+                    dct[attr_name] = value
+            elif overflow and attr_name in overflow:
+                dct[attr_name] = overflow[attr_name]
+        if overflow:
+            # properties already set keep their position
+            dct.update(overflow)
+        return dct
+
+    def __eq__(self, other):
+        """Check for equality with another instance.
+
+        Two model instances are equal if they have the same type and the same
+        properties and values (including additional properties).
+        """
+        if other.__class__ is not self.__class__:
+            return super(SlottedModel, self).__eq__(other)
+
+        for attr_name in self._property_slots:
+            attr_val = getattr(self, attr_name, _NOT_SET)
+            other_attr_val = getattr(other, attr_name, _NOT_SET)
+            if not (attr_val is other_attr_val or attr_val == other_attr_val):
+                return False
+        return _are_property_values_equal(
+            _MODEL_DICT_SLOT.__get__(self, None) or {},
+            _MODEL_DICT_SLOT.__get__(other, None) or {},
+        )
+
+    def __deepcopy__(self, memo=None):
+        """Deep copy all properties, but not metadata like the Swagger or Model spec attributes.
+
+        The property values are copied as they are, the model is not initialized again.
+        """
+        if memo is None:  # pragma: no cover  # This should never happening, but better safe than sorry
+            memo = {}
+        model = object.__new__(self.__class__)
+        memo[id(self)] = model
+        for attr_name, property_slot in iteritems(self._property_slots):
+            attr_val = getattr(self, attr_name, _NOT_SET)
+            if attr_val is not _NOT_SET:
+                property_slot.__set__(
+                    model,
+                    attr_val if attr_val.__class__ in _IMMUTABLE_TYPES else deepcopy(attr_val, memo),
+                )
+        overflow = _MODEL_DICT_SLOT.__get__(self, None)
+        _MODEL_DICT_SLOT.__set__(model, None if overflow is None else deepcopy(overflow, memo))
+        return model
+
+    def __getstate__(self):
+        """Property values by name (including additional), as a new dictionary."""
+        return self._Model__dict
+
+    def __setstate__(self, state):
+        """Restore the property values returned by :meth:`__getstate__`.
+
+        :type state: dict
+        """
+        property_slots = self._property_slots
+        overflow = None  # type: typing.Optional[typing.Dict[typing.Text, typing.Any]]
+        for attr_name, attr_val in iteritems(state):
+            property_slot = property_slots.get(attr_name)
+            if property_slot is not None:
+                property_slot.__set__(self, attr_val)
+            else:
+                if overflow is None:
+                    overflow = {}
+                overflow[attr_name] = attr_val
+        _MODEL_DICT_SLOT.__set__(self, overflow)
+
+    def __getattr__(self, attr_name):
+        """Only search through not slotted properties if attribute not found normally.
+
+        :type attr_name: str
+        """
+        if attr_name in self._property_slots:
+            # The property slot is not set
+            raise AttributeError(
+                'type object {0!r} has no attribute {1!r}'.format(
+                    type(self).__name__, attr_name,
+                ),
+            )
+        return super(SlottedModel, self).__getattr__(attr_name)
+
+    def __contains__(self, obj):
+        """Has a property set (including additional)."""
+        if obj in self._property_slots:
+            return getattr(self, obj, _NOT_SET) is not _NOT_SET
+        overflow = _MODEL_DICT_SLOT.__get__(self, None)
+        return overflow is not None and obj in overflow
+
+    def __iter__(self):
+        """Iterate over property names (including additional).
+
+        Consistently with :class:`.Model` the properties are in :attr:`_properties` order,
+        followed by the additional properties.
+        """
+        properties = self._properties
+        property_slots = self._property_slots
+        overflow = _MODEL_DICT_SLOT.__get__(self, None)
+        for attr_name in properties:
+            if attr_name in property_slots:
+                if getattr(self, attr_name, _NOT_SET) is not _NOT_SET:
+                    yield attr_name
+            elif overflow and attr_name in overflow:
+                yield attr_name
+        if overflow:
+            for attr_name in overflow:
+                if attr_name not in properties:
+                    yield attr_name
+
+    def __getitem__(self, property_name):
+        """Get a property value by name.
+
+        :type property_name: str
+        """
+        if property_name in self._property_slots:
+            value = getattr(self, property_name, _NOT_SET)
+            if value is _NOT_SET:
+                raise KeyError(property_name)
+            return value
+        overflow = _MODEL_DICT_SLOT.__get__(self, None)
+        if overflow is None:
+            raise KeyError(property_name)
+        return overflow[property_name]
+
+    def __setitem__(self, property_name, val):
+        """Set a property value by name.
+
+        :type property_name: str
+        """
+        property_slot = self._property_slots.get(property_name)
+        if property_slot is not None:
+            property_slot.__set__(self, val)
+            return
+        overflow = _MODEL_DICT_SLOT.__get__(self, None)
+        if overflow is None:
+            overflow = {}
+            _MODEL_DICT_SLOT.__set__(self, overflow)
+        overflow[property_name] = val
+
+    def __delitem__(self, property_name):
+        """Unset a property by name.
+
+        Properties defined in the spec will be set to ``None``.
+        Additional properties will be completely removed.
+
+        :type property_name: str
+        """
+        if property_name in self._properties:
+            self[property_name] = None
+            return
+        overflow = _MODEL_DICT_SLOT.__get__(self, None)
+        if overflow is None:
+            raise KeyError(property_name)
+        del overflow[property_name]
+
+    @classmethod
+    def _from_dict(cls, dct):
+        """Create a model instance from dictionary of property values.
+
+        :param dict dct: Property values by name.
+        :rtype: .SlottedModel
+        """
+        model = object.__new__(cls)
+        model.__init_from_dict(
+            dct=dct,
+            include_missing_properties=cls._swagger_spec.config['include_missing_properties'],
+        )
+        return model
+
+
+def _is_slot_name(property_name):
+    # type: (typing.Any) -> bool
+    return (
+        isinstance(property_name, str) and
+        property_name.isidentifier() and
+        not property_name.startswith('_') and
+        not hasattr(SlottedModel, property_name)
+    )
+
+
+def _create_slotted_model_type(swagger_spec, model_name, model_spec, bases, class_dict):
+    # type: (Spec, typing.Text, JSONDict, typing.Tuple[type, ...], typing.Dict[str, typing.Any]) -> type
+    properties = collapsed_properties(model_spec, swagger_spec)
+    inherited_slots = {
+        property_name
+        for property_name in properties
+        if isinstance(getattr(bases[0], property_name, None), types.MemberDescriptorType)
+    }
+    class_dict['__slots__'] = tuple(
+        property_name
+        for property_name in properties
+        if _is_slot_name(property_name) and property_name not in inherited_slots
+    )
+    class_dict['_properties'] = properties
+
+    model_type = type(str(model_name), bases, class_dict)
+    model_type._property_slots = {  # type: ignore  # model_type is a SlottedModel subclass
+        property_name: getattr(model_type, property_name)
+        for property_name in properties
+        if _is_slot_name(property_name) and isinstance(getattr(model_type, property_name), types.MemberDescriptorType)
+    }
+    return model_type
+
+
+class SparseModel(Model):
+    """Base class for Swagger models storing only the properties that have been set.
+
+    Model types are created with this base class if ``sparse_models`` and
+    ``include_missing_properties`` configs are enabled.
+
+    :class:`.Model` instances store ``None`` for every property, defined in the model
+    spec, that is missing. Sparse models don't store them and answer ``None`` when they
+    are accessed, so wide models with few properties set need much less memory.
+
+    The public interface, and the observable behavior, is the same of :class:`.Model`:
+    missing properties are still contained, iterated (in :attr:`_properties` order,
+    before the additional properties) and returned by :meth:`_as_dict`.
+    """
+
+    # Implementation details:
+    #
+    # The properties set are stored in the __values slot (the _Model__dict slot is not
+    # used). _Model__dict is shadowed by
+    # a property returning all the property values as dictionary (as Model would store them),
+    # so the methods of Model reading the property values (__repr__, _as_dict, etc.) are
+    # working unmodified.
+
+    __slots__ = (
+        '_SparseModel__values',  # Note the name mangling!
+    )
+
+    def __init__(self, **kwargs):
+        """Initialize from property values in keyword arguments.
+
+        :param \\**kwargs: Property values by name.
+        """
+        self.__init_from_dict(kwargs)
+
+    def __init_from_dict(self, dct, include_missing_properties=None):
+        if self._model_spec.get('additionalProperties') is False:
+            additional = set(dct).difference(self._properties)
+            if additional:
+                raise AttributeError(
+                    "Model {0} does not have attributes for: {1}".format(
+                        type(self), list(additional),
+                    ),
+                )
+
+        object.__setattr__(self, '_SparseModel__values', dict(dct))
+
+    @property
+    def _Model__dict(self):
+        """Property values by name (including additional)."""
+        values = self.__values
+        dct = {attr_name: values.get(attr_name) for attr_name in self._properties}
+        for attr_name, attr_val in iteritems(values):
+            if attr_name not in dct:
+                dct[attr_name] = attr_val
+        return dct
+
+    def __contains__(self, obj):
+        """Has a property set (including additional)."""
+        return obj in self._properties or obj in self.__values
+
+    def __iter__(self):
+        """Iterate over property names (including additional)."""
+        properties = self._properties
+        additional = [
+            attr_name
+            for attr_name in self.__values
+            if attr_name not in properties
+        ]
+        if not additional:
+            return iter(properties)
+        return itertools.chain(properties, additional)
+
+    def __getitem__(self, property_name):
+        """Get a property value by name.
+
+        :type property_name: str
+        """
+        value = self.__values.get(property_name, _NOT_SET)
+        if value is _NOT_SET:
+            if property_name in self._properties:
+                return None
+            raise KeyError(property_name)
+        return value
+
+    def __setitem__(self, property_name, val):
+        """Set a property value by name.
+
+        :type property_name: str
+        """
+        self.__values[property_name] = val
+
+    def __delitem__(self, property_name):
+        """Unset a property by name.
+
+        Properties defined in the spec will be set to ``None``.
+        Additional properties will be completely removed.
+
+        :type property_name: str
+        """
+        values = self.__values
+        if property_name in self._properties:
+            values.pop(property_name, None)
+        else:
+            del values[property_name]
+
+    def __eq__(self, other):
+        """Check for equality with another instance.
+
+        Two model instances are equal if they have the same type and the same
+        properties and values (including additional properties).
+        """
+        if other.__class__ is self.__class__ and _are_property_values_equal(
+            self.__values,
+            other.__values,
+        ):
+            return True
+        # Properties explicitly set to None are equal to missing properties
+        return super(SparseModel, self).__eq__(other)
+
+    def __deepcopy__(self, memo=None):
+        """Deep copy all properties, but not metadata like the Swagger or Model spec attributes.
+
+        The property values are copied as they are, the model is not initialized again.
+        """
+        if memo is None:  # pragma: no cover  # This should never happening, but better safe than sorry
+            memo = {}
+        model = object.__new__(self.__class__)
+        memo[id(self)] = model
+        object.__setattr__(
+            model,
+            '_SparseModel__values',
+            {
+                attr_name: attr_val if attr_val.__class__ in _IMMUTABLE_TYPES else deepcopy(attr_val, memo)
+                for attr_name, attr_val in iteritems(self.__values)
+            },
+        )
+        return model
+
+    def __getstate__(self):
+        """Values of the properties set (including additional), as a new dictionary."""
+        return dict(self.__values)
+
+    def __setstate__(self, state):
+        """Restore the property values returned by :meth:`__getstate__`.
+
+        :type state: dict
+        """
+        object.__setattr__(self, '_SparseModel__values', state)
+
+    @classmethod
+    def _from_dict(cls, dct):
+        """Create a model instance from dictionary of property values.
+
+        :param dict dct: Property values by name.
+        :rtype: .SparseModel
+        """
+        model = object.__new__(cls)
+        model.__init_from_dict(dct=dct)
+        return model
+
+
+def _get_model_bases(swagger_spec):
+    # type: (Spec) -> typing.Tuple[type, ...]
+    """Base classes of the model types created for swagger_spec, according to its config."""
+    config = swagger_spec.config
+    if config['slotted_models']:
+        return (SlottedModel,)
+    if config['sparse_models'] and config['include_missing_properties']:
+        return (SparseModel,)
+    return (Model,)
+
+
 class ModelDocstring(object):
     """Descriptor for model classes that dynamically generates docstrings.
 
@@ -649,22 +1340,24 @@ def create_model_type(swagger_spec, model_name, model_spec, bases=(Model,), json
     :param model_name: model name
     :param model_spec: json-like dict that describes a model.
     :param tuple bases: Base classes for type. At least one should be
-        :class:`.Model` or a subclass of it.
+        :class:`.Model` or a subclass of it. If the first one is a
+        :class:`.SlottedModel` subclass, a slot is created for each property.
     :returns: dynamic type inheriting from ``bases``.
     :param json_reference: JSON Uri where model spec could be found
     :type json_reference: str
     :rtype: type
     """
-
-    return type(
-        str(model_name), bases, dict(
-            __slots__=(),  # More memory-efficient
-            __doc__=ModelDocstring(),
-            _swagger_spec=swagger_spec,
-            _model_spec=model_spec,
-            _json_reference=json_reference,
-        ),
+    class_dict = dict(
+        __slots__=(),  # More memory-efficient
+        __doc__=ModelDocstring(),
+        _swagger_spec=swagger_spec,
+        _model_spec=model_spec,
+        _json_reference=json_reference,
     )
+    if SlottedModel in bases[0].__mro__:
+        return _create_slotted_model_type(swagger_spec, model_name, model_spec, bases, class_dict)
+
+    return type(str(model_name), bases, class_dict)
 
 
 def is_model(swagger_spec, schema_object_spec):
@@ -954,6 +1647,7 @@ def _from_pickleable_representation(model_pickleable_representation):
     ``model_pickleable_representation`` is supposed to be the output of ``_to_pickleable_representation``.
 
     NOTE:   This API should not be considered a public API and is meant
-            only to be used by bravado_core.spec.Spec.__getstate__ .
+            only to be used by bravado_core.spec.Spec.__setstate__ to restore
+            states created by older bravado-core versions.
     """
     return create_model_type(**model_pickleable_representation)
@@ -10,6 +10,8 @@ from bravado_core.param import Param
 from bravado_core.security_requirement import SecurityRequirement
 from bravado_core.util import AliasKeyDict
 from bravado_core.util import cached_property
+from bravado_core.util import fingerprint
+from bravado_core.util import is_same_content
 from bravado_core.util import sanitize_name
 
 
@@ -91,10 +93,21 @@ class Operation(object):
         return (
             self.path_name == other.path_name and
             self.http_method == other.http_method and
-            self.op_spec == other.op_spec and
+            self.fingerprint == other.fingerprint and
+            # matching fingerprints are confirmed by a deep comparison
+            is_same_content(self.op_spec, other.op_spec) and
             (ignore_swagger_spec or self.swagger_spec.is_equal(other.swagger_spec))
         )
 
+    @cached_property
+    def fingerprint(self):
+        # type: () -> typing.Text
+        """Content fingerprint of the operation specification (x-scope metadata excluded).
+
+        Check :func:`bravado_core.util.fingerprint` for details.
+        """
+        return fingerprint(self.op_spec)
+
     @cached_property
     def consumes(self):
         # type: () -> typing.List[typing.Text]
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import array
 import logging
 import typing
 from functools import partial
@@ -6,14 +7,30 @@ from functools import partial
 import msgpack
 import simplejson as json
 import six
+from jsonschema.exceptions import ValidationError
 from six.moves.urllib.parse import quote
 
 from bravado_core import schema
+from bravado_core.codec import decode_msgpack_body
+from bravado_core.codec import encode_msgpack
 from bravado_core.content_type import APP_JSON
 from bravado_core.content_type import APP_MSGPACK
 from bravado_core.exception import SwaggerMappingError
+from bravado_core.instrumentation import DECODE_BODY
+from bravado_core.instrumentation import ENCODE_BODY
+from bravado_core.instrumentation import instrument
+from bravado_core.instrumentation import MARSHAL_PARAM
+from bravado_core.instrumentation import run_phase
+from bravado_core.instrumentation import UNMARSHAL_BODY
+from bravado_core.instrumentation import VALIDATE_BODY
 from bravado_core.marshal import marshal_schema_object
-from bravado_core.unmarshal import unmarshal_schema_object
+from bravado_core.unmarshal import _get_unmarshaling_method
+from bravado_core.upload import is_iterator
+from bravado_core.upload import IteratorReader
+from bravado_core.upload import spool_upload
+from bravado_core.util import memoize_by_id
+from bravado_core.validate import _scrub_sensitive_value
+from bravado_core.validate import get_schema_object_validator
 from bravado_core.validate import validate_schema_object
 
 
@@ -33,6 +50,12 @@ COLLECTION_FORMATS = {
     'pipes': '|',
 }
 
+# array.array typecodes used for the values of collectionFormat parameters (check typed_array_params config)
+TYPED_ARRAY_TYPECODES = {
+    'integer': 'q',
+    'number': 'd',
+}
+
 
 def stringify_body(value):
     """Json dump the value to string if not already in string
@@ -83,6 +106,7 @@ class Param(object):
 
 
 def get_param_type_spec(param):
+    # type: (Param) -> JSONDict
     """The spec for the parameter 'type' is not always in the same place for a
     parameter. The notable exception is when the location is 'body' and the
     spec for the type is in param_spec['schema']
@@ -97,7 +121,7 @@ def get_param_type_spec(param):
     if location in ('path', 'query', 'header', 'formData'):
         return param.param_spec
     if location == 'body':
-        return param.swagger_spec.deref(param.param_spec).get('schema')
+        return param.swagger_spec.deref(param.param_spec).get('schema')  # type: ignore  # body parameters have a schema
     raise SwaggerMappingError(
         "Don't know how to handle location {0} in parameter {1}".format(location, param),
     )
@@ -118,6 +142,10 @@ def marshal_param(param, value, request):
     :param value: The value to assign to the parameter
     :type request: dict
     """
+    run_phase(param.swagger_spec, param.op, MARSHAL_PARAM, _marshal_param, (param, value, request), request)
+
+
+def _marshal_param(param, value, request):
     swagger_spec = param.swagger_spec
     deref = swagger_spec.deref
 
@@ -129,7 +157,9 @@ def marshal_param(param, value, request):
     if value is None and not param.required:
         return
 
-    value = marshal_schema_object(swagger_spec, param_spec, value)
+    use_msgpack = location == 'body' and _should_use_msgpack(param)
+    msgpack_timestamps = use_msgpack and swagger_spec.config['msgpack_timestamps']
+    value = marshal_schema_object(swagger_spec, param_spec, value, native_datetimes=msgpack_timestamps)
 
     if swagger_spec.config['validate_requests']:
         validate_schema_object(swagger_spec, param_spec, value)
@@ -153,18 +183,26 @@ def marshal_param(param, value, request):
         else:
             request.setdefault('data', {})[param.name] = value
     elif location == 'body':
-        if _should_use_msgpack(param):
-            request['headers']['Content-Type'] = APP_MSGPACK
-            request['data'] = msgpack.packb(value, use_bin_type=True)
-        else:
-            request['headers']['Content-Type'] = APP_JSON
-            request['data'] = json.dumps(value)
+        request['headers']['Content-Type'] = APP_MSGPACK if use_msgpack else APP_JSON
+        run_phase(
+            swagger_spec, param.op, ENCODE_BODY, _encode_body,
+            (swagger_spec, request, value, use_msgpack, msgpack_timestamps), request,
+        )
     else:
         raise SwaggerMappingError(
             "Don't know how to marshal_param with location {0}".format(location),
         )
 
 
+def _encode_body(swagger_spec, request, value, use_msgpack, msgpack_timestamps):
+    # type: (Spec, typing.Dict[typing.Text, typing.Any], typing.Any, bool, bool) -> None
+    if use_msgpack:
+        request['data'] = encode_msgpack(value, timestamps=msgpack_timestamps)
+    else:
+        json_codec = swagger_spec.json_codec
+        request['data'] = json.dumps(value) if json_codec is None else json_codec.dumps(value)
+
+
 def _should_use_msgpack(param):
     """Determine whether to use msgpack encoding for a body parameter.
 
@@ -189,67 +227,147 @@ def unmarshal_param(param, request):
     :type request: :class:`bravado_core.request.IncomingRequest`
     :return: value of parameter
     """
-    swagger_spec = param.swagger_spec
-    deref = swagger_spec.deref
-    param_spec = deref(get_param_type_spec(param))
-    location = param.location
-    param_type = deref(param_spec.get('type'))
-    cast_param = partial(cast_request_param, param_type, param.name)
+    return _get_param_unmarshaling_method(param)(request)
 
-    default_value = schema.get_default(swagger_spec, param_spec)
+
+def _get_param_value_extractor(param, param_spec, param_type, default_value):
+    # type: (Param, JSONDict, typing.Optional[typing.Text], typing.Any) -> typing.Callable[[typing.Any], typing.Any]
+    """Build the function that extracts the raw parameter value from the request like object."""
+    location = param.location
+    param_name = param.name
 
     if location == 'path':
-        raw_value = cast_param(request.path.get(param.name, None))
+        return lambda request: request.path.get(param_name, None)
     elif location == 'query':
-        raw_value = cast_param(request.query.get(param.name, default_value))
+        return lambda request: request.query.get(param_name, default_value)
     elif location == 'header':
-        raw_value = cast_param(request.headers.get(param.name, default_value))
+        return lambda request: request.headers.get(param_name, default_value)
     elif location == 'formData':
         if param_type == 'file':
-            raw_value = request.files.get(param.name, None)
-        else:
-            raw_value = cast_param(request.form.get(param.name, default_value))
+            config = param.swagger_spec.config
+            if config['spool_uploads']:
+                return lambda request: spool_upload(
+                    request.files.get(param_name, None),
+                    spool_size=config['upload_spool_size'],
+                    max_size=config['upload_max_size'],
+                )
+            return lambda request: request.files.get(param_name, None)
+        return lambda request: request.form.get(param_name, default_value)
     elif location == 'body':
-        content_type = request.headers.get('Content-Type', '').lower().split(';')[0].strip()
-        if content_type == APP_MSGPACK:
-            try:
-                raw_value = msgpack.unpackb(request.raw_bytes, raw=False)
-            except (msgpack.UnpackException, ValueError) as msgpack_error:
-                if param.required:
-                    raise SwaggerMappingError(
-                        "Error reading request body msgpack: {0}".format(str(msgpack_error)),
-                    )
-                else:
-                    raw_value = default_value
-        else:
-            try:
-                raw_value = request.json()
-            except ValueError as json_error:
-                if param.required:
-                    raise SwaggerMappingError(
-                        "Error reading request body JSON: {0}".format(str(json_error)),
-                    )
-                else:
-                    raw_value = default_value
+        required = param.required
+        json_codec = param.swagger_spec.json_codec
+        msgpack_timestamps = param.swagger_spec.config['msgpack_timestamps']
+
+        def extract_body(request):
+            # type: (typing.Any) -> typing.Any
+            content_type = request.headers.get('Content-Type', '').lower().split(';')[0].strip()
+            if content_type == APP_MSGPACK:
+                try:
+                    return decode_msgpack_body(request, timestamps=msgpack_timestamps)
+                except (msgpack.UnpackException, ValueError) as msgpack_error:
+                    if required:
+                        raise SwaggerMappingError(
+                            "Error reading request body msgpack: {0}".format(str(msgpack_error)),
+                        )
+                    return default_value
+            else:
+                try:
+                    if json_codec is None:
+                        return request.json()
+                    return json_codec.loads(request.raw_bytes)
+                except ValueError as json_error:
+                    if required:
+                        raise SwaggerMappingError(
+                            "Error reading request body JSON: {0}".format(str(json_error)),
+                        )
+                    return default_value
+        return instrument(param.swagger_spec, param.op, DECODE_BODY, extract_body, first_arg_is_payload=True)
     else:
         raise SwaggerMappingError(
             "Don't know how to unmarshal_param with location {0}".format(location),
         )
 
-    if raw_value is None and not param.required:
-        return None
 
-    if param_type == 'array' and location != 'body':
-        raw_value = unmarshal_collection_format(
-            swagger_spec, param_spec,
-            raw_value,
-        )
+@memoize_by_id
+def _get_param_unmarshaling_method(param):
+    # type: (Param) -> typing.Callable[[typing.Any], typing.Any]
+    """
+    Build, once per parameter, the function unmarshaling the parameter value from a
+    request like object.
 
-    if swagger_spec.config['validate_requests']:
-        validate_schema_object(swagger_spec, param_spec, raw_value)
+    Everything that depends only on the parameter specs (value extraction, casting,
+    default value, collection format splitting, jsonschema validator and unmarshaling
+    method) is resolved here instead of on every request.
+
+    NOTE: validate_requests config is checked on every call.
+    """
+    swagger_spec = param.swagger_spec
+    deref = swagger_spec.deref
+    param_spec = deref(get_param_type_spec(param))
+    location = param.location
+    param_type = deref(param_spec.get('type'))
+    required = param.required
 
-    value = unmarshal_schema_object(swagger_spec, param_spec, raw_value)
-    return value
+    default_value = schema.get_default(swagger_spec, param_spec)
+    extract_value = _get_param_value_extractor(param, param_spec, param_type, default_value)
+
+    cast_param = None
+    unmarshal_collection = None
+    to_typed_array = None
+    if location != 'body':
+        if param_type in CAST_TYPE_TO_FUNC:
+            cast_param = partial(cast_request_param, param_type, param.name)
+        elif param_type == 'array':
+            unmarshal_collection = _get_collection_format_unmarshaler(swagger_spec, param_spec)
+            if swagger_spec.config['typed_array_params']:
+                typecode = TYPED_ARRAY_TYPECODES.get(deref(deref(param_spec['items']).get('type')))
+                if typecode is not None:
+                    to_typed_array = partial(_to_typed_array, typecode)
+
+    validate_value = get_schema_object_validator(swagger_spec, param_spec)
+    unmarshal_value = _get_unmarshaling_method(swagger_spec=swagger_spec, object_schema=param_spec)
+    if location == 'body':
+        validate_value = instrument(swagger_spec, param.op, VALIDATE_BODY, validate_value)
+        unmarshal_value = instrument(swagger_spec, param.op, UNMARSHAL_BODY, unmarshal_value)
+
+    def unmarshal_param_from_request(request):
+        # type: (typing.Any) -> typing.Any
+        raw_value = extract_value(request)
+        if cast_param is not None:
+            raw_value = cast_param(raw_value)
+
+        if raw_value is None and not required:
+            return None
+
+        if unmarshal_collection is not None:
+            raw_value = unmarshal_collection(raw_value)
+
+        if swagger_spec.config['validate_requests']:
+            validate_value(raw_value)
+
+        if to_typed_array is not None:
+            return to_typed_array(unmarshal_value(raw_value))
+        return unmarshal_value(raw_value)
+
+    # Keep param alive as long as the memoized function, otherwise its id could be reused
+    # by a different Param instance that would get the wrong function
+    unmarshal_param_from_request.param = param  # type: ignore
+    return unmarshal_param_from_request
+
+
+def _to_typed_array(typecode, value):
+    # type: (typing.Text, typing.Any) -> typing.Any
+    """Convert a list of numbers to array.array, if all the items fit the typecode.
+
+    Lists containing items of different types (ie. values that failed casting and were not
+    validated) or out of range integers are returned untouched.
+    """
+    if not isinstance(value, list):
+        return value
+    try:
+        return array.array(typecode, value)
+    except (OverflowError, TypeError):
+        return value
 
 
 def string_to_boolean(value):
@@ -279,7 +397,7 @@ CAST_TYPE_TO_FUNC = {
     'integer': int,
     'number': float,
     'boolean': string_to_boolean,
-}
+}  # type: typing.Dict[typing.Text, typing.Callable[[typing.Any], typing.Any]]
 
 
 def cast_request_param(param_type, param_name, param_value):
@@ -350,8 +468,13 @@ def encode_request_param(param_type, param_name, param_value):
 def add_file(param, value, request):
     """Add a parameter of type 'file' to the given request.
 
+    File-like objects are passed through untouched and iterators of bytes chunks
+    (ie. generators) are wrapped in a file-like :class:`bravado_core.upload.IteratorReader`,
+    so http clients can stream them without buffering the whole file.
+
     :type param: :class;`bravado_core.param.Param`
-    :param value: The raw content of the file to be uploaded
+    :param value: The content of the file to be uploaded (bytes, file-like object or
+        iterator of bytes), optionally as (filename, content) or (filename, content, content_type) tuple
     :type request: dict
     """
     if request.get('files') is None:
@@ -376,11 +499,18 @@ def add_file(param, value, request):
             )
 
     if isinstance(value, tuple):
-        filename, val = value
+        filename, val = value[0], value[1]
+        content_type = value[2] if len(value) > 2 else None
     else:
-        filename, val = param.name, value
+        filename, val, content_type = param.name, value, None
 
-    file_tuple = (param.name, (filename, val))
+    if is_iterator(val):
+        val = IteratorReader(val)
+
+    if content_type is None:
+        file_tuple = (param.name, (filename, val))
+    else:
+        file_tuple = (param.name, (filename, val, content_type))
     request['files'].append(file_tuple)
 
 
@@ -429,34 +559,76 @@ def unmarshal_collection_format(swagger_spec, param_spec, value):
     :type value: string
 
     :rtype: list
+    :raises: ValidationError if the number of items exceeds maxItems and
+        validate_requests config is enabled
+    """
+    return _get_collection_format_unmarshaler(swagger_spec, param_spec)(value)
+
+
+def _get_collection_format_unmarshaler(swagger_spec, param_spec):
+    # type: (Spec, JSONDict) -> typing.Callable[[typing.Any], typing.Any]
+    """Build the function splitting and casting the values of a non-body parameter of type array.
+
+    Items are casted in bulk, falling back to :func:`cast_request_param` per item
+    only if some of them can't be casted. The number of items is checked against
+    maxItems before casting them, so oversized values are rejected cheaply.
+
+    Check :func:`unmarshal_collection_format` for details.
     """
     deref = swagger_spec.deref
     param_spec = deref(param_spec)
     collection_format = param_spec.get('collectionFormat', 'csv')
+    separator = COLLECTION_FORMATS.get(collection_format)
+    required = schema.is_required(swagger_spec, param_spec)
+    items_type = deref(param_spec['items']).get('type')
+    cast_item = CAST_TYPE_TO_FUNC.get(items_type)
+    max_items = deref(param_spec.get('maxItems'))
+    param_name = param_spec['name']
 
-    if value is None:
-        if not schema.is_required(swagger_spec, param_spec):
-            # Just pass through an optional array that has no value
-            return None
-        return schema.handle_null_value(swagger_spec, param_spec)
-
-    if schema.is_list_like(value):
-        value_array = value
-    elif collection_format == 'multi':
-        # http client lib should have already unmarshalled the value
-        value_array = [value]
-    else:
-        sep = COLLECTION_FORMATS[collection_format]
-        if value == '':
+    def cast_items(value_array):
+        # type: (typing.List[typing.Any]) -> typing.List[typing.Any]
+        if cast_item is None:
+            return list(value_array)
+        try:
+            return list(map(cast_item, value_array))
+        except (ValueError, TypeError):
+            # Some items can't be casted (ie. empty strings): warn about them and let
+            # jsonschema validation handle incorrect types
+            return [
+                cast_request_param(items_type, param_name, item)
+                for item in value_array
+            ]
+
+    def unmarshal_collection(value):
+        # type: (typing.Any) -> typing.Any
+        if value is None:
+            if not required:
+                # Just pass through an optional array that has no value
+                return None
+            return schema.handle_null_value(swagger_spec, param_spec)
+
+        if schema.is_list_like(value):
+            value_array = value
+        elif collection_format == 'multi':
+            # http client lib should have already unmarshalled the value
+            value_array = [value]
+        elif value == '':
             value_array = []
         else:
-            value_array = value.split(sep)
+            value_array = value.split(separator)
+
+        if max_items is not None and len(value_array) > max_items and swagger_spec.config['validate_requests']:
+            too_long_error = ValidationError(
+                '%r is too long' % (value_array,),
+                validator='maxItems',
+                validator_value=max_items,
+                instance=value_array,
+                schema=param_spec,
+            )
+            # Consistently with the validator, x-sensitive values are not reported
+            _scrub_sensitive_value(too_long_error)
+            raise too_long_error
 
-    items_spec = param_spec['items']
-    items_type = deref(items_spec).get('type')
-    param_name = param_spec['name']
+        return cast_items(value_array)
 
-    return [
-        cast_request_param(items_type, param_name, item)
-        for item in value_array
-    ]
+    return unmarshal_collection
@@ -1,11 +1,20 @@
 # -*- coding: utf-8 -*-
+import typing
+
 from six import itervalues
 
+from bravado_core.instrumentation import run_phase
+from bravado_core.instrumentation import UNMARSHAL_REQUEST
 from bravado_core.operation import log
-from bravado_core.param import unmarshal_param
+from bravado_core.param import _get_param_unmarshaling_method
+from bravado_core.util import memoize_by_id
 from bravado_core.validate import validate_security_object
 
 
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core.operation import Operation
+
+
 class IncomingRequest(object):
     """
     Common interface for server side request objects.
@@ -64,13 +73,34 @@ def unmarshal_request(request, op):
     :type op: :class:`bravado_core.operation.Operation`
     :returns: dict where (key, value) = (param_name, param_value)
     """
-    request_data = {}
-    for param in itervalues(op.params):
-        param_value = unmarshal_param(param, request)
-        request_data[param.name] = param_value
-
-    if op.swagger_spec.config["validate_requests"]:
-        validate_security_object(op, request_data)
-
+    request_data = run_phase(op.swagger_spec, op, UNMARSHAL_REQUEST, _get_request_unmarshaling_method(op), (request,), request)
     log.debug("Swagger request_data: %s", request_data)
     return request_data
+
+
+@memoize_by_id
+def _get_request_unmarshaling_method(op):
+    # type: (Operation) -> typing.Callable[[typing.Any], typing.Dict[typing.Text, typing.Any]]
+    """Build, once per operation, the function unmarshaling all the operation
+    parameters from a request like object.
+
+    :type op: :class:`bravado_core.operation.Operation`
+    :rtype: callable
+    """
+    request_plan = tuple(
+        (param.name, _get_param_unmarshaling_method(param))
+        for param in itervalues(op.params)
+    )
+    config = op.swagger_spec.config
+
+    def unmarshal_operation_request(request):
+        # type: (typing.Any) -> typing.Dict[typing.Text, typing.Any]
+        request_data = {}
+        for param_name, unmarshal_param_from_request in request_plan:
+            request_data[param_name] = unmarshal_param_from_request(request)
+
+        if config["validate_requests"]:
+            validate_security_object(op, request_data)
+        return request_data
+
+    return unmarshal_operation_request
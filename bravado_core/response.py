@@ -1,12 +1,18 @@
 # -*- coding: utf-8 -*-
-import msgpack
 from jsonschema import ValidationError
 from six import iteritems
 
+from bravado_core.codec import decode_msgpack_body
 from bravado_core.content_type import APP_JSON
 from bravado_core.content_type import APP_MSGPACK
 from bravado_core.exception import MatchingResponseNotFound
 from bravado_core.exception import SwaggerMappingError
+from bravado_core.instrumentation import DECODE_BODY
+from bravado_core.instrumentation import run_phase
+from bravado_core.instrumentation import UNMARSHAL_BODY
+from bravado_core.instrumentation import UNMARSHAL_RESPONSE
+from bravado_core.instrumentation import VALIDATE_BODY
+from bravado_core.instrumentation import VALIDATE_RESPONSE
 from bravado_core.unmarshal import unmarshal_schema_object
 from bravado_core.validate import validate_schema_object
 
@@ -92,6 +98,31 @@ class OutgoingResponse(object):
         raise NotImplementedError("Implement json() in {0}".format(type(self)))
 
 
+def _decode_json_body(swagger_spec, response):
+    """Decode the JSON body of a request or response like object, via the
+    json codec of the spec if configured.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :type response: :class:`bravado_core.response.IncomingResponse` or
+        :class:`bravado_core.response.OutgoingResponse`
+    """
+    json_codec = swagger_spec.json_codec
+    if json_codec is None:
+        return response.json()
+    return json_codec.loads(response.raw_bytes)
+
+
+def _decode_body(swagger_spec, response, content_type):
+    """Decode the JSON or msgpack body of a request or response like object.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :param content_type: lowercase content type of the body
+    """
+    if content_type.startswith(APP_JSON):
+        return _decode_json_body(swagger_spec, response)
+    return decode_msgpack_body(response, timestamps=swagger_spec.config['msgpack_timestamps'])
+
+
 def unmarshal_response(response, op):
     """Unmarshal incoming http response into a value based on the
     response specification.
@@ -101,7 +132,12 @@ def unmarshal_response(response, op):
     :returns: value where type(value) matches response_spec['schema']['type']
         if it exists, None otherwise.
     """
-    deref = op.swagger_spec.deref
+    return run_phase(op.swagger_spec, op, UNMARSHAL_RESPONSE, _unmarshal_response, (response, op), response)
+
+
+def _unmarshal_response(response, op):
+    swagger_spec = op.swagger_spec
+    deref = swagger_spec.deref
     response_spec = get_response_spec(response.status_code, op)
 
     if 'schema' not in response_spec:
@@ -112,14 +148,17 @@ def unmarshal_response(response, op):
 
     if content_type.startswith(APP_JSON) or content_type.startswith(APP_MSGPACK):
         content_spec = deref(response_spec['schema'])
-        if content_type.startswith(APP_JSON):
-            content_value = response.json()
-        else:
-            content_value = msgpack.loads(response.raw_bytes, raw=False)
-        if op.swagger_spec.config['validate_responses']:
-            validate_schema_object(op.swagger_spec, content_spec, content_value)
+        content_value = run_phase(swagger_spec, op, DECODE_BODY, _decode_body, (swagger_spec, response, content_type), response)
+        if swagger_spec.config['validate_responses']:
+            run_phase(
+                swagger_spec, op, VALIDATE_BODY, validate_schema_object,
+                (swagger_spec, content_spec, content_value), response,
+            )
 
-        return unmarshal_schema_object(op.swagger_spec, content_spec, content_value)
+        return run_phase(
+            swagger_spec, op, UNMARSHAL_BODY, unmarshal_schema_object,
+            (swagger_spec, content_spec, content_value), response,
+        )
 
     # TODO: Non-json response contents
     return response.text
@@ -172,6 +211,10 @@ def validate_response(response_spec, op, response):
     if not op.swagger_spec.config['validate_responses']:
         return
 
+    run_phase(op.swagger_spec, op, VALIDATE_RESPONSE, _validate_response, (response_spec, op, response), response)
+
+
+def _validate_response(response_spec, op, response):
     validate_response_body(op, response_spec, response)
     validate_response_headers(op, response_spec, response)
 
@@ -206,12 +249,14 @@ def validate_response_body(op, response_spec, response):
         )
 
     if response.content_type == APP_JSON or response.content_type == APP_MSGPACK:
-        if response.content_type == APP_JSON:
-            response_value = response.json()
-        else:
-            response_value = msgpack.loads(response.raw_bytes, raw=False)
-        validate_schema_object(
-            op.swagger_spec, response_body_spec, response_value,
+        swagger_spec = op.swagger_spec
+        response_value = run_phase(
+            swagger_spec, op, DECODE_BODY, _decode_body,
+            (swagger_spec, response, response.content_type), response,
+        )
+        run_phase(
+            swagger_spec, op, VALIDATE_BODY, validate_schema_object,
+            (swagger_spec, response_body_spec, response_value), response,
         )
     elif response.content_type.startswith("text/"):
         # TODO: support some kind of validation for text/* responses
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+Map concrete request paths (ie. ``/v2/pet/123``) to the Swagger operations.
+
+Paths are stored in a segment trie, so matching a request depends on the number
+of segments of the path and not on the number of operations defined by the spec.
+"""
+import re
+import typing
+
+from six import itervalues
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core.operation import Operation
+    from bravado_core.spec import Spec
+
+
+# Matches the path templates of a path segment (ie. {petId} or {fileName}.{extension})
+PATH_TEMPLATE_RE = re.compile(r'{([^{}/]+)}')
+
+
+class RouteMatch(
+    typing.NamedTuple(
+        'RouteMatch',
+        [
+            ('operation', typing.Optional['Operation']),
+            ('path_params', typing.Dict[typing.Text, typing.Text]),
+            ('allowed_methods', typing.Tuple[typing.Text, ...]),
+        ],
+    ),
+):
+    """Outcome of the routing of a request.
+
+    :param operation: matching operation, None if the path is known but the http method is
+        not allowed (ie. HTTP 405)
+    :param path_params: values of the path parameters, as they appear in the request path,
+        by parameter name
+    :param allowed_methods: sorted http methods, upper-cased, allowed by all the paths
+        matching the request (ie. to populate the Allow header of HTTP 405 responses)
+    """
+
+
+class _Route(object):
+    """Operations of a path (#/paths/{path_name})"""
+
+    __slots__ = ('path_name', 'param_names', 'operations', 'allowed_methods')
+
+    def __init__(self, path_name, param_names):
+        # type: (typing.Text, typing.Tuple[typing.Text, ...]) -> None
+        self.path_name = path_name
+        self.param_names = param_names
+        self.operations = {}  # type: typing.Dict[typing.Text, Operation]
+        self.allowed_methods = ()  # type: typing.Tuple[typing.Text, ...]
+
+    def add_operation(self, operation):
+        # type: (Operation) -> None
+        self.operations[operation.http_method.lower()] = operation
+        self.allowed_methods = tuple(sorted(http_method.upper() for http_method in self.operations))
+
+
+class _RouteNode(object):
+    """Node of the segment trie.
+
+    Children are matched in the following order: static segments, segments partially
+    templated (ie. ``{fileName}.json``) and segments fully templated (ie. ``{petId}``).
+    """
+
+    __slots__ = ('static_children', 'partial_children', 'param_child', 'route')
+
+    def __init__(self):
+        # type: () -> None
+        self.static_children = {}  # type: typing.Dict[typing.Text, _RouteNode]
+        # (key, value) = (segment template, (compiled segment template, node))
+        self.partial_children = {}  # type: typing.Dict[typing.Text, typing.Tuple[typing.Pattern[typing.Text], _RouteNode]]
+        self.param_child = None  # type: typing.Optional[_RouteNode]
+        self.route = None  # type: typing.Optional[_Route]
+
+    def add_child(self, segment):
+        # type: (typing.Text) -> _RouteNode
+        param_names = PATH_TEMPLATE_RE.findall(segment)
+        if not param_names:
+            return self.static_children.setdefault(segment, _RouteNode())
+        if PATH_TEMPLATE_RE.match(segment) and len(segment) == len(param_names[0]) + 2:
+            if self.param_child is None:
+                self.param_child = _RouteNode()
+            return self.param_child
+        if segment not in self.partial_children:
+            self.partial_children[segment] = (_compile_segment_template(segment), _RouteNode())
+        return self.partial_children[segment][1]
+
+
+def _compile_segment_template(segment):
+    # type: (typing.Text) -> typing.Pattern[typing.Text]
+    pattern_parts = []
+    position = 0
+    for template_match in PATH_TEMPLATE_RE.finditer(segment):
+        pattern_parts.append(re.escape(segment[position:template_match.start()]))
+        pattern_parts.append('(.+?)')
+        position = template_match.end()
+    pattern_parts.append(re.escape(segment[position:]))
+    pattern_parts.append(r'\Z')
+    return re.compile(''.join(pattern_parts))
+
+
+def _split_path(path):
+    # type: (typing.Text) -> typing.List[typing.Text]
+    # paths are starting with /, so the first segment is always empty
+    return path.split('/')[1:]
+
+
+def _iter_routes(node, segments, index, path_values):
+    # type: (_RouteNode, typing.List[typing.Text], int, typing.List[typing.Text]) -> typing.Iterator[typing.Tuple[_Route, typing.List[typing.Text]]]  # noqa: E501
+    """Yield the routes matching segments[index:], by priority, with the values of the path templates."""
+    if index == len(segments):
+        if node.route is not None:
+            yield node.route, path_values
+        return
+
+    segment = segments[index]
+    static_child = node.static_children.get(segment)
+    if static_child is not None:
+        for match in _iter_routes(static_child, segments, index + 1, path_values):
+            yield match
+
+    for segment_re, partial_child in itervalues(node.partial_children):
+        segment_match = segment_re.match(segment)
+        if segment_match is not None:
+            for match in _iter_routes(partial_child, segments, index + 1, path_values + list(segment_match.groups())):
+                yield match
+
+    if node.param_child is not None and segment:
+        for match in _iter_routes(node.param_child, segments, index + 1, path_values + [segment]):
+            yield match
+
+
+class Router(object):
+    """Map requests (http method and path) to the operations of a Swagger spec.
+
+    Static path segments are preferred over templated ones, so ``/pet/findByStatus``
+    is not matched by ``/pet/{petId}``.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    """
+
+    def __init__(self, swagger_spec):
+        # type: (Spec) -> None
+        self.base_path = swagger_spec.spec_dict.get('basePath', '').rstrip('/')
+        self._root = _RouteNode()
+        for resource in itervalues(swagger_spec.resources):
+            for operation in itervalues(resource.operations):
+                self.add_operation(operation)
+
+    def add_operation(self, operation):
+        # type: (Operation) -> None
+        node = self._root
+        for segment in _split_path(operation.path_name):
+            node = node.add_child(segment)
+        if node.route is None:
+            node.route = _Route(
+                path_name=operation.path_name,
+                param_names=tuple(PATH_TEMPLATE_RE.findall(operation.path_name)),
+            )
+        node.route.add_operation(operation)
+
+    def match(self, http_method, path):
+        # type: (typing.Text, typing.Text) -> typing.Optional[RouteMatch]
+        """Return the operation matching the request.
+
+        If multiple paths are matching the request the first one, by priority, that
+        allows the http method is used.
+
+        :param http_method: http method of the request
+        :param path: request path, including the basePath of the spec. e.g. /v2/pet/123
+        :returns: the matching operation and the path parameters, None if no paths are
+            matching the request (ie. HTTP 404)
+        :rtype: :class:`RouteMatch`
+        """
+        if self.base_path:
+            if not path.startswith(self.base_path):
+                return None
+            path = path[len(self.base_path):]
+        if not path.startswith('/'):
+            return None
+
+        http_method = http_method.lower()
+        matching_routes = list(_iter_routes(self._root, _split_path(path), 0, []))
+        if not matching_routes:
+            return None
+
+        if len(matching_routes) == 1:
+            allowed_methods = matching_routes[0][0].allowed_methods
+        else:
+            allowed_methods = tuple(sorted(set(
+                allowed_method
+                for route, _ in matching_routes
+                for allowed_method in route.allowed_methods
+            )))
+        for route, path_values in matching_routes:
+            operation = route.operations.get(http_method)
+            if operation is not None:
+                return RouteMatch(
+                    operation=operation,
+                    path_params=dict(zip(route.param_names, path_values)),
+                    allowed_methods=allowed_methods,
+                )
+        return RouteMatch(
+            operation=None,
+            path_params={},
+            allowed_methods=allowed_methods,
+        )
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Attribution of the cost of marshaling, unmarshaling and validation to schemas.
+
+Generic profilers report the time spent in the functions building marshaling and
+unmarshaling plans (ie. ``partial`` or ``_unmarshal_object`` frames), which does not
+tell which schema is expensive. If ``schema_profiling`` config is enabled the plans
+created by :func:`bravado_core.marshal._get_marshaling_method`,
+:func:`bravado_core.unmarshal._get_unmarshaling_method` and the keyword validators of
+:func:`bravado_core.swagger20_validator.get_validator_type` report their calls to the
+:class:`SchemaProfiler` of the current :func:`profile_schemas` scope.
+
+.. code-block:: python
+
+    with profile_schemas() as profiler:
+        unmarshal_response(response, op)
+    print(profiler.format_report())  # Pet.tags[] 38.0%, Category 12.0%, ...
+
+Schemas are identified by their label:
+
+- the model name for model schemas (``Pet``),
+- the label of the enclosing schema followed by ``.<property name>``, ``[]`` (array items),
+  ``{}`` (additional properties) or ``.allOf[<index>]`` (same for anyOf and oneOf) for
+  schemas nested in other schemas (``Pet.tags[]``),
+- the JSON pointer of the remaining schemas (``#/paths/~1pets/get/responses/200/schema``).
+
+Profiling is deterministic: the time and the net number of memory blocks allocated
+(check :func:`sys.getallocatedblocks`) by each schema are measured exclusive of the
+nested schemas. The number of blocks is negative for schemas releasing more memory
+than they allocate, ie. temporary values created by their nested schemas.
+
+Outside of a :func:`profile_schemas` scope the profiled plans cost only a context
+variable lookup per call, but keep ``schema_profiling`` disabled in production anyway.
+
+NOTE: profiled keyword validators evaluate all the errors of a schema before reporting
+the first one, so validation of invalid values could be slower than without profiling.
+"""
+import contextlib
+import contextvars
+import sys
+import threading
+import typing
+import weakref
+from timeit import default_timer
+
+from six import iteritems
+
+from bravado_core.schema import is_dict_like
+from bravado_core.schema import is_list_like
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core._compat_typing import JSONDict
+    from bravado_core._compat_typing import UnmarshalingMethod
+    from bravado_core.spec import Spec
+
+
+def _no_allocated_blocks():
+    # type: () -> int
+    return 0
+
+
+class SchemaProfileEntry(
+    typing.NamedTuple(
+        'SchemaProfileEntry',
+        [
+            ('label', typing.Text),
+            ('calls', int),
+            ('time', float),
+            ('time_percentage', float),
+            ('allocated_blocks', int),
+        ],
+    ),
+):
+    """Cost attributed to a schema by :meth:`SchemaProfiler.report`.
+
+    :param label: label of the schema (check :func:`get_schema_label`)
+    :param calls: number of marshaling, unmarshaling and keyword validator calls
+    :param time: time, in seconds, spent processing values of the schema (nested schemas excluded)
+    :param time_percentage: share, in percentage, of the time of all the profiled schemas
+    :param allocated_blocks: net number of memory blocks allocated processing values of the
+        schema (nested schemas excluded), negative if more blocks were released. 0 if the
+        profiler does not count allocations.
+    """
+
+
+class SchemaProfiler(object):
+    """Collects the costs of the schemas processed in a :func:`profile_schemas` scope.
+
+    NOTE: profilers are not thread-safe, use a profiler per thread.
+
+    :param count_allocations: count the allocated memory blocks. Counting them is
+        relatively expensive, so disable it to get more accurate timings.
+    """
+
+    def __init__(self, count_allocations=True):
+        # type: (bool) -> None
+        self._get_allocated_blocks = sys.getallocatedblocks if count_allocations else _no_allocated_blocks
+        # (key, value) = (schema label, [calls, time, allocated blocks])
+        self._stats = {}  # type: typing.Dict[typing.Text, typing.List[typing.Any]]
+        # [time, allocated blocks] of the nested schemas of the running calls
+        self._stack = []  # type: typing.List[typing.List[typing.Any]]
+
+    def run(self, label, func, args):
+        # type: (typing.Text, typing.Callable[..., typing.Any], typing.Tuple[typing.Any, ...]) -> typing.Any
+        """Call ``func(*args)`` attributing its cost to the schema identified by label."""
+        nested_costs = [0.0, 0]
+        self._stack.append(nested_costs)
+        start_blocks = self._get_allocated_blocks()
+        start_time = default_timer()
+        try:
+            return func(*args)
+        finally:
+            time = default_timer() - start_time
+            blocks = self._get_allocated_blocks() - start_blocks
+            self._stack.pop()
+            if self._stack:
+                parent_costs = self._stack[-1]
+                parent_costs[0] += time
+                parent_costs[1] += blocks
+
+            stats = self._stats.get(label)
+            if stats is None:
+                stats = self._stats[label] = [0, 0.0, 0]
+            stats[0] += 1
+            stats[1] += time - nested_costs[0]
+            stats[2] += blocks - nested_costs[1]
+
+    def reset(self):
+        # type: () -> None
+        """Forget the costs collected so far."""
+        self._stats.clear()
+
+    def report(self):
+        # type: () -> typing.List[SchemaProfileEntry]
+        """Costs of the processed schemas, most expensive first."""
+        total_time = sum(stats[1] for stats in self._stats.values())
+        entries = [
+            SchemaProfileEntry(
+                label=label,
+                calls=calls,
+                time=time,
+                time_percentage=100.0 * time / total_time if total_time > 0 else 0.0,
+                allocated_blocks=allocated_blocks,
+            )
+            for label, (calls, time, allocated_blocks) in iteritems(self._stats)
+        ]
+        entries.sort(key=lambda entry: (-entry.time, entry.label))
+        return entries
+
+    def format_report(self, limit=None):
+        # type: (typing.Optional[int]) -> typing.Text
+        """Human readable report, ie. ``Pet.tags[] 38.0%, Category 12.0%``.
+
+        :param limit: maximum number of reported schemas, None reports all of them
+        """
+        return ', '.join(
+            '{0} {1:.1f}%'.format(entry.label, entry.time_percentage)
+            for entry in self.report()[:limit]
+        )
+
+
+_current_profiler = contextvars.ContextVar(
+    'bravado_core_schema_profiler', default=None,
+)  # type: contextvars.ContextVar[typing.Optional[SchemaProfiler]]
+
+
+@contextlib.contextmanager
+def profile_schemas(profiler=None):
+    # type: (typing.Optional[SchemaProfiler]) -> typing.Iterator[SchemaProfiler]
+    """Context manager collecting the costs of the schemas processed in its scope.
+
+    Only Specs with ``schema_profiling`` config enabled report their costs.
+
+    :param profiler: profiler collecting the costs, a new one is created if not provided.
+        Use it to accumulate the costs of multiple scopes.
+    """
+    if profiler is None:
+        profiler = SchemaProfiler()
+    token = _current_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _current_profiler.reset(token)
+
+
+_schema_labels = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[Spec, typing.Dict[int, typing.Text]]
+_schema_labels_lock = threading.Lock()
+
+
+def _escape_pointer_token(token):
+    # type: (typing.Text) -> typing.Text
+    return token.replace('~', '~0').replace('/', '~1')
+
+
+def _label_schema(swagger_spec, labels, schema, label):
+    # type: (Spec, typing.Dict[int, typing.Text], typing.Any, typing.Text) -> None
+    schema = swagger_spec.deref(schema)
+    if not is_dict_like(schema) or id(schema) in labels:
+        return
+    label = schema.get('x-model', label)
+    labels[id(schema)] = label
+
+    for prop_name, prop_schema in iteritems(schema.get('properties') or {}):
+        _label_schema(swagger_spec, labels, prop_schema, '{0}.{1}'.format(label, prop_name))
+    items = schema.get('items')
+    if is_list_like(items):
+        for index, item_schema in enumerate(items):
+            _label_schema(swagger_spec, labels, item_schema, '{0}[{1}]'.format(label, index))
+    else:
+        _label_schema(swagger_spec, labels, items, '{0}[]'.format(label))
+    _label_schema(swagger_spec, labels, schema.get('additionalProperties'), '{0}{{}}'.format(label))
+    for keyword in ('allOf', 'anyOf', 'oneOf'):
+        for index, sub_schema in enumerate(schema.get(keyword) or ()):
+            _label_schema(swagger_spec, labels, sub_schema, '{0}.{1}[{2}]'.format(label, keyword, index))
+
+
+def _label_parameters(swagger_spec, labels, parameters, pointer):
+    # type: (Spec, typing.Dict[int, typing.Text], typing.Any, typing.Text) -> None
+    for index, param_spec in enumerate(parameters or ()):
+        param_spec = swagger_spec.deref(param_spec)
+        param_pointer = '{0}/{1}'.format(pointer, index)
+        if 'schema' in param_spec:
+            _label_schema(swagger_spec, labels, param_spec['schema'], param_pointer + '/schema')
+        else:
+            # Non body parameters are unmarshaled and validated as schemas
+            _label_schema(swagger_spec, labels, param_spec, param_pointer)
+
+
+def _label_responses(swagger_spec, labels, responses, pointer):
+    # type: (Spec, typing.Dict[int, typing.Text], typing.Any, typing.Text) -> None
+    for status_code, response_spec in iteritems(responses or {}):
+        response_spec = swagger_spec.deref(response_spec)
+        if 'schema' in response_spec:
+            _label_schema(
+                swagger_spec, labels, response_spec['schema'],
+                '{0}/{1}/schema'.format(pointer, _escape_pointer_token(str(status_code))),
+            )
+
+
+def _label_spec_dict(swagger_spec, labels, spec_dict):
+    # type: (Spec, typing.Dict[int, typing.Text], JSONDict) -> None
+    # Label definitions first, so schemas nested in models are labelled relatively to them
+    for definition_name, definition_spec in iteritems(spec_dict.get('definitions') or {}):
+        _label_schema(
+            swagger_spec, labels, definition_spec,
+            '#/definitions/{0}'.format(_escape_pointer_token(definition_name)),
+        )
+    for path_name, path_spec in iteritems(spec_dict.get('paths') or {}):
+        path_pointer = '#/paths/{0}'.format(_escape_pointer_token(path_name))
+        path_spec = swagger_spec.deref(path_spec)
+        for key, operation_spec in iteritems(path_spec):
+            if key == 'parameters':
+                _label_parameters(swagger_spec, labels, operation_spec, path_pointer + '/parameters')
+            elif is_dict_like(operation_spec):
+                operation_pointer = '{0}/{1}'.format(path_pointer, key)
+                _label_parameters(swagger_spec, labels, operation_spec.get('parameters'), operation_pointer + '/parameters')
+                _label_responses(swagger_spec, labels, operation_spec.get('responses'), operation_pointer + '/responses')
+    for param_name, param_spec in iteritems(spec_dict.get('parameters') or {}):
+        param_spec = swagger_spec.deref(param_spec)
+        param_pointer = '#/parameters/{0}'.format(_escape_pointer_token(param_name))
+        _label_schema(swagger_spec, labels, param_spec.get('schema', param_spec), param_pointer)
+    _label_responses(swagger_spec, labels, spec_dict.get('responses'), '#/responses')
+
+
+def _build_schema_labels(swagger_spec):
+    # type: (Spec) -> typing.Dict[int, typing.Text]
+    # (key, value) = (id of a schema of swagger_spec, label)
+    # Schemas are kept alive by swagger_spec, so their ids are not reused
+    labels = {}  # type: typing.Dict[int, typing.Text]
+    _label_spec_dict(swagger_spec, labels, swagger_spec._internal_spec_dict)
+    if swagger_spec.spec_dict is not swagger_spec._internal_spec_dict:
+        # internally_dereference_refs is enabled, schemas of spec_dict could be used as well
+        _label_spec_dict(swagger_spec, labels, swagger_spec.spec_dict)
+    return labels
+
+
+def _get_anonymous_schema_label(swagger_spec, schema):
+    # type: (Spec, JSONDict) -> typing.Text
+    # Schemas that are not part of swagger_spec, ie. provided to unmarshal_schema_object
+    if schema.get('x-model'):
+        return schema['x-model']
+    items = schema.get('items')  # type: typing.Any
+    if is_dict_like(items):
+        return get_schema_label(swagger_spec, items) + '[]'
+    return '<anonymous>'
+
+
+def _get_schema_labels(swagger_spec):
+    # type: (Spec) -> typing.Dict[int, typing.Text]
+    with _schema_labels_lock:
+        labels = _schema_labels.get(swagger_spec)
+        if labels is None:
+            labels = _schema_labels[swagger_spec] = _build_schema_labels(swagger_spec)
+        return labels
+
+
+def get_schema_label(swagger_spec, schema):
+    # type: (Spec, JSONDict) -> typing.Text
+    """Label identifying schema in the reports of :class:`SchemaProfiler`.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :param schema: schema, or reference to a schema, of swagger_spec
+    """
+    labels = _get_schema_labels(swagger_spec)
+    label = labels.get(id(schema))
+    if label is None:
+        schema = swagger_spec.deref(schema)
+        label = labels.get(id(schema))
+        if label is None:
+            label = _get_anonymous_schema_label(swagger_spec, schema)
+    return label
+
+
+def profile_method(swagger_spec, schema, method):
+    # type: (Spec, JSONDict, UnmarshalingMethod) -> UnmarshalingMethod
+    """Wrap the marshaling or unmarshaling method of schema (same signature) so that its calls are
+    reported to the profiler of the current :func:`profile_schemas` scope."""
+    # Evaluated on first profiled call, so plans are built without labelling the schemas
+    label = []  # type: typing.List[typing.Text]
+
+    def profiled_method(value):
+        # type: (typing.Any) -> typing.Any
+        profiler = _current_profiler.get()
+        if profiler is None:
+            return method(value)
+        if not label:
+            label.append(get_schema_label(swagger_spec, schema))
+        return profiler.run(label[0], method, (value,))
+
+    return profiled_method
+
+
+def profile_keyword_validator(swagger_spec, keyword_validator):
+    # type: (Spec, typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]
+    """Wrap a jsonschema keyword validator so that its calls are reported, as calls of
+    the schema containing the keyword, to the profiler of the current :func:`profile_schemas` scope."""
+    def profiled_keyword_validator(validator, value, instance, schema):
+        # type: (typing.Any, typing.Any, typing.Any, JSONDict) -> typing.Any
+        profiler = _current_profiler.get()
+        if profiler is None:
+            return keyword_validator(validator, value, instance, schema)
+
+        def collect_errors():
+            # type: () -> typing.List[typing.Any]
+            # Keyword validators are (lazy) generators, evaluate them while profiling
+            return list(keyword_validator(validator, value, instance, schema) or ())
+
+        return iter(profiler.run(get_schema_label(swagger_spec, schema), collect_errors, ()))
+
+    return profiled_keyword_validator
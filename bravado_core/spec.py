@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
+import gc
 import json
 import logging
 import os.path
+import re
 import typing
 import warnings
 from copy import deepcopy
@@ -28,26 +30,41 @@ except ImportError:
 
 from bravado_core import formatter
 from bravado_core import version as _version
+from bravado_core.codec import _check_msgpack_timestamps_support
+from bravado_core.codec import get_json_codec
 from bravado_core.exception import SwaggerSchemaError
 from bravado_core.exception import SwaggerValidationError
 from bravado_core.formatter import return_true_wrapper
 from bravado_core.model import _from_pickleable_representation
-from bravado_core.model import _to_pickleable_representation
+from bravado_core.model import create_model_type
 from bravado_core.model import Model
 from bravado_core.model import model_discovery
+from bravado_core.model import register_model_types
 from bravado_core.resource import build_resources
+from bravado_core.router import Router
 from bravado_core.schema import is_dict_like
 from bravado_core.schema import is_list_like
 from bravado_core.schema import is_ref
 from bravado_core.security_definition import SecurityDefinition
 from bravado_core.spec_flattening import flattened_spec
 from bravado_core.util import cached_property
+from bravado_core.util import deep_getsizeof
+from bravado_core.util import fingerprint
+from bravado_core.util import is_same_content
 from bravado_core.util import memoize_by_id
 from bravado_core.util import strip_xscope
+from bravado_core.util import strip_xscope_view
+from bravado_core.warmup import warmup_spec
 
 
 if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core.codec import JsonCodec
+    from bravado_core.formatter import FormatCacheStats
+    from bravado_core.instrumentation import InstrumentationCallback
     from bravado_core.formatter import SwaggerFormat
+    from bravado_core.resource import Resource
+    from bravado_core.router import RouteMatch
+    from bravado_core.warmup import WarmupReport
 
     T = typing.TypeVar('T')
 
@@ -102,9 +119,112 @@ CONFIG_DEFAULTS = {
     # If False, use str() function for 'byte' format
     # If True, encode/decode base64 data for 'byte' format
     'use_base64_for_byte_format': False,
+
+    # Release, once the build is completed, the spec representations that are only needed while building.
+    # If internally_dereference_refs is enabled flattened_spec (already dereferenced into the internal spec)
+    # and the resolver (and the copies of all the referenced specs that it stores) are dropped.
+    # NOTE: dropped attributes are lazily re-created if accessed
+    'discard_build_artifacts': False,
+
+    # Eagerly build, at the end of Spec.build, the marshaling, unmarshaling and validation plans
+    # of the operations, so the first requests do not pay for their creation.
+    # If True all the operations are warmed up. Use a list of operationIds and/or tags to warm
+    # up only the selected operations. Check Spec.warmup_report for the outcome.
+    'warmup': False,
+
+    # JSON codec used to encode and decode request and response bodies (check bravado_core.codec).
+    # Use the name of a known codec (json, simplejson or orjson) or a bravado_core.codec.JsonCodec instance.
+    # If set, bodies are decoded from the raw bytes of requests and responses.
+    # If None, bodies are encoded via simplejson and decoded via the json() method of requests and responses.
+    'json_codec': None,
+
+    # Encode date-time values of msgpack bodies via the msgpack Timestamp extension type, instead of strings,
+    # and decode Timestamp values of msgpack bodies directly into datetime objects. Requires msgpack>=1.0
+    # (Spec.build raises ValueError with older versions).
+    # Validation accepts both string and datetime values for date-time schemas.
+    'msgpack_timestamps': False,
+
+    # Unmarshal non-body array parameters (ie. collectionFormat query parameters) with integer
+    # or number items into array.array values instead of lists. Conversion happens after validation.
+    'typed_array_params': False,
+
+    # Copy uploaded files (formData parameters of type file) into SpooledUpload objects (check
+    # bravado_core.upload), kept in memory up to upload_spool_size bytes and in a temporary file afterwards.
+    'spool_uploads': False,
+    'upload_spool_size': 1024 * 1024,
+
+    # Maximum size, in bytes, of uploaded files, enforced while spooling them (requires spool_uploads).
+    # Oversized uploads raise UploadTooLargeError. None means no limit.
+    'upload_max_size': None,
+
+    # Payloads bigger than this number of bytes are unmarshaled and validated in an executor
+    # by the bravado_core.aio functions, smaller payloads are processed inline in the event loop.
+    'async_offload_threshold': 64 * 1024,
+
+    # Create model types with a slot for each property (check bravado_core.model.SlottedModel)
+    # instead of storing the property values in a per instance dictionary.
+    'slotted_models': False,
+
+    # If include_missing_properties is enabled, store only the properties set in model instances
+    # (check bravado_core.model.SparseModel) instead of storing None for the missing ones.
+    # Ignored if slotted_models is enabled.
+    'sparse_models': False,
+
+    # Share identical values (strings, numbers and small sub-objects, frozen) within the values
+    # returned by unmarshal_schema_object, ie. unmarshaled responses. Check bravado_core.interning
+    'intern_values': False,
+
+    # If intern_values is enabled, share values across unmarshal_schema_object calls as well
+    # via a per Spec LRU cache holding this number of values. 0 disables the cache.
+    'intern_cache_size': 0,
+
+    # Cache the conversions to python of the formats in this mapping (format name, maximum number
+    # of cached conversions), ie. {'date-time': 1024}. Only immutable results are cached.
+    # Check bravado_core.formatter.FormatCache and Spec.format_cache_stats
+    'cached_formats': {},
+
+    # Attribute the cost of marshaling, unmarshaling and validation to the processed schemas
+    # (model names or JSON pointers) in the scope of bravado_core.schema_profiler.profile_schemas.
+    # Meant for performance investigations, check bravado_core.schema_profiler
+    'schema_profiling': False,
 }
 
 
+def _is_meta_schema_uri(uri):
+    # type: (typing.Text) -> bool
+    # jsonschema resolvers store the JSON Schema meta-schemas
+    return re.match(r'http://json-schema.org/draft-\d+/schema', uri) is not None
+
+
+# Version of the pickle format created by Spec.__getstate__
+# 1: the whole Spec instance (no __pickle_format__ in the state)
+# 2: spec documents, configuration and model types. Derived structures are lazily re-built
+_PICKLE_FORMAT = 2
+
+# Spec attributes not stored by Spec.__getstate__ as they can be re-built from the pickled ones.
+_NOT_PICKLED_ATTRIBUTES = frozenset((
+    # RefResolver is not easily pickleable. As there are no real benefits on re-using the same
+    # Resolver respect to build a new one we're going to ignore the field and eventually
+    # re-create it if needed via cached_property
+    'resolver',
+    # Resources, operations and params have back-references to the Spec instance and are
+    # cheaper to re-build than to unpickle. Check Spec.resources
+    'resources',
+    '_request_to_op_map',
+    '_router',
+    # Derived by spec_dict via cached_property
+    'flattened_spec',
+    'client_spec_dict',
+    '_security_definitions',
+    # Derived by config via cached_property (codec functions are not necessarily pickleable)
+    'json_codec',
+    # Runtime defined types are not directly pickleable, check Spec.__getstate__
+    'definitions',
+    # Callbacks are not necessarily pickleable and are specific to the process that registered them
+    'instrumentation_callbacks',
+))
+
+
 def _identity(obj):
     # type: (T) -> T
     return obj
@@ -145,10 +265,19 @@ class Spec(object):
         # Built on-demand - see get_op_for_request(..)
         self._request_to_op_map = None
 
+        # Built on-demand - see match_request(..)
+        self._router = None  # type: typing.Optional[Router]
+
         # (key, value) = (format name, SwaggerFormat)
         self.user_defined_formats = {}
         self.format_checker = FormatChecker()
 
+        # Outcome of the warmup performed by build, if enabled via warmup config
+        self.warmup_report = None  # type: typing.Optional[WarmupReport]
+
+        # Callbacks receiving the phase timings, check add_instrumentation_callback
+        self.instrumentation_callbacks = ()  # type: typing.Tuple[InstrumentationCallback, ...]
+
         # spec dict used to build resources, in case internally_dereference_refs config is enabled
         # it will be overridden by the dereferenced specs (by build method). More context in PR#263
         self._internal_spec_dict = spec_dict
@@ -183,6 +312,21 @@ class Spec(object):
         if not isinstance(other, self.__class__):
             return False
 
+        # Specs with different content are not equal, there is no need to inspect all the attributes.
+        if self.fingerprint != other.fingerprint:
+            return False
+
+        # Matching fingerprints are confirmed by a deep comparison of the specs content
+        if not is_same_content(self.spec_dict, other.spec_dict):
+            return False
+        referenced_specs = self._fingerprinted_referenced_specs()
+        other_referenced_specs = other._fingerprinted_referenced_specs()
+        if len(referenced_specs) != len(other_referenced_specs) or not all(
+            is_same_content(document, other_document)
+            for (_, document), (_, other_document) in zip(referenced_specs, other_referenced_specs)
+        ):
+            return False
+
         # If self and other are of the same type but not pointing to the same memory location then we're going to inspect
         # all the attributes.
         for attr_name in set(chain(iterkeys(self.__dict__), iterkeys(other.__dict__))):
@@ -191,16 +335,22 @@ class Spec(object):
             if attr_name in {
                 'format_checker',   # jsonschema.FormatChecker does not define an equality method
                 'resolver',         # jsonschema.validators.RefResolver does not define an equality method
+                '_router',          # bravado_core.router.Router does not define an equality method
                 'http_client',      # this attribute may be different for the same values
+                'warmup_report',    # warmup duration is different for every execution
+                'instrumentation_callbacks',  # callbacks are not part of the spec content
             }:
                 continue
 
-            # In case of fully dereferenced specs _deref_flattened_spec (and consequently _internal_spec_dict) will contain
-            # recursive reference to objects. Python is not capable of comparing them (weird).
-            # As _internal_spec_dict and _deref_flattened_spec are private so we don't expect users modifying them.
-            if self.config['internally_dereference_refs'] and attr_name in {
+            # The spec trees are derived by the spec content (already compared above), origin_url and config.
+            # NOTE: in case of fully dereferenced specs _deref_flattened_spec (and consequently _internal_spec_dict) will
+            # contain recursive reference to objects. Python is not capable of comparing them (weird).
+            if attr_name in {
+                'spec_dict',
                 '_internal_spec_dict',
+                'flattened_spec',
                 '_deref_flattened_spec',
+                'client_spec_dict',
             }:
                 continue
 
@@ -258,29 +408,42 @@ class Spec(object):
         state = {
             k: v
             for k, v in iteritems(self.__dict__)
-            if k not in (
-                # Exclude resolver as it is not easily pickleable. As there are no real
-                # benefits on re-using the same Resolver respect to build a new one
-                # we're going to ignore the field and eventually re-create it if needed
-                # via cached_property
-                'resolver',
-                # Exclude definitions because it contain runtime defined type and those
-                # are not directly pickleable.
-                # Check bravado_core.model._to_pickleable_representation for details.
-                'definitions',
-            )
+            if k not in _NOT_PICKLED_ATTRIBUTES
         }
 
         # A possible approach would be to re-execute model discovery on the newly Spec
         # instance (in __setstate__) but it would be very slow.
-        # To avoid model discovery we store a pickleable representation of the Model types
-        # such that we can re-create them.
-        state['definitions'] = {
-            model_name: _to_pickleable_representation(model_name, model_type)
-            for model_name, model_type in iteritems(self.definitions)
-        }
-        # Store the bravado-core version used to create the Spec state
+        # To avoid model discovery we store a compact representation of the Model types
+        # such that we can re-create them. The Spec instances referred by the models are
+        # stored by index: 0 is self, the others are the Spec instances created by model
+        # discovery (ie. internally_dereference_refs is enabled) which are stored as
+        # (spec_dict, origin_url, config) as they share http_client and definitions with self.
+        model_specs = [self]  # type: typing.List[Spec]
+        models = []
+        for model_name, model_type in iteritems(self.definitions):
+            model_swagger_spec = model_type._swagger_spec
+            for model_spec_index, known_spec in enumerate(model_specs):
+                if known_spec is model_swagger_spec:
+                    break
+            else:
+                model_spec_index = len(model_specs)
+                model_specs.append(model_swagger_spec)
+            models.append((
+                model_spec_index,
+                model_name,
+                model_type._json_reference,
+                model_type._model_spec,
+                model_type.__bases__,
+            ))
+        state['definitions'] = models
+        state['__model_specs__'] = [
+            (model_spec.spec_dict, model_spec.origin_url, model_spec.config)
+            for model_spec in model_specs[1:]
+        ]
+
+        # Store the bravado-core version and the format used to create the Spec state
         state['__bravado_core_version__'] = _version
+        state['__pickle_format__'] = _PICKLE_FORMAT
         return state
 
     def __setstate__(self, state):
@@ -297,13 +460,84 @@ class Spec(object):
                 category=UserWarning,
             )
 
-        # Re-create Model types, avoiding model discovery
-        state['definitions'] = {
-            model_name: _from_pickleable_representation(pickleable_representation)
-            for model_name, pickleable_representation in iteritems(state['definitions'])
-        }
         self.__dict__.clear()
+        self.instrumentation_callbacks = ()
+        if state.pop('__pickle_format__', 1) == 1:
+            # State created by a bravado-core version that pickles the whole Spec instance
+            state['definitions'] = {
+                model_name: _from_pickleable_representation(pickleable_representation)
+                for model_name, pickleable_representation in iteritems(state['definitions'])
+            }
+            self.__dict__.update(state)
+            return
+
+        models = state.pop('definitions')
+        model_specs = [self]  # type: typing.List[Spec]
+        for spec_dict, origin_url, config in state.pop('__model_specs__'):
+            model_specs.append(Spec(spec_dict, origin_url, state['http_client'], config))
+
         self.__dict__.update(state)
+        # resources are lazily re-built, check Spec.resources
+        self._request_to_op_map = None
+        self._router = None
+        self.definitions = {}
+        for model_spec in model_specs[1:]:
+            model_spec.definitions = self.definitions
+        for model_spec_index, model_name, json_reference, model_spec, bases in models:
+            self.definitions[model_name] = create_model_type(
+                swagger_spec=model_specs[model_spec_index],
+                model_name=model_name,
+                model_spec=model_spec,
+                bases=bases,
+                json_reference=json_reference,
+            )
+        if 'fingerprint' in self.__dict__:
+            register_model_types(self)
+
+    @cached_property
+    def resources(self):
+        # type: () -> typing.Mapping[typing.Text, Resource]
+        """Resources of the spec, lazily re-built if the instance has been unpickled.
+
+        NOTE: the attribute is set by :meth:`build`, so this property is evaluated only
+        for unpickled instances.
+        """
+        return build_resources(self)
+
+    @cached_property
+    def fingerprint(self):
+        # type: () -> typing.Text
+        """Content fingerprint of the Swagger specs (spec_dict and the specs referenced by it).
+
+        Specs with the same content, regardless of x-scope metadata and of the location of the
+        referenced specs, have the same fingerprint.
+        Check :func:`bravado_core.util.fingerprint` for details.
+
+        NOTE: the fingerprint is evaluated once (by :meth:`build`), later modifications of the specs are not detected.
+        """
+        referenced_specs_fingerprints = [
+            document_fingerprint
+            for document_fingerprint, _ in self._fingerprinted_referenced_specs()
+        ]
+        return fingerprint([self.spec_dict, referenced_specs_fingerprints])
+
+    def _fingerprinted_referenced_specs(self):
+        # type: () -> typing.List[typing.Tuple[typing.Text, typing.Any]]
+        """Fingerprints and documents of the specs referenced by spec_dict, sorted by fingerprint."""
+        return sorted(
+            (
+                (fingerprint(document), document)
+                for uri, document in iteritems(self.resolver.store)
+                if document is not self.spec_dict and not _is_meta_schema_uri(uri)
+            ),
+            key=lambda fingerprinted_document: fingerprinted_document[0],
+        )
+
+    @cached_property
+    def json_codec(self):
+        # type: () -> typing.Optional[JsonCodec]
+        """JSON codec configured via json_codec config, None if not configured."""
+        return get_json_codec(self.config['json_codec'])
 
     @cached_property
     def client_spec_dict(self):
@@ -341,6 +575,16 @@ class Spec(object):
         """
         return strip_xscope(self.spec_dict)
 
+    @property
+    def client_spec_view(self):
+        """Return a read-only view of spec_dict with x-scope metadata hidden.
+
+        Alternative to :attr:`client_spec_dict` that does not copy spec_dict, useful
+        if the client spec is only serialized (ie. ``simplejson.dumps(spec.client_spec_view, for_json=True)``).
+        Check :func:`bravado_core.util.strip_xscope_view` for details.
+        """
+        return strip_xscope_view(self.spec_dict)
+
     @classmethod
     def from_dict(cls, spec_dict, origin_url=None, http_client=None, config=None):
         """Build a :class:`Spec` from Swagger API Specification
@@ -364,10 +608,18 @@ class Spec(object):
             )
 
     def build(self):
+        if self.config['msgpack_timestamps']:
+            # Fail early instead of while encoding or decoding the first msgpack body
+            _check_msgpack_timestamps_support()
+
         self._validate_spec()
 
         model_discovery(self)
 
+        # Register the model types, so that model instances can be pickled. The types are registered
+        # by fingerprint, evaluated now while all the referenced specs are available in the resolver
+        register_model_types(self)
+
         if self.config['internally_dereference_refs']:
             # Avoid to evaluate is_ref every time, no references are possible at this time
             self.deref = _identity
@@ -384,6 +636,70 @@ class Spec(object):
             use_spec_url_for_base_path=self.config['use_spec_url_for_base_path'],
         )
 
+        warmup = self.config['warmup']
+        if warmup:
+            self.warmup_report = warmup_spec(self, names=None if warmup is True else warmup)
+
+        if self.config['discard_build_artifacts'] and self.config['internally_dereference_refs']:
+            # Marshaling, unmarshaling and validation use the fully dereferenced spec, so the flattened
+            # copy and the specs stored by the resolver are not needed anymore.
+            for attr_name in ('flattened_spec', 'resolver'):
+                self.__dict__.pop(attr_name, None)
+
+    def prepare_for_fork(self):
+        # type: () -> None
+        """Prepare the instance to be shared with forked processes (ie. workers of pre-fork servers).
+
+        All the structures lazily built while processing requests and responses (marshaling, unmarshaling
+        and validation plans of all the operations, lazy class attributes of the models) are eagerly created,
+        then the objects tracked by the garbage collector are moved to the permanent generation.
+        In this way the children processes will not modify, while serving the first requests or while
+        performing garbage collections, the memory pages inherited from the parent process, which could
+        then be shared instead of being copied by every child.
+
+        NOTE: this is meant to be called in the parent process, on a built Spec, right before forking.
+        """
+        warmup_spec(self)
+        # Release garbage before freezing, otherwise it would never be collected
+        gc.collect()
+        gc.freeze()
+
+    def memory_report(self):
+        # type: () -> typing.Dict[typing.Text, int]
+        """Estimate the memory retained by the spec representations held by this instance.
+
+        Structures are inspected in the reported order and every object is accounted to the first
+        structure that contains it, so objects shared between structures (ie. spec_dict and
+        _internal_spec_dict if internally_dereference_refs is disabled) are counted only once.
+        Lazily built structures that have not been created yet are reported with size 0.
+
+        :return: mapping between structure name and its estimated size in bytes. The ``total`` key
+            contains the sum of all the structures.
+        """
+        resolver = self.__dict__.get('resolver')
+        resolver_store = [
+            document
+            for uri, document in iteritems(resolver.store)
+            # JSON schema meta-schemas are shared by all the resolvers, so they are not accounted
+            if not _is_meta_schema_uri(uri)
+        ] if resolver is not None else None
+
+        seen = set()  # type: typing.Set[int]
+        report = {}
+        for name, structure in (
+            ('spec_dict', self.spec_dict),
+            ('_internal_spec_dict', self._internal_spec_dict),
+            ('flattened_spec', self.__dict__.get('flattened_spec')),
+            ('_deref_flattened_spec', self.__dict__.get('_deref_flattened_spec')),
+            ('client_spec_dict', self.__dict__.get('client_spec_dict')),
+        ):
+            report[name] = 0 if structure is None else deep_getsizeof(structure, seen)
+        report['resolver_store'] = 0 if resolver_store is None else sum(
+            deep_getsizeof(document, seen) for document in resolver_store
+        )
+        report['total'] = sum(report.values())
+        return report
+
     def get_ref_handlers(self):
         """Get mapping from URI schemes to handlers that takes a URI.
 
@@ -442,6 +758,49 @@ class Spec(object):
         key = (http_method.lower(), path_pattern)
         return self._request_to_op_map.get(key)
 
+    def match_request(self, http_method, path):
+        # type: (typing.Text, typing.Text) -> typing.Optional[RouteMatch]
+        """Return the Swagger operation for the passed in request http method
+        and path. Unlike :meth:`get_op_for_request` the path is the actual path
+        of the request, so server-side implementations do not need to match the
+        path templates themselves.
+
+        :param http_method: http method of the request
+        :param path: request path. e.g. /foo/1/baz/2
+        :returns: the matching operation and the values of the path parameters,
+            None if a match couldn't be found. If the path is matching but the http
+            method is not allowed the operation is None and allowed_methods lists
+            the allowed methods.
+        :rtype: :class:`bravado_core.router.RouteMatch`
+        """
+        if self._router is None:
+            # lazy initialization
+            self._router = Router(self)
+        return self._router.match(http_method, path)
+
+    def add_instrumentation_callback(self, callback):
+        # type: (InstrumentationCallback) -> None
+        """Register a callback receiving the timings of the phases of request and response processing.
+
+        The callback is called with ``(operation_id, phase, duration, payload_size)`` at the
+        end of every phase (check :mod:`bravado_core.instrumentation` for the phases).
+        Callbacks are not pickled with the Spec instance.
+
+        :param callback: callable accepting 4 positional arguments
+        """
+        # Replaced, instead of modified, so that phases running in other threads see a consistent tuple
+        self.instrumentation_callbacks = getattr(self, 'instrumentation_callbacks', ()) + (callback,)
+
+    def remove_instrumentation_callback(self, callback):
+        # type: (InstrumentationCallback) -> None
+        """Unregister a callback registered via :meth:`add_instrumentation_callback`.
+
+        :raises ValueError: if the callback is not registered
+        """
+        callbacks = list(getattr(self, 'instrumentation_callbacks', ()))
+        callbacks.remove(callback)
+        self.instrumentation_callbacks = tuple(callbacks)
+
     def register_format(self, user_defined_format):
         """Registers a user-defined format to be used with this spec.
 
@@ -472,6 +831,19 @@ class Spec(object):
             )
         return user_defined_format
 
+    def format_cache_stats(self):
+        # type: () -> typing.Dict[typing.Text, FormatCacheStats]
+        """Statistics of the caches of the formats listed in ``cached_formats`` config.
+
+        Caches are created the first time that values of their format are unmarshaled.
+
+        :return: mapping between format name and :class:`bravado_core.formatter.FormatCacheStats`
+        """
+        return {
+            format_name: format_cache.stats()
+            for format_name, format_cache in iteritems(formatter.get_format_caches(self))
+        }
+
     @cached_property
     def _security_definitions(self):
         # type: () -> typing.Dict[typing.Text, SecurityDefinition]
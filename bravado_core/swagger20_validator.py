@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import datetime
 import functools
 import typing
 
@@ -7,12 +8,14 @@ from jsonschema import RefResolver
 from jsonschema import validators
 from jsonschema.exceptions import ValidationError
 from jsonschema.validators import Draft4Validator
+from six import iteritems
 from swagger_spec_validator.ref_validators import in_scope
 
 from bravado_core.model import MODEL_MARKER
 from bravado_core.schema import is_param_spec
 from bravado_core.schema import is_prop_nullable
 from bravado_core.schema import is_required
+from bravado_core.schema_profiler import profile_keyword_validator
 from bravado_core.util import memoize_by_id
 
 
@@ -87,6 +90,7 @@ def type_validator(
     of letting the downstream `required_validator` do its job.
     Also skip when a Swagger property value is None and the schema contains
     the extension field `x-nullable` set to True.
+    Also skip datetime values of date-time schemas, if msgpack_timestamps is enabled.
     In all other cases, delegate to the existing Draft4 `type` validator.
 
     :param swagger_spec: needed for access to deref()
@@ -106,6 +110,14 @@ def type_validator(
     ):
         return
 
+    if (
+        isinstance(instance, datetime.datetime) and
+        schema.get('format') == 'date-time' and
+        swagger_spec.config['msgpack_timestamps']
+    ):
+        # date-time values of msgpack bodies are encoded as msgpack Timestamp
+        return
+
     for error in _DRAFT4_TYPE_VALIDATOR(validator, types, instance, schema):
         yield error
 
@@ -310,14 +322,17 @@ def get_validator_type(swagger_spec):
 
     :rtype: Its complicated. See jsonschema.validators.create()
     """
-    return validators.extend(
-        Draft4Validator,
-        {
-            '$ref': ref_validator,
-            'required': functools.partial(required_validator, swagger_spec),
-            'enum': functools.partial(enum_validator, swagger_spec),
-            'type': functools.partial(type_validator, swagger_spec),
-            'format': functools.partial(format_validator, swagger_spec),
-            'discriminator': functools.partial(discriminator_validator, swagger_spec),
-        },
-    )
+    keyword_validators = {
+        '$ref': ref_validator,
+        'required': functools.partial(required_validator, swagger_spec),
+        'enum': functools.partial(enum_validator, swagger_spec),
+        'type': functools.partial(type_validator, swagger_spec),
+        'format': functools.partial(format_validator, swagger_spec),
+        'discriminator': functools.partial(discriminator_validator, swagger_spec),
+    }  # type: typing.Dict[typing.Text, typing.Callable[..., typing.Any]]
+    if swagger_spec.config['schema_profiling']:
+        keyword_validators = {
+            keyword: profile_keyword_validator(swagger_spec, keyword_validator)
+            for keyword, keyword_validator in iteritems(dict(Draft4Validator.VALIDATORS, **keyword_validators))
+        }
+    return validators.extend(Draft4Validator, keyword_validators)
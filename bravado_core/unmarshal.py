@@ -14,6 +14,10 @@ from six import iteritems
 from bravado_core import _decorators
 from bravado_core import schema
 from bravado_core.exception import SwaggerMappingError
+from bravado_core.formatter import get_format_cache
+from bravado_core.interning import intern_value
+from bravado_core.interning import interning
+from bravado_core.interning import thaw
 from bravado_core.model import MODEL_MARKER
 from bravado_core.schema import collapsed_properties
 from bravado_core.schema import collapsed_required
@@ -21,6 +25,7 @@ from bravado_core.schema import get_type_from_schema
 from bravado_core.schema import is_dict_like
 from bravado_core.schema import is_list_like
 from bravado_core.schema import SWAGGER_PRIMITIVES
+from bravado_core.schema_profiler import profile_method
 from bravado_core.util import memoize_by_id
 
 
@@ -58,7 +63,12 @@ def unmarshal_schema_object(swagger_spec, schema_object_spec, value):
         the case of a 'format' conversion', or Model type
     """
     unmarshaling_method = _get_unmarshaling_method(swagger_spec=swagger_spec, object_schema=schema_object_spec)
-    return unmarshaling_method(value)
+    if not swagger_spec.config['intern_values']:
+        return unmarshaling_method(value)
+
+    # Check bravado_core.interning
+    with interning(swagger_spec) as intern_table:
+        return thaw(intern_table, unmarshaling_method(value))
 
 
 def unmarshal_primitive(swagger_spec, primitive_spec, value):
@@ -161,6 +171,16 @@ def _get_unmarshaling_method(swagger_spec, object_schema, is_nullable=True):
                         The flag will be set to `True` if the schema is not required or `x-nullable`
                         attribute is set to true by the "parent" schema
     """
+    unmarshaling_method = _get_unmarshaling_method_for_schema(swagger_spec, object_schema, is_nullable)
+    if swagger_spec.config['intern_values']:
+        unmarshaling_method = partial(_unmarshal_and_intern, unmarshaling_method)
+    if swagger_spec.config['schema_profiling']:
+        unmarshaling_method = profile_method(swagger_spec, object_schema, unmarshaling_method)
+    return unmarshaling_method
+
+
+def _get_unmarshaling_method_for_schema(swagger_spec, object_schema, is_nullable):
+    # type: (Spec, JSONDict, bool) -> UnmarshalingMethod
     object_schema = swagger_spec.deref(object_schema)
     null_decorator = _handle_null_value(
         swagger_spec=swagger_spec,
@@ -187,6 +207,11 @@ def _get_unmarshaling_method(swagger_spec, object_schema, is_nullable=True):
         )
 
 
+def _unmarshal_and_intern(unmarshaling_method, value):
+    # type: (UnmarshalingMethod, typing.Any) -> typing.Any
+    return intern_value(unmarshaling_method(value))
+
+
 def _no_op_unmarshaling(value):
     # type: (typing.Any) -> typing.Any
     return value
@@ -299,7 +324,8 @@ def _unmarshal_object(
         )
         unmarshaled_value[property_name] = unmarshaling_function(property_value)
 
-    if swagger_spec.config['include_missing_properties']:
+    # NOTE: model instances are already initialized with the missing properties
+    if model_type is dict and swagger_spec.config['include_missing_properties']:
         for property_name, unmarshaling_function in iteritems(properties_to_unmarshaling_function):
             if property_name not in unmarshaled_value:
                 unmarshaled_value[property_name] = properties_to_default_value.get(property_name)
@@ -403,6 +429,9 @@ def _unmarshaling_method_primitive_type(swagger_spec, object_schema):
     format_name = schema.get_format(swagger_spec, object_schema)
     swagger_format = swagger_spec.get_format(format_name) if format_name is not None else None
     if swagger_format is not None:
+        format_cache = get_format_cache(swagger_spec, format_name)
+        if format_cache is not None:
+            return format_cache.to_python
         return swagger_format.to_python
     else:
         return _no_op_unmarshaling
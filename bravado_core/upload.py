@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming of the values of parameters of type file.
+
+On the client side, file values could be file-like objects or iterators of bytes
+(ie. generators producing chunks), so big files are not loaded in memory.
+
+On the server side, if ``spool_uploads`` config is enabled, uploaded files are copied
+chunk by chunk into :class:`SpooledUpload` objects, kept in memory up to
+``upload_spool_size`` bytes and rolled over to a temporary file afterwards.
+``upload_max_size`` is enforced while copying the upload, so oversized uploads are
+rejected without reading them entirely.
+"""
+import tempfile
+import typing
+
+import six
+
+from bravado_core.exception import UploadTooLargeError
+
+
+# Size of the chunks read while spooling uploads
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class IteratorReader(object):
+    """File-like adapter of an iterator of bytes chunks.
+
+    Chunks are consumed lazily, so an http client reading the file in blocks never
+    holds more than a block (plus a chunk) in memory.
+
+    :param iterator: iterable of bytes chunks
+    """
+
+    def __init__(self, iterator):
+        # type: (typing.Iterable[bytes]) -> None
+        self._iterator = iter(iterator)
+        self._buffer = b''
+        self._exhausted = False
+
+    def read(self, size=-1):
+        # type: (int) -> bytes
+        if size is None or size < 0:
+            data = self._buffer + b''.join(self._iterator)
+            self._buffer = b''
+            self._exhausted = True
+            return data
+
+        while len(self._buffer) < size and not self._exhausted:
+            try:
+                self._buffer += next(self._iterator)
+            except StopIteration:
+                self._exhausted = True
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def __iter__(self):
+        # type: () -> typing.Iterator[bytes]
+        if self._buffer:
+            yield self._buffer
+            self._buffer = b''
+        for chunk in self._iterator:
+            yield chunk
+        self._exhausted = True
+
+
+def is_iterator(value):
+    # type: (typing.Any) -> bool
+    """Check if a file value is an iterator of chunks (ie. a generator) instead of a file-like object."""
+    return not hasattr(value, 'read') and (hasattr(value, '__next__') or hasattr(value, 'next'))
+
+
+class SpooledUpload(tempfile.SpooledTemporaryFile):
+    """Uploaded file, kept in memory until its size exceeds the spool size.
+
+    :param filename: name of the uploaded file, if provided by the request object
+    :param content_type: content type of the uploaded file, if provided by the request object
+    """
+
+    def __init__(self, max_size, filename=None, content_type=None):
+        # type: (int, typing.Optional[typing.Text], typing.Optional[typing.Text]) -> None
+        super(SpooledUpload, self).__init__(max_size=max_size)
+        self.filename = filename
+        self.content_type = content_type
+        self.size = 0
+
+
+def _iter_upload_chunks(upload):
+    # type: (typing.Any) -> typing.Iterator[typing.Union[bytes, bytearray]]
+    if isinstance(upload, (six.binary_type, bytearray)):
+        yield upload
+        return
+
+    # File objects of cgi.FieldStorage like objects are exposed via the file attribute
+    file_obj = upload if hasattr(upload, 'read') else getattr(upload, 'file', None)
+    if file_obj is None:
+        for chunk in upload:
+            yield chunk
+        return
+
+    while True:
+        chunk = file_obj.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def spool_upload(upload, spool_size, max_size=None):
+    # type: (typing.Any, int, typing.Optional[int]) -> typing.Optional[SpooledUpload]
+    """Copy an uploaded file, chunk by chunk, into a :class:`SpooledUpload`.
+
+    :param upload: uploaded file as provided by the request object: bytes, file-like
+        object, object with a file attribute (ie. cgi.FieldStorage) or iterable of bytes
+    :param spool_size: number of bytes kept in memory before rolling over to a temporary file
+    :param max_size: maximum size, in bytes, of the upload. None means no limit
+    :return: the spooled upload rewound to its beginning, None if upload is None
+    :raises UploadTooLargeError: as soon as max_size is exceeded
+    """
+    if upload is None:
+        return None
+
+    spooled_upload = SpooledUpload(
+        max_size=spool_size,
+        filename=getattr(upload, 'filename', None),
+        content_type=getattr(upload, 'content_type', None),
+    )
+    try:
+        for chunk in _iter_upload_chunks(upload):
+            spooled_upload.size += len(chunk)
+            if max_size is not None and spooled_upload.size > max_size:
+                raise UploadTooLargeError(
+                    'Uploaded file exceeds the maximum size of {0} bytes'.format(max_size),
+                )
+            spooled_upload.write(chunk)
+    except BaseException:
+        spooled_upload.close()
+        raise
+
+    spooled_upload.seek(0)
+    return spooled_upload
@@ -1,12 +1,19 @@
 # -*- coding: utf-8 -*-
 import copy
+import hashlib
 import inspect
 import re
+import sys
+import threading
 import typing
+from collections.abc import Mapping
+from collections.abc import Sequence
 from enum import Enum
 
 from six import iteritems
 from six import iterkeys
+from six import itervalues
+from six import string_types
 
 from bravado_core._compat import get_function_spec
 from bravado_core._compat import wraps
@@ -90,7 +97,9 @@ class RecursiveCallException(Exception):
 def memoize_by_id(func):
     # type: (FuncType) -> FuncType
     cache = func.cache = {}  # type: ignore  # It's not worth to modify the signature to include handling of cache attribute  # noqa: E501
-    key_in_progress_set = set()  # type: typing.Set[CacheKey]
+    # The keys in progress are tracked per thread, as they are meant to detect recursive calls.
+    # Concurrent first calls with the same arguments are all executed (the last result is cached).
+    keys_in_progress = threading.local()
     _CACHE_MISS = object()
 
     spec = get_function_spec(func)
@@ -119,11 +128,16 @@ def memoize_by_id(func):
         cache_key = make_key(*args, **kwargs)
         cached_value = cache.get(cache_key, _CACHE_MISS)
         if cached_value is _CACHE_MISS:
+            key_in_progress_set = getattr(keys_in_progress, 'keys', None)  # type: typing.Optional[typing.Set[CacheKey]]
+            if key_in_progress_set is None:
+                key_in_progress_set = keys_in_progress.keys = set()
             if cache_key in key_in_progress_set:
                 raise RecursiveCallException()
             key_in_progress_set.add(cache_key)
-            cached_value = func(*args, **kwargs)
-            key_in_progress_set.remove(cache_key)
+            try:
+                cached_value = func(*args, **kwargs)
+            finally:
+                key_in_progress_set.remove(cache_key)
             cache[cache_key] = cached_value
         return cached_value
     return wrapper  # type: ignore  # ignoring type to avoiding typing.cast call
@@ -268,23 +282,312 @@ def determine_object_type(object_dict, default_type_to_object=None):
     return ObjectType.UNKNOWN
 
 
+# Types that do not need to be copied as they are immutable (copy.deepcopy returns the same object)
+_ATOMIC_TYPES = frozenset((type(None), bool, int, float, str, bytes))
+
+
+def _strip_xscope_inplace(fragment):
+    # type: (typing.Any) -> None
+    if is_dict_like(fragment):
+        fragment.pop('x-scope', None)  # Removes 'x-scope' key if present
+        for key in iterkeys(fragment):
+            _strip_xscope_inplace(fragment[key])
+    elif is_list_like(fragment):
+        for element in fragment:
+            _strip_xscope_inplace(element)
+
+
 def strip_xscope(spec_dict):
     # type: (JSONDict) -> typing.Mapping[typing.Text, typing.Any]
     """
     :param spec_dict: Swagger spec in dict form. This is treated as read-only.
     :return: deep copy of spec_dict with the x-scope metadata stripped out.
     """
-    result = copy.deepcopy(spec_dict)
-
-    def descend(fragment):
-        # type: (typing.Any) -> None
-        if is_dict_like(fragment):
-            fragment.pop('x-scope', None)  # Removes 'x-scope' key if present
-            for key in iterkeys(fragment):
-                descend(fragment[key])
-        elif is_list_like(fragment):
+    # Same semantic of copy.deepcopy (shared and recursive objects are preserved) but skipping
+    # x-scope keys while copying, instead of removing them with an additional traversal
+    memo = {}  # type: typing.Dict[int, typing.Any]
+
+    def copy_fragment(fragment):
+        # type: (typing.Any) -> typing.Any
+        fragment_type = type(fragment)
+        if fragment_type in _ATOMIC_TYPES:
+            return fragment
+
+        fragment_id = id(fragment)
+        if fragment_id in memo:
+            return memo[fragment_id]
+
+        if fragment_type is dict:
+            copied_dict = {}  # type: typing.Dict[typing.Any, typing.Any]
+            memo[fragment_id] = copied_dict
+            for key, value in iteritems(fragment):
+                if key != 'x-scope':
+                    copied_dict[key] = copy_fragment(value)
+            return copied_dict
+        elif fragment_type is list:
+            copied_list = []  # type: typing.List[typing.Any]
+            memo[fragment_id] = copied_list
             for element in fragment:
-                descend(element)
+                copied_list.append(copy_fragment(element))
+            return copied_list
+        else:
+            # Objects of other types (ie. dict subclasses, tuples) are rare in specs,
+            # copy.deepcopy takes care of preserving their type
+            copied_object = copy.deepcopy(fragment, memo)
+            _strip_xscope_inplace(copied_object)
+            return copied_object
+
+    return copy_fragment(spec_dict)
+
+
+class _XScopeStrippedMapping(Mapping):
+    """Read-only view of a dict-like object that hides its x-scope key (and the x-scope keys of the contained objects)."""
+
+    __slots__ = ('_fragment',)
+
+    def __init__(self, fragment):
+        # type: (typing.Mapping[typing.Text, typing.Any]) -> None
+        self._fragment = fragment
+
+    def __getitem__(self, key):
+        # type: (typing.Text) -> typing.Any
+        if key == 'x-scope':
+            raise KeyError(key)
+        return strip_xscope_view(self._fragment[key])
+
+    def __iter__(self):
+        # type: () -> typing.Iterator[typing.Text]
+        return (key for key in self._fragment if key != 'x-scope')
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._fragment) - (1 if 'x-scope' in self._fragment else 0)
+
+    def __repr__(self):
+        # type: () -> str
+        return '{0}({1!r})'.format(self.__class__.__name__, dict(self))
+
+    def for_json(self):
+        # type: () -> typing.Dict[typing.Text, typing.Any]
+        """simplejson serialization hook (``simplejson.dumps(view, for_json=True)``)"""
+        return dict(self)
+
+
+class _XScopeStrippedSequence(Sequence):
+    """Read-only view of a list-like object that hides the x-scope keys of the contained objects."""
+
+    __slots__ = ('_fragment',)
+
+    def __init__(self, fragment):
+        # type: (typing.Sequence[typing.Any]) -> None
+        self._fragment = fragment
+
+    def __getitem__(self, index):  # type: ignore  # slices are not supported
+        # type: (int) -> typing.Any
+        return strip_xscope_view(self._fragment[index])
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._fragment)
+
+    def __eq__(self, other):
+        # type: (typing.Any) -> bool
+        if not isinstance(other, (list, tuple, _XScopeStrippedSequence)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None  # type: ignore  # mutable views are not hashable
+
+    def __repr__(self):
+        # type: () -> str
+        return '{0}({1!r})'.format(self.__class__.__name__, list(self))
+
+    def for_json(self):
+        # type: () -> typing.List[typing.Any]
+        """simplejson serialization hook (``simplejson.dumps(view, for_json=True)``)"""
+        return list(self)
+
+
+def strip_xscope_view(fragment):
+    # type: (typing.Any) -> typing.Any
+    """
+    Alternative to :func:`strip_xscope` that does not copy the spec. Useful if the stripped
+    spec is only needed for serialization purposes (ie. serving the spec to the clients).
+
+    NOTE: The returned view reflects the modifications of the underlying spec.
+
+    :param fragment: Swagger spec, or one of its fragments, in dict form.
+    :return: read-only view of fragment (:class:`collections.abc.Mapping` for dict-like objects,
+        :class:`collections.abc.Sequence` for list-like objects) with the x-scope metadata hidden.
+        Views could be serialized via ``simplejson.dumps(view, for_json=True)``.
+    """
+    if is_dict_like(fragment):
+        return _XScopeStrippedMapping(fragment)
+    elif is_list_like(fragment):
+        return _XScopeStrippedSequence(fragment)
+    else:
+        return fragment
+
+
+def deep_getsizeof(obj, seen=None):
+    # type: (typing.Any, typing.Optional[typing.Set[int]]) -> int
+    """
+    Estimate the memory, in bytes, retained by a json-like object (including all the objects it contains).
+
+    :param obj: object to inspect. Dict-like, list-like, set and frozenset objects are traversed.
+    :param seen: ids of the objects already accounted for. Those objects are not counted again and the
+        ids of the newly visited objects are added to the set, so it could be used to share the accounting
+        across multiple calls (ie. to not count twice objects shared between different structures).
+    :return: estimated size in bytes
+    """
+    if seen is None:
+        seen = set()
+
+    size = 0
+    to_visit = [obj]
+    while to_visit:
+        current = to_visit.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if is_dict_like(current):
+            to_visit.extend(iterkeys(current))
+            to_visit.extend(itervalues(current))
+        elif is_list_like(current) or isinstance(current, (set, frozenset)):
+            to_visit.extend(current)
+    return size
+
+
+def _encode_fingerprint_leaf(value):
+    # type: (typing.Any) -> bytes
+    if isinstance(value, string_types):
+        encoded_value = value.encode('utf-8')
+        return b's' + str(len(encoded_value)).encode('ascii') + b':' + encoded_value
+    elif value is None:
+        return b'n'
+    elif isinstance(value, bool):
+        return b't' if value else b'f'
+    elif isinstance(value, float) and value.is_integer():
+        # Consistently with equality checks 1.0 and 1 are considered the same value
+        return b'i' + str(int(value)).encode('ascii') + b';'
+    elif isinstance(value, int):
+        return b'i' + str(value).encode('ascii') + b';'
+    else:
+        encoded_value = repr(value).encode('utf-8')
+        return b'o' + str(len(encoded_value)).encode('ascii') + b':' + encoded_value
+
+
+def fingerprint(fragment):
+    # type: (typing.Any) -> typing.Text
+    """
+    Compute a stable content fingerprint of a json-like object.
+
+    The fingerprint depends only on the content of the object: keys order, x-scope metadata and
+    the identity of the contained objects are not taken into account. This allows to replace
+    deep equality checks (ie. ``strip_xscope(a) == strip_xscope(b)``) with fingerprints comparison.
+    Recursive objects (ie. fully dereferenced specs) are supported.
+
+    :param fragment: Swagger spec, or one of its fragments, in dict form.
+    :return: hexadecimal SHA-256 digest
+    :rtype: str
+    """
+    # Digests of the already visited containers, in order to do not re-process shared objects
+    digests = {}  # type: typing.Dict[int, bytes]
+    # Depth of the containers currently being visited, used to encode recursive references
+    in_progress = {}  # type: typing.Dict[int, int]
+
+    def encode(value, depth):
+        # type: (typing.Any, int) -> bytes
+        if type(value) in _ATOMIC_TYPES:
+            return _encode_fingerprint_leaf(value)
+        is_dict = is_dict_like(value)
+        if not is_dict and not is_list_like(value):
+            return _encode_fingerprint_leaf(value)
+
+        value_id = id(value)
+        if value_id in digests:
+            return digests[value_id]
+        if value_id in in_progress:
+            # Recursive reference, encoded as distance from the referenced container
+            return b'r' + str(depth - in_progress[value_id]).encode('ascii') + b';'
+
+        in_progress[value_id] = depth
+        hasher = hashlib.sha256()
+        if is_dict:
+            hasher.update(b'{')
+            for encoded_key, item_value in sorted(
+                (_encode_fingerprint_leaf(key), item_value)
+                for key, item_value in iteritems(value)
+                if key != 'x-scope'
+            ):
+                hasher.update(encoded_key)
+                hasher.update(encode(item_value, depth + 1))
+        else:
+            hasher.update(b'[')
+            for item_value in value:
+                hasher.update(encode(item_value, depth + 1))
+        del in_progress[value_id]
+
+        digest = digests[value_id] = b'h' + hasher.digest()
+        return digest
+
+    return hashlib.sha256(encode(fragment, 0)).hexdigest()
+
+
+def _is_same_leaf(value, other_value):
+    # type: (typing.Any, typing.Any) -> bool
+    # Consistently with fingerprint booleans are not considered equal to integers
+    return isinstance(value, bool) == isinstance(other_value, bool) and value == other_value
+
+
+def is_same_content(fragment, other_fragment):
+    # type: (typing.Any, typing.Any) -> bool
+    """
+    Deep compare the content of two json-like objects, consistently with :func:`fingerprint`.
+
+    Keys order and x-scope metadata are not taken into account and recursive objects are supported.
+    The comparison is meant to confirm that objects with matching fingerprints have the same content.
+
+    :param fragment: Swagger spec, or one of its fragments, in dict form.
+    :param other_fragment: Swagger spec, or one of its fragments, in dict form.
+    :return: True if the objects have the same content, False otherwise
+    """
+    # Pairs of containers already compared, or currently being compared. Recursive references are
+    # considered equal while the containers they point to are being compared.
+    compared = set()  # type: typing.Set[typing.Tuple[int, int]]
+
+    def compare(value, other_value):
+        # type: (typing.Any, typing.Any) -> bool
+        if value is other_value:
+            return True
+        if type(value) in _ATOMIC_TYPES or type(other_value) in _ATOMIC_TYPES:
+            return _is_same_leaf(value, other_value)
+
+        is_dict = is_dict_like(value)
+        if is_dict != is_dict_like(other_value):
+            return False
+        is_list = not is_dict and is_list_like(value)
+        if is_list != (not is_dict and is_list_like(other_value)):
+            return False
+        if not is_dict and not is_list:
+            return _is_same_leaf(value, other_value)
+
+        pair = (id(value), id(other_value))
+        if pair in compared:
+            return True
+        compared.add(pair)
+
+        if is_dict:
+            keys = set(iterkeys(value))
+            keys.discard('x-scope')
+            other_keys = set(iterkeys(other_value))
+            other_keys.discard('x-scope')
+            return keys == other_keys and all(compare(value[key], other_value[key]) for key in keys)
+        else:
+            return len(value) == len(other_value) and all(
+                compare(item_value, other_item_value)
+                for item_value, other_item_value in zip(value, other_value)
+            )
 
-    descend(result)
-    return result
+    return compare(fragment, other_fragment)
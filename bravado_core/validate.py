@@ -26,6 +26,16 @@ if getattr(typing, 'TYPE_CHECKING', False):
     from bravado_core.spec import Spec
 
 
+def _scrub_sensitive_value(error):
+    # type: (jsonschema.ValidationError) -> None
+    if (
+        isinstance(error.schema, dict) and
+        error.schema.get('x-sensitive', False)
+    ):
+        error.message = '*** ' + error.message[len(str(error.instance)):]
+        error.instance = '***'
+
+
 def scrub_sensitive_value(func):
     # type: (FuncType) -> FuncType
     @wraps(func)
@@ -34,12 +44,7 @@ def scrub_sensitive_value(func):
         try:
             return func(*args, **kwargs)
         except jsonschema.ValidationError as e:
-            if (
-                isinstance(e.schema, dict) and
-                e.schema.get('x-sensitive', False)
-            ):
-                e.message = '*** ' + e.message[len(str(e.instance)):]
-                e.instance = '***'
+            _scrub_sensitive_value(e)
             reraise(*sys.exc_info())
 
     return scrubbed  # type: ignore  # ignoring type to avoiding typing.cast call
@@ -82,6 +87,51 @@ def validate_schema_object(
         )
 
 
+def get_schema_object_validator(
+    swagger_spec,  # type: Spec
+    schema_object_spec,  # type: JSONDict
+):
+    # type: (...) -> typing.Callable[[typing.Any], None]
+    """
+    Build a function that validates values against ``schema_object_spec``.
+
+    The returned function is equivalent to ``validate_schema_object`` but the schema type is
+    inspected and the jsonschema validator is created only once, so it is meant to be used
+    when the same schema is validated multiple times (ie. request parameters).
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :type schema_object_spec: dict
+    :rtype: callable
+    """
+    deref = swagger_spec.deref
+    schema_object_spec = deref(schema_object_spec)
+    default_type = 'object' if swagger_spec.config['default_type_to_object'] else None
+    obj_type = deref(schema_object_spec.get('type', default_type))
+
+    if not obj_type or obj_type == 'file':
+        return _no_validation
+
+    if obj_type in SWAGGER_PRIMITIVES or obj_type == 'array' or is_object(swagger_spec, schema_object_spec):
+        validator = get_validator_type(swagger_spec=swagger_spec)(
+            schema_object_spec,
+            format_checker=swagger_spec.format_checker,
+            resolver=swagger_spec.resolver,
+        )
+        return scrub_sensitive_value(validator.validate)  # type: ignore  # validate returns None, iter_errors is a generator
+
+    def raise_unknown_type(value):
+        # type: (typing.Any) -> None
+        raise SwaggerMappingError(
+            'Unknown type {0} for value {1}'.format(obj_type, value),
+        )
+    return raise_unknown_type
+
+
+def _no_validation(value):
+    # type: (typing.Any) -> None
+    pass
+
+
 @scrub_sensitive_value
 def validate_primitive(
     swagger_spec,  # type: Spec
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+Marshaling, unmarshaling and validation plans are lazily built (and memoized) the first
+time that a given schema is processed. This module allows to build them eagerly.
+"""
+import logging
+import typing
+from timeit import default_timer
+
+from six import iteritems
+from six import itervalues
+
+from bravado_core.marshal import _get_marshaling_method
+from bravado_core.model import MODEL_MARKER
+from bravado_core.param import _get_param_unmarshaling_method
+from bravado_core.param import get_param_type_spec
+from bravado_core.request import _get_request_unmarshaling_method
+from bravado_core.schema import is_dict_like
+from bravado_core.schema import is_list_like
+from bravado_core.swagger20_validator import get_validator_type
+from bravado_core.unmarshal import _get_unmarshaling_method
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core._compat_typing import JSONDict
+    from bravado_core.model import Model
+    from bravado_core.operation import Operation
+    from bravado_core.spec import Spec
+
+
+log = logging.getLogger(__name__)
+
+
+class WarmupReport(
+    typing.NamedTuple(
+        'WarmupReport',
+        [
+            ('operations', int),
+            ('plans', int),
+            ('duration', float),
+        ],
+    ),
+):
+    """Summary of a warmup execution.
+
+    :param operations: number of warmed up operations
+    :param plans: number of built plans (plans shared with previously warmed up schemas are not built again)
+    :param duration: warmup duration in seconds
+    """
+
+
+def _count_plans():
+    # type: () -> int
+    memoized_plan_builders = (
+        _get_marshaling_method,
+        _get_unmarshaling_method,
+        _get_param_unmarshaling_method,
+        _get_request_unmarshaling_method,
+        get_validator_type,
+    )
+    # @memoize_by_id adds cache attribute to the decorated function
+    return sum(len(plan_builder.cache) for plan_builder in memoized_plan_builders)  # type: ignore
+
+
+def _warmup_schema(swagger_spec, schema):
+    # type: (Spec, JSONDict) -> None
+    # NOTE: the plans are memoized by id, so the schemas have to be the same objects
+    # used by bravado_core.param and bravado_core.response while processing requests and responses
+    _get_marshaling_method(swagger_spec=swagger_spec, object_schema=schema)
+    _get_unmarshaling_method(swagger_spec=swagger_spec, object_schema=schema)
+
+
+def warmup_operation(op):
+    # type: (Operation) -> None
+    """Build the plans needed to marshal, unmarshal and validate the parameters and the responses of an operation.
+
+    The request unmarshaling plan, used by :func:`bravado_core.request.unmarshal_request`, is built as well.
+
+    :type op: :class:`bravado_core.operation.Operation`
+    """
+    swagger_spec = op.swagger_spec
+    deref = swagger_spec.deref
+
+    get_validator_type(swagger_spec)
+
+    # Evaluate the operation cached properties
+    for attr_name in ('consumes', 'produces', 'security_requirements'):
+        getattr(op, attr_name)
+
+    for param in itervalues(op.params):
+        _warmup_schema(swagger_spec, deref(get_param_type_spec(param)))
+
+    _get_request_unmarshaling_method(op)
+
+    response_specs = deref(deref(op.op_spec).get('responses')) or {}
+    for response_spec in itervalues(response_specs):
+        response_schema = deref(deref(response_spec).get('schema'))
+        if response_schema is not None:
+            _warmup_schema(swagger_spec, response_schema)
+
+
+def _warmup_model_type(model_type):
+    # type: (typing.Type[Model]) -> None
+    for attr_name in ('_properties', '_inherits_from', '_ancestor_references'):
+        getattr(model_type, attr_name)
+    # Models could refer to a different Spec instance (ie. internally_dereference_refs is enabled)
+    get_validator_type(model_type._swagger_spec)
+    _warmup_schema(model_type._swagger_spec, model_type._model_spec)
+
+
+def warmup_models(swagger_spec):
+    # type: (Spec) -> None
+    """Evaluate the lazy class attributes of all the models and build their marshaling and unmarshaling plans.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    """
+    for model_type in itervalues(swagger_spec.definitions):
+        _warmup_model_type(model_type)
+
+
+def _operation_schemas(op):
+    # type: (Operation) -> typing.List[typing.Any]
+    deref = op.swagger_spec.deref
+    schemas = [get_param_type_spec(param) for param in itervalues(op.params)]
+    response_specs = deref(deref(op.op_spec).get('responses')) or {}
+    schemas.extend(deref(response_spec).get('schema') for response_spec in itervalues(response_specs))
+    return schemas
+
+
+def _select_model_types(swagger_spec, operations):
+    # type: (Spec, typing.Iterable[Operation]) -> typing.List[typing.Type[Model]]
+    """Models used by the operations: the models reachable from their schemas and the models inheriting from them
+    (ie. the polymorphic models selected via discriminator)."""
+    deref = swagger_spec.deref
+    definitions = swagger_spec.definitions
+    selected_model_names = set()  # type: typing.Set[typing.Text]
+    visited_ids = set()  # type: typing.Set[int]
+    to_visit = [schema for op in operations for schema in _operation_schemas(op)]
+
+    while to_visit:
+        while to_visit:
+            fragment = deref(to_visit.pop())
+            if id(fragment) in visited_ids:
+                continue
+            visited_ids.add(id(fragment))
+            if is_dict_like(fragment):
+                model_name = fragment.get(MODEL_MARKER)
+                if model_name in definitions:
+                    selected_model_names.add(model_name)
+                to_visit.extend(itervalues(fragment))
+            elif is_list_like(fragment):
+                to_visit.extend(fragment)
+
+        for model_name, model_type in iteritems(definitions):
+            if model_name not in selected_model_names and not selected_model_names.isdisjoint(model_type._inherits_from):
+                to_visit.append(model_type._model_spec)
+
+    return [definitions[model_name] for model_name in sorted(selected_model_names)]
+
+
+def _select_operations(swagger_spec, names=None):
+    # type: (Spec, typing.Optional[typing.Iterable[typing.Text]]) -> typing.List[Operation]
+    selected_operations = []  # type: typing.List[Operation]
+    # Operations with multiple tags are available in multiple resources
+    selected_operation_ids = set()  # type: typing.Set[int]
+    matched_names = set()  # type: typing.Set[typing.Text]
+    selected_names = None if names is None else set(names)
+
+    for resource_name, resource in iteritems(swagger_spec.resources):
+        for op in itervalues(resource.operations):
+            if id(op) in selected_operation_ids:
+                continue
+            if selected_names is None:
+                selected_operation_ids.add(id(op))
+                selected_operations.append(op)
+                continue
+            op_names = {resource_name, op.operation_id, op.op_spec.get('operationId')}
+            op_names.update(op.op_spec.get('tags', []))
+            op_matched_names = selected_names.intersection(op_names)
+            if op_matched_names:
+                matched_names.update(op_matched_names)
+                selected_operation_ids.add(id(op))
+                selected_operations.append(op)
+
+    if selected_names is not None and matched_names != selected_names:
+        log.warning(
+            'No operations found for the following operationIds/tags: %s',
+            ', '.join(sorted(selected_names - matched_names)),
+        )
+    return selected_operations
+
+
+def warmup_spec(swagger_spec, names=None):
+    # type: (Spec, typing.Optional[typing.Iterable[typing.Text]]) -> WarmupReport
+    """Build the plans of the operations and of the models defined in the spec.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :param names: operationIds and/or tags of the operations to warm up. All the operations,
+        and all the models, are warmed up if not provided. Otherwise only the models used by
+        the selected operations are warmed up.
+    :type names: iterable of str
+    :rtype: :class:`WarmupReport`
+    """
+    start_time = default_timer()
+    plans_before_warmup = _count_plans()
+
+    operations = _select_operations(swagger_spec, names)
+    getattr(swagger_spec, 'security_definitions')
+    for op in operations:
+        warmup_operation(op)
+    if names is None:
+        warmup_models(swagger_spec)
+    else:
+        for model_type in _select_model_types(swagger_spec, operations):
+            _warmup_model_type(model_type)
+
+    warmup_report = WarmupReport(
+        operations=len(operations),
+        plans=_count_plans() - plans_before_warmup,
+        duration=default_timer() - start_time,
+    )
+    log.debug(
+        'Warmed up %d operations: %d plans built in %.3f seconds',
+        warmup_report.operations, warmup_report.plans, warmup_report.duration,
+    )
+    return warmup_report
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from jsonschema import ValidationError
+from mock import Mock
+from mock import patch
+
+from bravado_core import aio
+from bravado_core.content_type import APP_JSON
+from bravado_core.request import IncomingRequest
+from bravado_core.response import IncomingResponse
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield executor
+
+
+def _json_response(raw_bytes, value):
+    return Mock(
+        spec=IncomingResponse,
+        status_code=200,
+        headers={'content-type': APP_JSON},
+        raw_bytes=raw_bytes,
+        json=Mock(return_value=value),
+    )
+
+
+@pytest.mark.parametrize(
+    'payload_size, expected_offloaded',
+    ((10, False), (1000, True)),
+)
+def test_unmarshal_response(petstore_spec, executor, payload_size, expected_offloaded):
+    op = petstore_spec.resources['pet'].operations['getPetById']
+    response = _json_response(b' ' * payload_size, {'id': 1, 'name': 'Fido', 'photoUrls': []})
+    result = asyncio.run(aio.unmarshal_response(response, op, executor=executor, offload_threshold=100))
+    assert result.value == petstore_spec.definitions['Pet'](id=1, name='Fido', photoUrls=[])
+    assert result.offloaded is expected_offloaded
+    assert result.run_duration > 0
+    assert result.wait_duration >= 0
+
+
+def test_unmarshal_response_runs_in_executor(petstore_spec, executor):
+    op = petstore_spec.resources['pet'].operations['getPetById']
+    response = _json_response(b' ' * 1000, {'id': 1, 'name': 'Fido', 'photoUrls': []})
+    threads = []
+    with patch('bravado_core.response.unmarshal_response', side_effect=lambda *args: threads.append(threading.current_thread())):
+        asyncio.run(aio.unmarshal_response(response, op, executor=executor, offload_threshold=100))
+    assert threads[0] is not threading.current_thread()
+
+
+def test_unmarshal_response_default_threshold(petstore_spec):
+    op = petstore_spec.resources['pet'].operations['getPetById']
+    response = _json_response(b'{}', {'id': 1, 'name': 'Fido', 'photoUrls': []})
+    assert asyncio.run(aio.unmarshal_response(response, op)).offloaded is False
+
+
+def test_unmarshal_request(petstore_spec):
+    op = petstore_spec.resources['pet'].operations['findPetsByStatus']
+    request = Mock(spec=IncomingRequest, query={'status': 'sold'}, headers={'Content-Length': '0'})
+    result = asyncio.run(aio.unmarshal_request(request, op))
+    assert result.value == {'status': ['sold']}
+    assert result.offloaded is False
+
+
+def test_unmarshal_request_unknown_size_is_offloaded(petstore_spec):
+    op = petstore_spec.resources['pet'].operations['findPetsByStatus']
+    request = Mock(spec=IncomingRequest, query={'status': 'sold'}, headers={})
+    assert asyncio.run(aio.unmarshal_request(request, op)).offloaded is True
+
+
+@pytest.mark.parametrize('payload_size', [None, 10])
+def test_validate_schema_object(minimal_swagger_spec, payload_size):
+    with pytest.raises(ValidationError):
+        asyncio.run(aio.validate_schema_object(minimal_swagger_spec, {'type': 'integer'}, 'x', payload_size=payload_size))
+
+
+def test_cancelled_while_waiting_for_executor(minimal_swagger_spec, executor):
+    release_worker = threading.Event()
+    m_validate = Mock()
+
+    async def cancel_queued_call():
+        # Keep the only worker busy, so the validation waits in the executor queue
+        busy_worker = asyncio.get_running_loop().run_in_executor(executor, release_worker.wait)
+        task = asyncio.ensure_future(
+            aio.validate_schema_object(minimal_swagger_spec, {'type': 'integer'}, 1, executor=executor),
+        )
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release_worker.set()
+        await busy_worker
+
+    with patch('bravado_core.validate.validate_schema_object', m_validate):
+        asyncio.run(cancel_queued_call())
+        executor.shutdown(wait=True)
+    assert not m_validate.called
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import datetime
+import io
+import json
+
+import msgpack
+import pytest
+import pytz
+from mock import Mock
+from mock import patch
+
+from bravado_core.codec import decode_msgpack
+from bravado_core.codec import decode_msgpack_body
+from bravado_core.codec import encode_msgpack
+from bravado_core.codec import get_json_codec
+from bravado_core.codec import JSON_CODEC
+from bravado_core.codec import JsonCodec
+from bravado_core.codec import SIMPLEJSON_CODEC
+
+
+def test_get_json_codec_not_configured():
+    assert get_json_codec(None) is None
+
+
+def test_get_json_codec_instance():
+    json_codec = JsonCodec(name='custom', dumps=json.dumps, loads=json.loads)
+    assert get_json_codec(json_codec) is json_codec
+
+
+@pytest.mark.parametrize('name, expected_codec', [('json', JSON_CODEC), ('simplejson', SIMPLEJSON_CODEC)])
+def test_get_json_codec_by_name(name, expected_codec):
+    assert get_json_codec(name) is expected_codec
+
+
+def test_get_json_codec_orjson():
+    orjson = pytest.importorskip('orjson')
+    json_codec = get_json_codec('orjson')
+    assert json_codec.name == 'orjson'
+    assert json_codec.loads(json_codec.dumps({'a': [1]})) == {'a': [1]}
+    assert json_codec.dumps is orjson.dumps
+
+
+def test_get_json_codec_unknown_name():
+    with pytest.raises(ValueError, match='Unknown json_codec unknown. Known codecs: json, orjson, simplejson'):
+        get_json_codec('unknown')
+
+
+@pytest.mark.parametrize('json_codec', [JSON_CODEC, SIMPLEJSON_CODEC])
+def test_codecs_decode_bytes(json_codec):
+    assert json_codec.loads(b'{"name": "\xc3\xa8"}') == {'name': u'\xe8'}
+
+
+@pytest.fixture
+def msgpack_pets():
+    return msgpack.packb([{'id': i, 'name': 'pet{}'.format(i)} for i in range(3)], use_bin_type=True)
+
+
+@pytest.mark.parametrize('body_type', [bytes, bytearray, memoryview, io.BytesIO])
+def test_decode_msgpack(msgpack_pets, body_type):
+    assert decode_msgpack(body_type(msgpack_pets)) == msgpack.unpackb(msgpack_pets, raw=False)
+
+
+@pytest.mark.parametrize('body_type', [bytes, io.BytesIO])
+def test_decode_msgpack_extra_data(msgpack_pets, body_type):
+    with pytest.raises(ValueError):
+        decode_msgpack(body_type(msgpack_pets + msgpack_pets))
+
+
+def test_decode_msgpack_body_is_cached(msgpack_pets):
+    http_message = Mock(spec=['raw_bytes'], raw_bytes=msgpack_pets)
+    with patch('bravado_core.codec.decode_msgpack', wraps=decode_msgpack) as m_decode_msgpack:
+        decoded_body = decode_msgpack_body(http_message)
+        assert decode_msgpack_body(http_message) is decoded_body
+        assert m_decode_msgpack.call_count == 1
+
+        http_message.raw_bytes = msgpack.packb([])
+        assert decode_msgpack_body(http_message) == []
+        assert m_decode_msgpack.call_count == 2
+
+
+def test_decode_msgpack_body_file_like(msgpack_pets):
+    http_message = Mock(spec=['raw_bytes'], raw_bytes=io.BytesIO(msgpack_pets))
+    assert decode_msgpack_body(http_message) == msgpack.unpackb(msgpack_pets, raw=False)
+    # The stream is consumed, but the decoded body is cached
+    assert decode_msgpack_body(http_message) == msgpack.unpackb(msgpack_pets, raw=False)
+
+
+def test_encode_decode_msgpack_timestamps():
+    value = {'created_at': datetime.datetime(2018, 5, 13, 10, 20, 30, 123456, tzinfo=pytz.utc)}
+    encoded_value = encode_msgpack(value, timestamps=True)
+    assert isinstance(msgpack.unpackb(encoded_value, raw=False)['created_at'], msgpack.Timestamp)
+    assert decode_msgpack(encoded_value, timestamps=True) == value
+    assert decode_msgpack(io.BytesIO(encoded_value), timestamps=True) == value
+
+
+def test_encode_msgpack_without_timestamps():
+    with pytest.raises(TypeError):
+        encode_msgpack(datetime.datetime(2018, 5, 13, tzinfo=pytz.utc))
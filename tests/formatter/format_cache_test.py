@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+import collections
+import datetime
+import decimal
+
+import pytest
+
+from bravado_core.formatter import FormatCache
+from bravado_core.formatter import FormatCacheStats
+from bravado_core.formatter import NO_OP
+from bravado_core.formatter import SwaggerFormat
+from bravado_core.formatter import to_python
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+Point = collections.namedtuple('Point', ['lat', 'lon'])
+
+
+def _counting_format(format_name, to_python):
+    calls = []
+
+    def counting_to_python(value):
+        calls.append(value)
+        return to_python(value)
+
+    swagger_format = SwaggerFormat(
+        format=format_name,
+        to_python=counting_to_python,
+        to_wire=str,
+        validate=NO_OP,
+        description='Counts the conversions to python',
+    )
+    return swagger_format, calls
+
+
+@pytest.fixture
+def money_format():
+    return _counting_format('money', decimal.Decimal)
+
+
+@pytest.fixture
+def money_spec(minimal_swagger_dict, money_format):
+    return Spec.from_dict(
+        minimal_swagger_dict,
+        config={'formats': [money_format[0]], 'cached_formats': {'money': 2, 'date': 10}},
+    )
+
+
+def _unmarshal_amounts(swagger_spec, amounts):
+    return unmarshal_schema_object(
+        swagger_spec,
+        {'type': 'array', 'items': {'type': 'string', 'format': 'money'}},
+        amounts,
+    )
+
+
+def test_conversions_are_cached(money_spec, money_format):
+    _, calls = money_format
+    amounts = _unmarshal_amounts(money_spec, ['1.10', '2.20', '1.10', '1.10'])
+
+    assert amounts == [decimal.Decimal('1.10'), decimal.Decimal('2.20'), decimal.Decimal('1.10'), decimal.Decimal('1.10')]
+    assert amounts[0] is amounts[2]
+    assert calls == ['1.10', '2.20']
+    money_stats = money_spec.format_cache_stats()['money']
+    assert money_stats == FormatCacheStats(hits=2, misses=2, size=2, max_size=2)
+    assert money_stats.hit_rate == 0.5
+
+
+def test_cache_is_bounded(money_spec, money_format):
+    _, calls = money_format
+    _unmarshal_amounts(money_spec, ['1.10', '2.20', '3.30', '1.10'])
+    assert calls == ['1.10', '2.20', '3.30', '1.10']
+    assert money_spec.format_cache_stats()['money'].size == 2
+
+
+def test_formats_not_cached_by_default(minimal_swagger_dict, money_format):
+    swagger_format, calls = money_format
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'formats': [swagger_format]})
+    _unmarshal_amounts(swagger_spec, ['1.10', '1.10'])
+    assert calls == ['1.10', '1.10']
+    assert swagger_spec.format_cache_stats() == {}
+
+
+def test_formatter_to_python(money_spec, money_format):
+    _, calls = money_format
+    money_spec_dict = {'type': 'string', 'format': 'money'}
+    assert to_python(money_spec, money_spec_dict, '1.10') is to_python(money_spec, money_spec_dict, '1.10')
+    assert calls == ['1.10']
+
+
+def test_caches_of_default_formats(money_spec):
+    dates = unmarshal_schema_object(
+        money_spec,
+        {'type': 'array', 'items': {'type': 'string', 'format': 'date'}},
+        ['2019-01-01', '2019-01-01'],
+    )
+    assert dates == [datetime.date(2019, 1, 1)] * 2
+    assert money_spec.format_cache_stats() == {'date': FormatCacheStats(hits=1, misses=1, size=1, max_size=10)}
+
+
+@pytest.mark.parametrize(
+    'to_python, cached',
+    [
+        (lambda value: Point(*value.split(',')), True),
+        (lambda value: value.split(','), False),
+        (lambda value: (value.split(','),), False),
+    ],
+    ids=['immutable', 'list', 'tuple-of-lists'],
+)
+def test_only_immutable_results_are_cached(to_python, cached):
+    swagger_format, calls = _counting_format('geo', to_python)
+    format_cache = FormatCache(swagger_format, max_size=10)
+    first_result = format_cache.to_python('1,2')
+    assert format_cache.to_python('1,2') == first_result
+    assert len(calls) == (1 if cached else 2)
+    assert format_cache.stats().size == (1 if cached else 0)
+
+
+def test_wire_value_types_are_cached_separately():
+    swagger_format, calls = _counting_format('number', repr)
+    format_cache = FormatCache(swagger_format, max_size=10)
+    assert format_cache.to_python(1) == '1'
+    assert format_cache.to_python(1.0) == '1.0'
+    assert calls == [1, 1.0]
+
+
+def test_cache_replaced_if_format_registered_again(money_spec, money_format):
+    _unmarshal_amounts(money_spec, ['1.10'])
+    other_format, other_calls = _counting_format('money', decimal.Decimal)
+    money_spec.register_format(other_format)
+    # Unmarshaling plans are memoized, use the formatter API
+    to_python(money_spec, {'type': 'string', 'format': 'money'}, '1.10')
+    assert other_calls == ['1.10']
+    assert money_spec.format_cache_stats()['money'].misses == 1
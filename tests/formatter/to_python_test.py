@@ -2,9 +2,13 @@
 from datetime import date
 from datetime import datetime
 
+import dateutil.parser
+import dateutil.tz
+import pytest
 import six
 from mock import patch
 
+from bravado_core.formatter import _parse_date_time
 from bravado_core.formatter import SwaggerFormat
 from bravado_core.formatter import to_python
 from bravado_core.spec import Spec
@@ -39,6 +43,58 @@ def test_datetime(minimal_swagger_spec):
     assert datetime(2015, 3, 22, 13, 19, 54) == result
 
 
+@pytest.mark.parametrize(
+    'value',
+    [
+        '2015-03-22T13:19:54Z',
+        '2015-03-22t13:19:54z',
+        '2015-03-22 13:19:54+00:00',
+        '2015-03-22T13:19:54-00:00',
+        '2015-03-22T13:19:54.1+05:30',
+        '2015-03-22T13:19:54.123-07:00',
+        '2015-03-22T13:19:54.123456789-07:00',
+        # Not RFC 3339, parsed by dateutil
+        '2015-03-22T13:19',
+        '2015-03-22',
+        '22 March 2015 13:19:54 UTC',
+        '20150322T131954+0100',
+    ],
+)
+def test_datetime_same_as_dateutil(minimal_swagger_spec, value):
+    string_spec = {'type': 'string', 'format': 'date-time'}
+    result = to_python(minimal_swagger_spec, string_spec, value)
+    expected_result = dateutil.parser.parse(value)
+    assert result == expected_result
+    assert result.utcoffset() == expected_result.utcoffset()
+
+
+def test_datetime_tzinfo_objects_are_cached():
+    first_result = _parse_date_time('2015-03-22T13:19:54+01:00')
+    other_result = _parse_date_time('2019-01-01T00:00:00.5+01:00')
+    assert first_result.tzinfo is other_result.tzinfo
+    assert first_result.tzinfo == dateutil.tz.tzoffset(None, 3600)
+    assert _parse_date_time('2015-03-22T13:19:54Z').tzinfo is dateutil.tz.UTC
+
+
+@pytest.mark.parametrize('value', ['2015-02-30T13:19:54Z', '2015-03-22T25:19:54Z', 'not a date-time'])
+def test_invalid_datetime(minimal_swagger_spec, value):
+    string_spec = {'type': 'string', 'format': 'date-time'}
+    with pytest.raises(ValueError):
+        to_python(minimal_swagger_spec, string_spec, value)
+
+
+@pytest.mark.parametrize('value', ['2015-04-01', '20150401', '2015-04-01T13:19:54Z', 'April 1, 2015'])
+def test_date_same_as_dateutil(minimal_swagger_spec, value):
+    string_spec = {'type': 'string', 'format': 'date'}
+    assert date(2015, 4, 1) == to_python(minimal_swagger_spec, string_spec, value)
+
+
+def test_invalid_date(minimal_swagger_spec):
+    string_spec = {'type': 'string', 'format': 'date'}
+    with pytest.raises(ValueError):
+        to_python(minimal_swagger_spec, string_spec, '2015-02-30')
+
+
 @patch('bravado_core.spec.warnings.warn')
 def test_no_registered_format_returns_value_as_is_and_issues_warning(mock_warn, minimal_swagger_spec):
     string_spec = {'type': 'string', 'format': 'bar'}
@@ -142,3 +198,9 @@ def test_override(minimal_swagger_dict):
     assert '8bits' == str(result)
     assert repr(Byte('8bits')) == repr(result)
     assert type(result) is Byte
+
+
+def test_datetime_already_decoded(minimal_swagger_spec):
+    string_spec = {'type': 'string', 'format': 'date-time'}
+    value = datetime(2015, 3, 22, 13, 19, 54)
+    assert to_python(minimal_swagger_spec, string_spec, value) is value
@@ -44,6 +44,13 @@ def test_naive_datetime(minimal_swagger_spec):
     )
 
 
+def test_naive_datetime_with_microseconds(minimal_swagger_spec):
+    string_spec = {'type': 'string', 'format': 'date-time'}
+    assert '2015-03-22T13:19:54.000123+00:00' == to_wire(
+        minimal_swagger_spec, string_spec, datetime(2015, 3, 22, 13, 19, 54, 123),
+    )
+
+
 def test_localized_datetime(minimal_swagger_spec):
     string_spec = {'type': 'string', 'format': 'date-time'}
     assert '2015-03-22T13:19:54-07:00' == to_wire(
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import json
+import pickle
+
+import pytest
+from jsonschema import ValidationError
+from mock import Mock
+
+from bravado_core.content_type import APP_JSON
+from bravado_core.instrumentation import get_body_size
+from bravado_core.param import marshal_param
+from bravado_core.request import IncomingRequest
+from bravado_core.request import unmarshal_request
+from bravado_core.response import IncomingResponse
+from bravado_core.response import OutgoingResponse
+from bravado_core.response import unmarshal_response
+from bravado_core.response import validate_response
+
+
+PET = {'id': 1, 'name': 'Fido', 'photoUrls': []}
+PET_BYTES = json.dumps(PET).encode('utf-8')
+
+
+@pytest.fixture
+def timings(petstore_spec):
+    timings = []
+    petstore_spec.add_instrumentation_callback(lambda *args: timings.append(args))
+    return timings
+
+
+def _phases(timings):
+    return [(operation_id, phase, payload_size) for operation_id, phase, _, payload_size in timings]
+
+
+def _json_response(value=PET):
+    return Mock(
+        spec=IncomingResponse,
+        status_code=200,
+        headers={'content-type': APP_JSON},
+        raw_bytes=PET_BYTES,
+        json=Mock(return_value=value),
+    )
+
+
+def test_unmarshal_response(petstore_spec, timings):
+    op = petstore_spec.resources['pet'].operations['getPetById']
+    unmarshal_response(_json_response(), op)
+
+    size = len(PET_BYTES)
+    assert _phases(timings) == [
+        ('getPetById', 'decode_body', size),
+        ('getPetById', 'validate_body', size),
+        ('getPetById', 'unmarshal_body', size),
+        ('getPetById', 'unmarshal_response', size),
+    ]
+    assert all(duration >= 0 for _, _, duration, _ in timings)
+    # Nested phases are included in the outer phase
+    assert timings[-1][2] >= sum(duration for _, _, duration, _ in timings[:-1])
+
+
+def test_failed_phases_are_reported(petstore_spec, timings):
+    op = petstore_spec.resources['pet'].operations['getPetById']
+    with pytest.raises(ValidationError):
+        unmarshal_response(_json_response({'id': 'not an integer'}), op)
+    assert [phase for _, phase, _ in _phases(timings)] == ['decode_body', 'validate_body', 'unmarshal_response']
+
+
+def test_unmarshal_request(petstore_spec, timings):
+    op = petstore_spec.resources['pet'].operations['addPet']
+    request = Mock(
+        spec=IncomingRequest,
+        headers={'Content-Type': APP_JSON},
+        raw_bytes=PET_BYTES,
+        json=Mock(return_value=PET),
+    )
+    unmarshal_request(request, op)
+
+    size = len(PET_BYTES)
+    assert _phases(timings) == [
+        ('addPet', 'decode_body', size),
+        ('addPet', 'validate_body', None),
+        ('addPet', 'unmarshal_body', None),
+        ('addPet', 'unmarshal_request', size),
+    ]
+
+
+def test_marshal_param(petstore_spec, timings):
+    op = petstore_spec.resources['pet'].operations['addPet']
+    request = {'headers': {}}
+    marshal_param(op.params['body'], petstore_spec.definitions['Pet'](**PET), request)
+
+    size = len(request['data'])
+    assert _phases(timings) == [('addPet', 'encode_body', size), ('addPet', 'marshal_param', size)]
+
+
+def test_validate_response(petstore_spec, timings):
+    op = petstore_spec.resources['pet'].operations['getPetById']
+    response = Mock(
+        spec=OutgoingResponse,
+        content_type=APP_JSON,
+        headers={},
+        raw_bytes=PET_BYTES,
+        json=Mock(return_value=PET),
+    )
+    validate_response(op.op_spec['responses']['200'], op, response)
+
+    size = len(PET_BYTES)
+    assert _phases(timings) == [
+        ('getPetById', 'decode_body', size),
+        ('getPetById', 'validate_body', size),
+        ('getPetById', 'validate_response', size),
+    ]
+
+
+def test_failing_callbacks_are_ignored(petstore_spec, timings):
+    petstore_spec.add_instrumentation_callback(Mock(side_effect=ValueError))
+    op = petstore_spec.resources['pet'].operations['getPetById']
+    assert unmarshal_response(_json_response(), op) == petstore_spec.definitions['Pet'](**PET)
+    assert len(timings) == 4
+
+
+def test_remove_instrumentation_callback(petstore_spec):
+    callback = Mock()
+    petstore_spec.add_instrumentation_callback(callback)
+    petstore_spec.remove_instrumentation_callback(callback)
+    unmarshal_response(_json_response(), petstore_spec.resources['pet'].operations['getPetById'])
+    assert not callback.called
+    with pytest.raises(ValueError):
+        petstore_spec.remove_instrumentation_callback(callback)
+
+
+def test_callbacks_are_not_pickled(petstore_spec, timings):
+    unpickled_spec = pickle.loads(pickle.dumps(petstore_spec))
+    assert unpickled_spec.instrumentation_callbacks == ()
+    assert petstore_spec.is_equal(unpickled_spec)
+
+
+@pytest.mark.parametrize(
+    'http_message, expected_size',
+    [
+        (Mock(raw_bytes=b'abc'), 3),
+        (Mock(raw_bytes=None, headers={'Content-Length': '10'}), 10),
+        (Mock(raw_bytes=None, headers={'content-length': 'invalid'}), None),
+        (Mock(raw_bytes=None, headers={}), None),
+    ],
+)
+def test_get_body_size(http_message, expected_size):
+    assert get_body_size(http_message) == expected_size
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+import copy
+import datetime
+import types
+
+import pytest
+
+from bravado_core.interning import InternTable
+from bravado_core.interning import MAX_INTERNED_ITEMS
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture
+def pets_value():
+    return [
+        {
+            'id': pet_id,
+            'name': 'pet{}'.format(pet_id),
+            'status': 'available',
+            'photoUrls': ['wagtail.png', 'bark.png'],
+            'category': {'id': 200, 'name': 'friendly'},
+            'tags': [{'id': 99, 'name': 'mini'}, {'id': 100, 'name': 'brown'}],
+        }
+        for pet_id in range(3)
+    ]
+
+
+def _unmarshal_pets(swagger_spec, pets_value):
+    return unmarshal_schema_object(
+        swagger_spec,
+        {'type': 'array', 'items': swagger_spec.spec_dict['definitions']['Pet']},
+        copy.deepcopy(pets_value),
+    )
+
+
+@pytest.fixture
+def interning_spec(petstore_spec):
+    return Spec.from_dict(
+        petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config={'intern_values': True},
+    )
+
+
+def test_values_not_shared_by_default(petstore_spec, pets_value):
+    pets = _unmarshal_pets(petstore_spec, pets_value)
+    assert pets[0].category is not pets[1].category
+    assert pets[0].category == pets[1].category
+
+
+def test_identical_values_are_shared(interning_spec, pets_value):
+    pets = _unmarshal_pets(interning_spec, pets_value)
+
+    assert isinstance(pets, list)
+    assert pets[0].category is pets[1].category is pets[2].category
+    assert pets[0].tags is pets[1].tags
+    assert pets[0].tags == (pets[0].tags[0], pets[0].tags[1])
+    assert pets[0].photoUrls == ('wagtail.png', 'bark.png')
+    assert pets[0].status is pets[1].status
+    assert pets[0].name == 'pet0' and pets[1].name == 'pet1'
+    assert pets[0]._marshal() == pets_value[0]
+
+
+def test_shared_models_are_frozen(interning_spec, pets_value):
+    category = _unmarshal_pets(interning_spec, pets_value)[0].category
+
+    with pytest.raises(TypeError, match='Category instance is shared'):
+        category.name = 'unfriendly'
+    with pytest.raises(TypeError, match='Category instance is shared'):
+        del category.name
+    assert category.name == 'friendly'
+
+    category_copy = copy.deepcopy(category)
+    category_copy.name = 'unfriendly'
+    assert category.name == 'friendly'
+
+
+def test_top_level_value_is_not_frozen(interning_spec, pets_value):
+    pet_spec = interning_spec.spec_dict['definitions']['Pet']
+    pet = unmarshal_schema_object(interning_spec, pet_spec, pets_value[0])
+    pet.name = 'renamed'
+    assert pet.name == 'renamed'
+    # Nested values are still frozen
+    with pytest.raises(TypeError):
+        pet.category.name = 'unfriendly'
+
+    # The frozen instance in the table is not affected
+    assert unmarshal_schema_object(interning_spec, pet_spec, pets_value[0]).name == 'pet0'
+
+
+def test_objects_without_models_are_frozen(petstore_spec, pets_value):
+    interning_spec = Spec.from_dict(
+        petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config={'intern_values': True, 'use_models': False},
+    )
+    pets = _unmarshal_pets(interning_spec, pets_value)
+    assert isinstance(pets, list)
+    assert isinstance(pets[0], types.MappingProxyType)
+    assert isinstance(pets[0]['category'], types.MappingProxyType)
+    assert pets[0]['category'] is pets[1]['category']
+
+
+@pytest.mark.parametrize('intern_cache_size, shared', [(0, False), (1000, True)])
+def test_values_shared_across_calls(petstore_spec, pets_value, intern_cache_size, shared):
+    interning_spec = Spec.from_dict(
+        petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config={'intern_values': True, 'intern_cache_size': intern_cache_size},
+    )
+    pets = _unmarshal_pets(interning_spec, pets_value)
+    other_pets = _unmarshal_pets(interning_spec, pets_value)
+    assert (pets[0].category is other_pets[0].category) is shared
+
+
+def test_intern_table_leaves():
+    intern_table = InternTable()
+    value = ''.join(['a', 'b'])
+    assert intern_table.intern(value) is value
+    assert intern_table.intern(''.join(['a', 'b'])) is value
+
+    assert intern_table.intern(1) == 1
+    assert intern_table.intern(True) is True
+    assert str(intern_table.intern(0.0)) == '0.0'
+    assert str(intern_table.intern(-0.0)) == '-0.0'
+    assert intern_table.intern(None) is None
+
+
+def test_intern_table_does_not_share_datetimes():
+    intern_table = InternTable()
+    utc_datetime = datetime.datetime(2019, 1, 1, tzinfo=datetime.timezone.utc)
+    other_datetime = datetime.datetime(2019, 1, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=1)))
+    assert intern_table.intern(utc_datetime) is utc_datetime
+    assert intern_table.intern(other_datetime) is other_datetime
+    # Arrays containing datetime objects are not shared either
+    assert isinstance(intern_table.intern([utc_datetime]), list)
+
+
+def test_intern_table_sub_objects():
+    intern_table = InternTable()
+    items = intern_table.intern(['a', 'b'])
+    assert items == ('a', 'b')
+    assert intern_table.intern(['a', 'b']) is items
+    assert intern_table.is_shared(items)
+
+    mapping = intern_table.intern({'items': items})
+    assert isinstance(mapping, types.MappingProxyType)
+    assert intern_table.intern({'items': intern_table.intern(['a', 'b'])}) is mapping
+    # Same items in a different container type
+    assert intern_table.intern({'items': ('a', 'b')}) == {'items': ('a', 'b')}
+    assert not intern_table.is_shared(intern_table.intern({'items': ('a', 'b')}))
+
+    big_list = list(range(MAX_INTERNED_ITEMS + 1))
+    assert intern_table.intern(big_list) is big_list
+
+
+def test_intern_table_lru_eviction():
+    intern_table = InternTable(max_size=2)
+    items = intern_table.intern([intern_table.intern('a')])
+    assert len(intern_table) == 2
+    intern_table.intern('b')
+    intern_table.intern('c')
+    assert len(intern_table) == 2
+    assert not intern_table.is_shared(items)
+    assert intern_table.intern(['a']) is not items
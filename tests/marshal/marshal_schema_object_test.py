@@ -4,6 +4,7 @@ import datetime
 from collections import defaultdict
 
 import pytest
+import pytz
 
 from bravado_core.exception import SwaggerMappingError
 from bravado_core.marshal import marshal_schema_object
@@ -108,3 +109,28 @@ def test_allOf_with_ref(composition_spec):
     }
     expected = copy.deepcopy(value)
     assert expected == marshal_schema_object(composition_spec, pongclone_spec, value)
+
+
+def test_native_datetimes(minimal_swagger_spec):
+    schema = {
+        'type': 'object',
+        'properties': {
+            'created_at': {'type': 'string', 'format': 'date-time'},
+            'updates': {'type': 'array', 'items': {'type': 'string', 'format': 'date-time'}},
+            'day': {'type': 'string', 'format': 'date'},
+        },
+    }
+    created_at = datetime.datetime(2018, 5, 13, 10, 20, 30, tzinfo=pytz.utc)
+    value = {
+        'created_at': created_at,
+        'updates': [datetime.datetime(2018, 5, 13, 10, 20, 30)],
+        'day': datetime.date(2018, 5, 13),
+    }
+    result = marshal_schema_object(minimal_swagger_spec, schema, value, native_datetimes=True)
+    assert result == {
+        'created_at': created_at,
+        'updates': [created_at],
+        'day': '2018-05-13',
+    }
+    assert result['created_at'] is created_at
+    assert marshal_schema_object(minimal_swagger_spec, schema, value)['created_at'] == '2018-05-13T10:20:30+00:00'
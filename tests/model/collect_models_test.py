@@ -97,3 +97,26 @@ def test_raise_error_if_duplicate_models_are_identified(minimal_swagger_dict, pe
         'TIP: enforce different model naming by using {MODEL_MARKER}'.format(MODEL_MARKER='x-model'),
     ]
     assert all(l in str(excinfo.value) for l in expected_lines)
+
+
+def test_models_differing_only_for_xscope_are_not_duplicated(minimal_swagger_dict, pet_model_spec):
+    model_name = 'Pet'
+    minimal_swagger_dict['definitions'][model_name] = pet_model_spec
+    swagger_spec = Spec(minimal_swagger_dict)
+    known_model_spec = dict(pet_model_spec, **{'x-scope': ['file:///another/location/swagger.json']})
+    models = {
+        model_name: create_model_type(
+            swagger_spec=swagger_spec,
+            model_name=model_name,
+            model_spec=known_model_spec,
+        ),
+    }
+
+    _collect_models(
+        minimal_swagger_dict['definitions'][model_name],
+        models=models,
+        swagger_spec=swagger_spec,
+        json_reference='#/definitions/{model_name}/x-model'.format(model_name=model_name),
+    )
+
+    assert models[model_name]._model_spec is known_model_spec
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import abc
 import datetime
 from copy import deepcopy
 
@@ -154,6 +155,97 @@ def test_model_deepcopy(user_type, user_kwargs):
     assert user._as_dict() == user_copy._as_dict()
 
 
+def test_model_deepcopy_does_not_initialize_model(user_type, user_kwargs):
+    user = user_type(**user_kwargs)
+    user_type._model_spec['additionalProperties'] = False
+    user['foo'] = ['bar']
+    user_copy = deepcopy(user)
+
+    assert user_copy == user
+    assert user_copy.foo is not user.foo
+
+
+def test_model_deepcopy_preserves_references(user_type, user_kwargs):
+    user = user_type(**user_kwargs)
+    user.friend = user
+    user.tags = ['a']
+    user.other_tags = user.tags
+    user_copy = deepcopy(user)
+
+    assert user_copy is not user
+    assert user_copy.friend is user_copy
+    assert user_copy.tags == ['a'] and user_copy.tags is not user.tags
+    assert user_copy.other_tags is user_copy.tags
+
+
+def test_model_equality_ignores_raw_property(user_type, user_kwargs):
+    user = user_type(**user_kwargs)
+    assert user == user_type(_raw={'id': 1}, **user_kwargs)
+    assert user_type(_raw={'id': 1}, **user_kwargs) == user
+    assert user != user_type(_raw={'id': 1}, foo='bar', **user_kwargs)
+    user_kwargs['firstName'] = 'Jane'
+    assert user != user_type(_raw={'id': 1}, **user_kwargs)
+
+
+@pytest.fixture
+def nested_models_spec(minimal_swagger_dict):
+    minimal_swagger_dict['definitions'] = {
+        'Node': {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string'},
+                'labels': {'type': 'array', 'items': {'type': 'string'}},
+                'child': {'$ref': '#/definitions/Node'},
+                'children': {'type': 'array', 'items': {'$ref': '#/definitions/Node'}},
+                'metadata': {'type': 'object'},
+            },
+        },
+    }
+    return Spec.from_dict(minimal_swagger_dict)
+
+
+def test_model_free_properties(nested_models_spec):
+    assert nested_models_spec.definitions['Node']._model_free_properties == frozenset(['name', 'labels'])
+
+
+def test_model_as_dict_nested_models(nested_models_spec):
+    Node = nested_models_spec.definitions['Node']
+    leaf = Node(name='leaf', labels=('a', 'b'), metadata={'node': Node(name='in metadata')})
+    node = Node(name='root', child=Node(name='child', child=leaf, extra=leaf), children=[leaf, 1])
+
+    dictionary = node._as_dict()
+    leaf_dict = {
+        'name': 'leaf', 'labels': ['a', 'b'], 'child': None, 'children': None,
+        # dictionaries are not inspected for models
+        'metadata': {'node': Node(name='in metadata')},
+    }
+    assert dictionary == {
+        'name': 'root',
+        'labels': None,
+        'child': {
+            'name': 'child', 'labels': None, 'child': leaf_dict, 'children': None, 'metadata': None, 'extra': leaf_dict,
+        },
+        'children': [leaf_dict, 1],
+        'metadata': None,
+    }
+    assert dictionary['children'][0]['labels'] is not leaf.labels
+
+    assert 'extra' not in node._as_dict(additional_properties=False)['child']
+    assert node._as_dict(recursive=False)['children'][0] is leaf
+
+
+def test_model_as_dict_deeply_nested_models(nested_models_spec):
+    Node = nested_models_spec.definitions['Node']
+    node = Node(name='0')
+    for depth in range(1, 5000):
+        node = Node(name=str(depth), child=node)
+
+    dictionary = node._as_dict()
+    while dictionary['child'] is not None:
+        dictionary = dictionary['child']
+    assert dictionary['name'] == '0'
+
+
 @pytest.mark.parametrize(
     'recursive',
     [
@@ -341,3 +433,54 @@ def test_ensure_that_tricking_abc_attributes_do_not_alter_results(polymorphic_sp
     assert isinstance(dog, Dog)
     assert isinstance(dog, Cat) is False
     assert isinstance(dog, Cat) is False
+
+
+@pytest.fixture
+def three_levels_spec(minimal_swagger_dict):
+    minimal_swagger_dict['definitions'] = {
+        'Animal': {'type': 'object', 'properties': {'name': {'type': 'string'}}},
+        'Pet': {'allOf': [{'$ref': '#/definitions/Animal'}, {'properties': {'owner': {'type': 'string'}}}]},
+        'Dog': {'allOf': [{'$ref': '#/definitions/Pet'}, {'properties': {'breed': {'type': 'string'}}}]},
+    }
+    return Spec.from_dict(minimal_swagger_dict, origin_url='file:///three_levels.json')
+
+
+def test_ancestor_references(three_levels_spec):
+    Dog = three_levels_spec.definitions['Dog']
+    assert Dog._ancestor_references == frozenset(
+        three_levels_spec.definitions[model_name]._model_reference
+        for model_name in ('Animal', 'Pet', 'Dog')
+    )
+    assert len(Dog._ancestor_references) == 3
+    # Model base classes are not models
+    assert not hasattr(Model, '_ancestor_references')
+
+
+def test_isinstance_works_in_case_of_indirect_inheritance(three_levels_spec):
+    definitions = three_levels_spec.definitions
+    dog = definitions['Dog'](name='Fido')
+    assert isinstance(dog, definitions['Pet'])
+    assert isinstance(dog, definitions['Animal'])
+    assert not isinstance(definitions['Animal'](), definitions['Dog'])
+    assert issubclass(definitions['Dog'], definitions['Animal'])
+
+
+def test_isinstance_does_not_grow_abc_cache(three_levels_spec, minimal_swagger_dict):
+    other_spec = Spec.from_dict(minimal_swagger_dict, origin_url='file:///three_levels.json')
+    dog = other_spec.definitions['Dog'](name='Fido')
+    for model_type in three_levels_spec.definitions.values():
+        assert isinstance(dog, model_type)
+        assert isinstance(dog, Model)
+        assert not isinstance({}, model_type)
+        if hasattr(abc, '_get_dump'):  # C implementation of abc
+            assert len(abc._get_dump(model_type)[1]) == 0  # _abc_cache
+    if hasattr(abc, '_get_dump'):
+        assert len(abc._get_dump(Model)[1]) == 0
+
+
+def test_isinstance_registered_virtual_subclass():
+    class VirtualModel(object):
+        pass
+
+    Model.register(VirtualModel)
+    assert isinstance(VirtualModel(), Model)
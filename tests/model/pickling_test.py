@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
+import copy
+import gc
+import pickle
+
+import pytest
 from six import iterkeys
 from six.moves.cPickle import dumps
 
 from bravado_core.model import _from_pickleable_representation
 from bravado_core.model import _to_pickleable_representation
+from bravado_core.model import create_model_type
 from bravado_core.model import ModelDocstring
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
 
 
 def test_ensure_pickleable_representation_is_pickleable(cat_type):
@@ -43,3 +51,88 @@ def test_ensure_that_get_model_type__from_pickleable_representation_returns_the_
         for attribute_name in iterkeys(cat_type.__dict__)
         if not is_the_same(attribute_name)
     ] == []
+
+
+@pytest.fixture(
+    params=[{}, {'slotted_models': True}, {'sparse_models': True}],
+    ids=['dict', 'slotted', 'sparse'],
+)
+def pets_spec(request, petstore_dict):
+    return Spec.from_dict(petstore_dict, config=request.param)
+
+
+@pytest.fixture
+def pet(pets_spec):
+    return unmarshal_schema_object(
+        pets_spec,
+        pets_spec.spec_dict['definitions']['Pet'],
+        {'id': 1, 'name': 'Sumi', 'photoUrls': ['sumi.png'], 'category': {'id': 200, 'name': 'friendly'}},
+    )
+
+
+def test_model_instances_are_pickleable(pet):
+    pet.additional = 'value'
+    unpickled_pet = pickle.loads(pickle.dumps(pet))
+
+    assert type(unpickled_pet) is type(pet)
+    assert type(unpickled_pet.category) is type(pet.category)
+    assert unpickled_pet == pet
+    assert unpickled_pet._as_dict() == pet._as_dict()
+    assert unpickled_pet.tags is None
+
+
+def test_shared_references_are_preserved(pet):
+    unpickled_pets = pickle.loads(pickle.dumps([pet, pet]))
+    assert unpickled_pets[0] is unpickled_pets[1]
+
+
+def test_unpickle_with_other_spec_instance(pets_spec, pet):
+    data = pickle.dumps(pet)
+    other_spec = Spec.from_dict(copy.deepcopy(pets_spec.spec_dict), config=pets_spec.config)
+    assert type(pickle.loads(data)) is other_spec.definitions['Pet']
+
+
+def test_unpickle_with_unpickled_spec(pets_spec, pet):
+    data = pickle.dumps(pet)
+    unpickled_spec = pickle.loads(pickle.dumps(pets_spec))
+    assert type(pickle.loads(data)) is unpickled_spec.definitions['Pet']
+
+
+def test_unpickle_without_spec(minimal_swagger_dict, definitions_spec):
+    minimal_swagger_dict['definitions'] = definitions_spec
+    cat_type = Spec.from_dict(minimal_swagger_dict).definitions['Cat']
+    data = pickle.dumps(cat_type(id=1))
+    del cat_type
+    gc.collect()
+    with pytest.raises(pickle.UnpicklingError, match='Build the Spec before unpickling its models'):
+        pickle.loads(data)
+
+
+def test_not_registered_model_types_are_not_pickleable(cat_swagger_spec, cat_spec):
+    cat_type = create_model_type(cat_swagger_spec, 'Cat', cat_spec)
+    with pytest.raises(pickle.PicklingError, match="Can't pickle Cat instance"):
+        pickle.dumps(cat_type(id=1))
+
+
+def test_shared_models_stay_frozen(petstore_dict):
+    interning_spec = Spec.from_dict(petstore_dict, config={'intern_values': True})
+    pets = unmarshal_schema_object(
+        interning_spec,
+        {'type': 'array', 'items': interning_spec.spec_dict['definitions']['Pet']},
+        [{'id': pet_id, 'name': 'pet', 'photoUrls': [], 'category': {'id': 200}} for pet_id in range(2)],
+    )
+    unpickled_pets = pickle.loads(pickle.dumps(pets))
+
+    assert unpickled_pets == pets
+    assert unpickled_pets[0].category is unpickled_pets[1].category
+    with pytest.raises(TypeError, match='Category instance is shared'):
+        unpickled_pets[0].category.name = 'unfriendly'
+
+
+def test_copy(pet):
+    pet_copy = copy.copy(pet)
+    assert type(pet_copy) is type(pet)
+    assert pet_copy == pet
+    assert pet_copy.category is pet.category
+    pet_copy.name = 'renamed'
+    assert pet.name == 'Sumi'
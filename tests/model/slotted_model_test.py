@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+import copy
+import sys
+
+import pytest
+
+from bravado_core.model import _MODEL_DICT_SLOT
+from bravado_core.model import create_model_type
+from bravado_core.model import Model
+from bravado_core.model import SlottedModel
+from bravado_core.spec import Spec
+
+
+@pytest.fixture
+def slotted_spec(minimal_swagger_dict):
+    minimal_swagger_dict['definitions']['Pet'] = {
+        'type': 'object',
+        'x-model': 'Pet',
+        'properties': {
+            'id': {'type': 'integer'},
+            'name': {'type': 'string'},
+            'not-an-identifier': {'type': 'string'},
+            '_private': {'type': 'string'},
+            'marshal': {'type': 'string'},
+        },
+    }
+    return Spec.from_dict(minimal_swagger_dict, config={'slotted_models': True, 'use_models': True})
+
+
+@pytest.fixture
+def slotted_pet_type(slotted_spec):
+    return slotted_spec.definitions['Pet']
+
+
+def test_model_types_are_slotted(slotted_pet_type):
+    assert issubclass(slotted_pet_type, SlottedModel)
+    assert slotted_pet_type.__slots__ == ('id', 'name')
+    assert list(slotted_pet_type._property_slots) == ['id', 'name']
+
+
+def test_model_types_not_slotted_by_default(minimal_swagger_dict):
+    minimal_swagger_dict['definitions']['Pet'] = {'type': 'object', 'properties': {'id': {'type': 'integer'}}}
+    pet_type = Spec.from_dict(minimal_swagger_dict).definitions['Pet']
+    # NOTE: issubclass is not used as ModelMeta considers models with the same json reference as the same model
+    assert SlottedModel not in pet_type.__mro__
+    assert pet_type.__slots__ == ()
+
+
+def test_no_overflow_dict_without_additional_properties(slotted_spec, slotted_pet_type):
+    slotted_spec.config['include_missing_properties'] = False
+    pet = slotted_pet_type._from_dict({'id': 1, 'name': 'Fido'})
+    assert _MODEL_DICT_SLOT.__get__(pet, None) is None
+    assert not hasattr(pet, '__dict__')
+    assert pet.id == 1
+    assert pet.name == 'Fido'
+
+
+def test_not_slotted_and_additional_properties(slotted_pet_type):
+    pet = slotted_pet_type(**{'id': 1, 'not-an-identifier': 'x', '_private': 'y', 'marshal': 'z', 'color': 'black'})
+    assert _MODEL_DICT_SLOT.__get__(pet, None) == {
+        'not-an-identifier': 'x', '_private': 'y', 'marshal': 'z', 'color': 'black',
+    }
+    assert pet.name is None
+    assert pet['not-an-identifier'] == 'x'
+    assert pet._private == 'y'
+    assert pet['marshal'] == 'z'
+    assert callable(pet.marshal)
+    assert pet.color == 'black'
+    assert pet._additional_props == {'color'}
+
+
+def test_model_interface(slotted_pet_type):
+    pet = slotted_pet_type(id=1, name='Fido')
+    pet.name = 'Rex'
+    pet.color = 'black'
+    assert pet['name'] == 'Rex'
+    assert 'color' in pet
+    assert 'name' in pet
+    assert set(pet) == {'id', 'name', 'not-an-identifier', '_private', 'marshal', 'color'}
+    assert pet._as_dict()['color'] == 'black'
+    assert repr(pet).startswith("Pet(_private=None, color='black', id=1")
+
+    del pet.name
+    assert pet.name is None
+    del pet.color
+    assert 'color' not in pet
+    with pytest.raises(AttributeError):
+        del pet.color
+    with pytest.raises(AttributeError):
+        pet.unknown
+
+
+def test_missing_properties_not_included(slotted_spec, slotted_pet_type):
+    slotted_spec.config['include_missing_properties'] = False
+    pet = slotted_pet_type(id=1)
+    assert 'name' not in pet
+    with pytest.raises(AttributeError):
+        pet.name
+    with pytest.raises(KeyError):
+        pet['name']
+    assert pet._as_dict() == {'id': 1}
+
+
+def test_equality_and_copy(slotted_spec, slotted_pet_type):
+    pet = slotted_pet_type(id=1, name='Fido', tags=['a'])
+    pet_copy = copy.deepcopy(pet)
+    assert pet_copy == pet
+    assert pet_copy.tags is not pet.tags
+
+    # Model types generated by the same spec, with and without slots
+    not_slotted_pet_type = create_model_type(
+        swagger_spec=slotted_spec,
+        model_name='Pet',
+        model_spec=slotted_pet_type._model_spec,
+        json_reference=slotted_pet_type._json_reference,
+    )
+    assert not_slotted_pet_type(**pet._as_dict()) == pet
+    assert pet == not_slotted_pet_type(**pet._as_dict())
+
+
+def test_equality_compares_overflow_properties(slotted_pet_type):
+    pet = slotted_pet_type(id=1, name='Fido', tags=['a'])
+    assert pet == slotted_pet_type(id=1, name='Fido', tags=['a'], _raw={})
+    assert pet != slotted_pet_type(id=1, name='Fido', tags=['b'])
+    assert pet != slotted_pet_type(id=2, name='Fido', tags=['a'])
+
+
+def test_deepcopy_preserves_references(slotted_pet_type):
+    pet = slotted_pet_type(id=1, name='Fido')
+    pet['marshal'] = pet
+    pet.id = [pet]
+    pet_copy = copy.deepcopy(pet)
+    assert pet_copy['marshal'] is pet_copy
+    assert pet_copy.id[0] is pet_copy
+    assert pet_copy.name == 'Fido'
+
+
+def test_additional_properties_not_allowed(slotted_spec, slotted_pet_type):
+    slotted_pet_type._model_spec['additionalProperties'] = False
+    with pytest.raises(AttributeError):
+        slotted_pet_type(color='black')
+
+
+def test_unmarshal_and_marshal(slotted_pet_type):
+    pet = slotted_pet_type._unmarshal({'id': 1, 'name': 'Fido'})
+    assert isinstance(pet, slotted_pet_type)
+    assert pet._marshal() == {'id': 1, 'name': 'Fido'}
+
+
+def test_inherited_slots(slotted_spec, slotted_pet_type):
+    dog_type = create_model_type(
+        swagger_spec=slotted_spec,
+        model_name='Dog',
+        model_spec={
+            'type': 'object',
+            'properties': {'id': {'type': 'integer'}, 'name': {'type': 'string'}, 'breed': {'type': 'string'}},
+        },
+        bases=(slotted_pet_type,),
+    )
+    assert dog_type.__slots__ == ('breed',)
+    dog = dog_type(id=1, name='Fido', breed='beagle')
+    assert (dog.id, dog.name, dog.breed) == (1, 'Fido', 'beagle')
+
+
+def test_instances_are_smaller(minimal_swagger_dict, slotted_spec, slotted_pet_type):
+    slotted_spec.config['include_missing_properties'] = False
+    minimal_swagger_dict['definitions']['Pet'] = slotted_pet_type._model_spec
+    pet_type = Spec.from_dict(minimal_swagger_dict).definitions['Pet']
+    pet_dict = {'id': 1, 'name': 'Fido', 'not-an-identifier': None, '_private': None, 'marshal': None}
+    pet = pet_type._from_dict(pet_dict)
+    slotted_pet = slotted_pet_type._from_dict({'id': 1, 'name': 'Fido'})
+    assert sys.getsizeof(slotted_pet) + sys.getsizeof(_MODEL_DICT_SLOT.__get__(slotted_pet, None)) < (
+        sys.getsizeof(pet) + sys.getsizeof(_MODEL_DICT_SLOT.__get__(pet, None))
+    )
+
+
+def test_iteration_order_is_the_same_of_not_slotted_models(minimal_swagger_dict):
+    minimal_swagger_dict['definitions']['Cat'] = {
+        'type': 'object',
+        'properties': {
+            'name': {'type': 'string'},
+            'class': {'type': 'string'},
+            'my-tag': {'type': 'string'},
+            'cat': {'type': 'string'},
+        },
+    }
+    properties = {'name': 'Tom', 'class': 'c', 'my-tag': 't', 'cat': 'x', 'tags': ['a']}
+    slotted_cat = Spec.from_dict(
+        minimal_swagger_dict, config={'slotted_models': True},
+    ).definitions['Cat']._from_dict(properties)
+    cat = Spec.from_dict(minimal_swagger_dict).definitions['Cat']._from_dict(properties)
+
+    assert list(cat) == ['name', 'class', 'my-tag', 'cat', 'tags']
+    assert list(slotted_cat) == list(cat)
+    assert list(slotted_cat._as_dict()) == list(cat._as_dict())
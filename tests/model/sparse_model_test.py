@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import copy
+import sys
+
+import pytest
+
+from bravado_core.model import _MODEL_DICT_SLOT
+from bravado_core.model import SlottedModel
+from bravado_core.model import SparseModel
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture
+def wide_model_spec():
+    properties = {'property{}'.format(index): {'type': 'string'} for index in range(50)}
+    properties['id'] = {'type': 'integer'}
+    properties['required'] = {'type': 'string', 'x-nullable': True}
+    return {'type': 'object', 'x-model': 'Wide', 'properties': properties, 'required': ['required']}
+
+
+def _wide_type(minimal_swagger_dict, wide_model_spec, **config):
+    minimal_swagger_dict['definitions']['Wide'] = copy.deepcopy(wide_model_spec)
+    return Spec.from_dict(minimal_swagger_dict, config=config).definitions['Wide']
+
+
+@pytest.fixture
+def dense_type(minimal_swagger_dict, wide_model_spec):
+    return _wide_type(minimal_swagger_dict, wide_model_spec)
+
+
+@pytest.fixture
+def sparse_type(minimal_swagger_dict, wide_model_spec):
+    return _wide_type(minimal_swagger_dict, wide_model_spec, sparse_models=True)
+
+
+def test_sparse_model_types(dense_type, sparse_type):
+    # NOTE: issubclass is not used as ModelMeta considers models with the same json reference as the same model
+    assert SparseModel in sparse_type.__mro__
+    assert SparseModel not in dense_type.__mro__
+
+
+def test_sparse_models_need_include_missing_properties(minimal_swagger_dict, wide_model_spec):
+    wide_type = _wide_type(minimal_swagger_dict, wide_model_spec, sparse_models=True, include_missing_properties=False)
+    assert SparseModel not in wide_type.__mro__
+
+
+def test_sparse_models_ignored_if_slotted_models(minimal_swagger_dict, wide_model_spec):
+    wide_type = _wide_type(minimal_swagger_dict, wide_model_spec, sparse_models=True, slotted_models=True)
+    assert SparseModel not in wide_type.__mro__
+    assert SlottedModel in wide_type.__mro__
+
+
+def test_missing_properties_are_not_stored(sparse_type):
+    wide = sparse_type(id=1, color='black')
+    assert wide._SparseModel__values == {'id': 1, 'color': 'black'}
+    assert wide.property0 is None
+    assert wide['property0'] is None
+    assert 'property0' in wide
+    with pytest.raises(AttributeError):
+        wide.not_a_property
+    with pytest.raises(KeyError):
+        wide['not_a_property']
+
+
+@pytest.mark.parametrize('from_unmarshal', [False, True])
+def test_same_behavior_of_dense_models(dense_type, sparse_type, from_unmarshal):
+    def create(model_type):
+        value = {'id': 1, 'property3': 'value', 'color': 'black'}
+        if from_unmarshal:
+            return unmarshal_schema_object(model_type._swagger_spec, model_type._model_spec, value)
+        return model_type._from_dict(value)
+
+    dense, sparse = create(dense_type), create(sparse_type)
+    assert list(sparse) == list(dense)
+    assert sparse._as_dict() == dense._as_dict()
+    assert list(sparse._as_dict()) == list(dense._as_dict())
+    assert sparse._as_dict(additional_properties=False) == dense._as_dict(additional_properties=False)
+    assert repr(sparse) == repr(dense)
+    assert dir(sparse) == dir(dense)
+    assert sparse._additional_props == dense._additional_props
+    assert sparse._marshal() == dense._marshal() == {'id': 1, 'property3': 'value', 'color': 'black', 'required': None}
+    assert sparse == dense and dense == sparse
+
+    for model in (dense, sparse):
+        model.property4 = 'value'
+        del model.property3
+        del model.color
+    assert sparse._as_dict() == dense._as_dict()
+    assert 'color' not in sparse
+    with pytest.raises(AttributeError):
+        del sparse.color
+
+
+def test_additional_properties_as_many_as_the_properties(minimal_swagger_dict):
+    # Unset properties and additional properties, in the same number
+    minimal_swagger_dict['definitions']['Category'] = {
+        'type': 'object',
+        'properties': {'id': {'type': 'integer'}, 'name': {'type': 'string'}},
+    }
+    dense_type = Spec.from_dict(copy.deepcopy(minimal_swagger_dict)).definitions['Category']
+    sparse_type = Spec.from_dict(minimal_swagger_dict, config={'sparse_models': True}).definitions['Category']
+
+    dense, sparse = dense_type(id=1, extra=2), sparse_type(id=1, extra=2)
+    assert repr(sparse) == repr(dense)
+    assert sparse._as_dict() == dense._as_dict() == {'id': 1, 'name': None, 'extra': 2}
+    assert dir(sparse) == dir(dense)
+    assert sparse == dense
+    assert sparse != sparse_type(id=1)
+    assert dense != dense_type(id=1)
+
+
+def test_equality(sparse_type):
+    assert sparse_type(id=1) == sparse_type(id=1, property0=None)
+    assert sparse_type(id=1, property0=None) == sparse_type(id=1)
+    assert sparse_type(id=1) != sparse_type(id=1, property0='value')
+    assert sparse_type(id=1) != sparse_type(id=1, color=None)
+
+
+def test_deepcopy(sparse_type):
+    wide = sparse_type(id=1, tags=['a'])
+    wide_copy = copy.deepcopy(wide)
+    assert wide_copy == wide
+    assert wide_copy.tags is not wide.tags
+    assert wide_copy._SparseModel__values == {'id': 1, 'tags': ['a']}
+
+
+def test_additional_properties_not_allowed(sparse_type):
+    sparse_type._model_spec['additionalProperties'] = False
+    with pytest.raises(AttributeError):
+        sparse_type(color='black')
+
+
+def test_instances_are_smaller(dense_type, sparse_type):
+    value = {'id': 1, 'property3': 'value'}
+    dense = dense_type._from_dict(value)
+    sparse = sparse_type._from_dict(value)
+    assert sys.getsizeof(sparse._SparseModel__values) * 5 < sys.getsizeof(_MODEL_DICT_SLOT.__get__(dense, None))
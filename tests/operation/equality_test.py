@@ -41,3 +41,11 @@ def test_equality_honors_ignore_swagger_spec_parameters(
     assert getPetByIdPetstoreOperation.is_equal(
         other_getPetByIdPetstoreOperation, ignore_swagger_spec=ignore_swagger_spec,
     ) is ignore_swagger_spec
+
+
+def test_equality_ignores_xscope_metadata(getPetByIdPetstoreOperation, petstore_dict, petstore_abspath):
+    other_petstore_spec = Spec.from_dict(petstore_dict, origin_url=get_url(petstore_abspath))
+    other_getPetByIdPetstoreOperation = other_petstore_spec.resources['pet'].operations['getPetById']
+    other_getPetByIdPetstoreOperation.op_spec['x-scope'] = ['file:///another/location/swagger.json']
+    assert getPetByIdPetstoreOperation.fingerprint == other_getPetByIdPetstoreOperation.fingerprint
+    assert getPetByIdPetstoreOperation.is_equal(other_getPetByIdPetstoreOperation, ignore_swagger_spec=True)
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import io
+
 import pytest
 from mock import Mock
 
@@ -6,6 +8,7 @@ from bravado_core.exception import SwaggerMappingError
 from bravado_core.operation import Operation
 from bravado_core.param import add_file
 from bravado_core.param import Param
+from bravado_core.upload import IteratorReader
 
 
 def test_single_file(empty_swagger_spec):
@@ -85,3 +88,33 @@ def test_mime_type_not_found_in_consumes(empty_swagger_spec):
     with pytest.raises(SwaggerMappingError) as excinfo:
         add_file(param, file_contents, request)
     assert "not found in list of supported mime-types" in str(excinfo.value)
+
+
+def test_single_named_file_with_content_type(empty_swagger_spec):
+    request = {}
+    op = Mock(spec=Operation, consumes=['multipart/form-data'])
+    param_spec = {
+        'type': 'file',
+        'in': 'formData',
+        'name': 'photo',
+    }
+    param = Param(empty_swagger_spec, op, param_spec)
+    file_obj = io.BytesIO(b'I am the contents of a file')
+    add_file(param, ('cat.png', file_obj, 'image/png'), request)
+    assert request == {'files': [('photo', ('cat.png', file_obj, 'image/png'))]}
+
+
+def test_iterator_file_is_streamed(empty_swagger_spec):
+    request = {}
+    op = Mock(spec=Operation, consumes=['multipart/form-data'])
+    param_spec = {
+        'type': 'file',
+        'in': 'formData',
+        'name': 'photo',
+    }
+    param = Param(empty_swagger_spec, op, param_spec)
+    add_file(param, ('cat.png', (chunk for chunk in [b'I am ', b'a file'])), request)
+    [(param_name, (filename, file_obj))] = request['files']
+    assert (param_name, filename) == ('photo', 'cat.png')
+    assert isinstance(file_obj, IteratorReader)
+    assert file_obj.read() == b'I am a file'
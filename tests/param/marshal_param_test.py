@@ -5,10 +5,12 @@ from json import loads
 
 import msgpack
 import pytest
+import pytz
 from jsonschema import ValidationError
 from mock import Mock
 from mock import patch
 
+from bravado_core.codec import JsonCodec
 from bravado_core.content_type import APP_JSON
 from bravado_core.content_type import APP_MSGPACK
 from bravado_core.operation import Operation
@@ -168,6 +170,25 @@ def test_body(empty_swagger_spec, param_spec):
     assert APP_JSON == request['headers']['Content-Type']
 
 
+def test_body_with_json_codec(minimal_swagger_dict, param_spec):
+    param_spec['in'] = 'body'
+    param_spec['schema'] = {
+        'type': 'object',
+    }
+    del param_spec['type']
+    del param_spec['format']
+    json_codec = JsonCodec(name='test', dumps=lambda value: b'encoded', loads=loads)
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'json_codec': json_codec})
+    param = Param(swagger_spec, Mock(spec=Operation), param_spec)
+    request = {
+        'headers': {
+        },
+    }
+    marshal_param(param, {'name': 'Doggie'}, request)
+    assert b'encoded' == request['data']
+    assert APP_JSON == request['headers']['Content-Type']
+
+
 def test_formData_integer(empty_swagger_spec, param_spec):
     param_spec['in'] = 'formData'
     param = Param(empty_swagger_spec, Mock(spec=Operation), param_spec)
@@ -395,6 +416,45 @@ def test_body_msgpack_with_object(empty_swagger_spec):
     assert value == msgpack.unpackb(request['data'], raw=False)
 
 
+@pytest.mark.parametrize(
+    'msgpack_timestamps, expected_created_at',
+    (
+        (False, '2018-05-13T10:20:30+00:00'),
+        (True, datetime.datetime(2018, 5, 13, 10, 20, 30, tzinfo=pytz.utc)),
+    ),
+)
+def test_body_msgpack_with_date_time(empty_swagger_spec, msgpack_timestamps, expected_created_at):
+    empty_swagger_spec.config['msgpack_timestamps'] = msgpack_timestamps
+    param_spec = {
+        'name': 'body',
+        'in': 'body',
+        'schema': {
+            'type': 'object',
+            'properties': {
+                'created_at': {'type': 'string', 'format': 'date-time'},
+            },
+        },
+    }
+    op = Mock(spec=Operation, consumes=[APP_MSGPACK])
+    param = Param(empty_swagger_spec, op, param_spec)
+    request = {'headers': {}}
+    marshal_param(param, {'created_at': datetime.datetime(2018, 5, 13, 10, 20, 30)}, request)
+    assert {'created_at': expected_created_at} == msgpack.unpackb(request['data'], raw=False, timestamp=3)
+
+
+def test_body_json_with_date_time_ignores_msgpack_timestamps(empty_swagger_spec):
+    empty_swagger_spec.config['msgpack_timestamps'] = True
+    param_spec = {
+        'name': 'body',
+        'in': 'body',
+        'schema': {'type': 'string', 'format': 'date-time'},
+    }
+    param = Param(empty_swagger_spec, Mock(spec=Operation, consumes=[APP_JSON]), param_spec)
+    request = {'headers': {}}
+    marshal_param(param, datetime.datetime(2018, 5, 13, 10, 20, 30), request)
+    assert '"2018-05-13T10:20:30+00:00"' == request['data']
+
+
 def test_body_json_preferred_when_both_consumes(empty_swagger_spec, param_spec):
     """When an operation lists both APP_JSON and APP_MSGPACK, JSON takes priority over msgpack."""
     param_spec['in'] = 'body'
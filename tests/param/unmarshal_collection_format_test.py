@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 import pytest
+from jsonschema import ValidationError
+from mock import patch
 
 from bravado_core.exception import SwaggerMappingError
 from bravado_core.param import COLLECTION_FORMATS
@@ -93,3 +95,47 @@ def test_array_is_none_and_nullable(empty_swagger_spec, array_spec):
         empty_swagger_spec, array_spec,
         value=None,
     ) is None
+
+
+def test_items_casted_in_bulk(empty_swagger_spec, array_spec):
+    with patch('bravado_core.param.cast_request_param') as m_cast_request_param:
+        assert [1, 2, 3] == unmarshal_collection_format(empty_swagger_spec, array_spec, '1,2,3')
+    assert not m_cast_request_param.called
+
+
+def test_items_not_castable(empty_swagger_spec, array_spec):
+    # Items failing the cast are left to jsonschema validation, empty items become None
+    assert [1, 'x', None] == unmarshal_collection_format(empty_swagger_spec, array_spec, '1,x,')
+
+
+@pytest.mark.parametrize('items_type, expected', [('number', [1.5, 2.0]), ('boolean', [True, False]), ('string', ['1.5', '2'])])
+def test_items_types(empty_swagger_spec, array_spec, items_type, expected):
+    array_spec['items']['type'] = items_type
+    param_value = 'true,false' if items_type == 'boolean' else '1.5,2'
+    assert expected == unmarshal_collection_format(empty_swagger_spec, array_spec, param_value)
+
+
+def test_max_items_checked_before_casting(empty_swagger_spec, array_spec):
+    array_spec['maxItems'] = 2
+    with patch('bravado_core.param.cast_request_param') as m_cast_request_param:
+        with pytest.raises(ValidationError) as excinfo:
+            unmarshal_collection_format(empty_swagger_spec, array_spec, '1,x,3')
+    assert excinfo.value.validator == 'maxItems'
+    assert "is too long" in excinfo.value.message
+    assert not m_cast_request_param.called
+
+
+def test_max_items_of_sensitive_array(empty_swagger_spec, array_spec):
+    array_spec['maxItems'] = 2
+    array_spec['x-sensitive'] = True
+    with pytest.raises(ValidationError) as excinfo:
+        unmarshal_collection_format(empty_swagger_spec, array_spec, '111,222,333')
+    assert excinfo.value.message == '***  is too long'
+    assert excinfo.value.instance == '***'
+    assert '111' not in str(excinfo.value)
+
+
+def test_max_items_not_checked_if_validation_is_disabled(empty_swagger_spec, array_spec):
+    empty_swagger_spec.config['validate_requests'] = False
+    array_spec['maxItems'] = 2
+    assert [1, 2, 3] == unmarshal_collection_format(empty_swagger_spec, array_spec, '1,2,3')
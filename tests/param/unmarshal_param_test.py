@@ -1,18 +1,26 @@
 # -*- coding: utf-8 -*-
+import array
 import datetime
+import io
 
 import msgpack
 import pytest
+import pytz
+from jsonschema import ValidationError
 from mock import Mock
 from mock import patch
 
+from bravado_core.content_type import APP_JSON
 from bravado_core.content_type import APP_MSGPACK
 from bravado_core.exception import SwaggerMappingError
+from bravado_core.exception import UploadTooLargeError
 from bravado_core.operation import Operation
+from bravado_core.param import _get_param_unmarshaling_method
 from bravado_core.param import Param
 from bravado_core.param import unmarshal_param
 from bravado_core.request import IncomingRequest
 from bravado_core.spec import Spec
+from bravado_core.upload import SpooledUpload
 
 
 @pytest.fixture
@@ -167,6 +175,32 @@ def test_query_int_array(test_input, expected, empty_swagger_spec, int_array_par
     assert expected == unmarshal_param(param, request)
 
 
+@pytest.mark.parametrize(
+    'items_type, test_input, expected',
+    (
+        ('integer', '1,2,3', array.array('q', [1, 2, 3])),
+        ('number', '1.5,2', array.array('d', [1.5, 2.0])),
+        ('string', '1,2', ['1', '2']),
+    ),
+)
+def test_query_typed_array(minimal_swagger_dict, int_array_param_spec, items_type, test_input, expected):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'typed_array_params': True})
+    int_array_param_spec['collectionFormat'] = 'csv'
+    int_array_param_spec['items'] = {'type': items_type}
+    param = Param(swagger_spec, Mock(spec=Operation), int_array_param_spec)
+    request = Mock(spec=IncomingRequest, query={'numbers': test_input})
+    assert expected == unmarshal_param(param, request)
+
+
+def test_query_typed_array_not_valid_items(minimal_swagger_dict, int_array_param_spec):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'typed_array_params': True, 'validate_requests': False})
+    int_array_param_spec['collectionFormat'] = 'csv'
+    int_array_param_spec['items'] = {'type': 'integer'}
+    param = Param(swagger_spec, Mock(spec=Operation), int_array_param_spec)
+    request = Mock(spec=IncomingRequest, query={'numbers': '1,x'})
+    assert [1, 'x'] == unmarshal_param(param, request)
+
+
 def test_query_string_boolean_values(empty_swagger_spec, boolean_param_spec):
     param = Param(empty_swagger_spec, Mock(spec=Operation), boolean_param_spec)
     request = Mock(spec=IncomingRequest, query={'isPet': True})
@@ -242,13 +276,13 @@ def test_body(empty_swagger_spec, param_spec):
 
 
 def assert_validate_call_count(expected_call_count, config, petstore_dict):
-    with patch('bravado_core.param.validate_schema_object') as m_validate:
+    with patch('bravado_core.param.get_schema_object_validator') as m_get_validator:
         petstore_spec = Spec.from_dict(petstore_dict, config=config)
         request = Mock(spec=IncomingRequest, path={'petId': 34})
         op = petstore_spec.resources['pet'].operations['getPetById']
         param = op.params['petId']
         unmarshal_param(param, request)
-        assert expected_call_count == m_validate.call_count
+        assert expected_call_count == m_get_validator.return_value.call_count
 
 
 def test_dont_validate_requests(petstore_dict):
@@ -319,6 +353,21 @@ def test_body_msgpack(empty_swagger_spec, param_spec):
     assert 34 == unmarshal_param(param, request)
 
 
+def test_body_msgpack_file_like(empty_swagger_spec, param_spec):
+    """The msgpack body could be provided as a file-like object, decoded incrementally."""
+    param_spec['in'] = 'body'
+    param_spec['schema'] = {'type': 'array', 'items': {'type': 'integer'}}
+    del param_spec['type']
+    del param_spec['format']
+    param = Param(empty_swagger_spec, Mock(spec=Operation), param_spec)
+    request = Mock(
+        spec=IncomingRequest,
+        headers={'Content-Type': APP_MSGPACK},
+        raw_bytes=io.BytesIO(msgpack.packb(list(range(1000)), use_bin_type=True)),
+    )
+    assert list(range(1000)) == unmarshal_param(param, request)
+
+
 def test_body_msgpack_with_object(empty_swagger_spec):
     """Verifies that a msgpack-encoded dict body is correctly unpacked back into a Python dict."""
     param_spec = {
@@ -421,3 +470,98 @@ def test_path_param_unaffected_by_msgpack_content_type(empty_swagger_spec, param
         headers={'Content-Type': APP_MSGPACK},
     )
     assert 34 == unmarshal_param(param, request)
+
+
+def test_unmarshaling_method_is_built_once(petstore_spec):
+    param = petstore_spec.resources['pet'].operations['getPetById'].params['petId']
+    assert _get_param_unmarshaling_method(param) is _get_param_unmarshaling_method(param)
+
+
+def test_validate_requests_is_checked_on_every_call(petstore_spec):
+    param = petstore_spec.resources['pet'].operations['findPetsByStatus'].params['status']
+    request = Mock(spec=IncomingRequest, query={'status': 'unknown_status'})
+    petstore_spec.config['validate_requests'] = False
+    assert unmarshal_param(param, request) == ['unknown_status']
+
+    petstore_spec.config['validate_requests'] = True
+    with pytest.raises(ValidationError):
+        unmarshal_param(param, request)
+
+
+@pytest.mark.parametrize('json_codec', ['json', 'simplejson'])
+def test_body_with_json_codec(minimal_swagger_dict, param_spec, json_codec):
+    param_spec['in'] = 'body'
+    param_spec['schema'] = {'type': 'object'}
+    del param_spec['type']
+    del param_spec['format']
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'json_codec': json_codec})
+    param = Param(swagger_spec, Mock(spec=Operation), param_spec)
+    request = Mock(spec=IncomingRequest, headers={'Content-Type': APP_JSON}, raw_bytes=b'{"name": "Doggie"}')
+    assert unmarshal_param(param, request) == {'name': 'Doggie'}
+    assert not request.json.called
+
+
+@pytest.mark.parametrize('required', [True, False])
+def test_body_with_json_codec_invalid_json(minimal_swagger_dict, param_spec, required):
+    param_spec['in'] = 'body'
+    param_spec['required'] = required
+    param_spec['schema'] = {'type': 'object'}
+    del param_spec['type']
+    del param_spec['format']
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'json_codec': 'json'})
+    param = Param(swagger_spec, Mock(spec=Operation), param_spec)
+    request = Mock(spec=IncomingRequest, headers={}, raw_bytes=b'{')
+    if required:
+        with pytest.raises(SwaggerMappingError, match='Error reading request body JSON'):
+            unmarshal_param(param, request)
+    else:
+        assert unmarshal_param(param, request) is None
+
+
+def test_body_msgpack_with_timestamps(minimal_swagger_dict):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'msgpack_timestamps': True})
+    param_spec = {
+        'name': 'body',
+        'in': 'body',
+        'schema': {
+            'type': 'object',
+            'properties': {
+                'created_at': {'type': 'string', 'format': 'date-time'},
+            },
+        },
+    }
+    created_at = datetime.datetime(2018, 5, 13, 10, 20, 30, tzinfo=pytz.utc)
+    param = Param(swagger_spec, Mock(spec=Operation), param_spec)
+    request = Mock(
+        spec=IncomingRequest,
+        headers={'Content-Type': APP_MSGPACK},
+        raw_bytes=msgpack.packb({'created_at': created_at}, use_bin_type=True, datetime=True),
+    )
+    assert {'created_at': created_at} == unmarshal_param(param, request)
+
+
+def test_formdata_file_spooled(minimal_swagger_dict):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'spool_uploads': True, 'upload_spool_size': 10})
+    param_spec = {'name': 'photo', 'in': 'formData', 'type': 'file'}
+    param = Param(swagger_spec, Mock(spec=Operation), param_spec)
+    request = Mock(spec=IncomingRequest, files={'photo': io.BytesIO(b'x' * 100)})
+    value = unmarshal_param(param, request)
+    assert isinstance(value, SpooledUpload)
+    assert value.read() == b'x' * 100
+
+
+def test_formdata_file_too_large(minimal_swagger_dict):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'spool_uploads': True, 'upload_max_size': 10})
+    param_spec = {'name': 'photo', 'in': 'formData', 'type': 'file'}
+    param = Param(swagger_spec, Mock(spec=Operation), param_spec)
+    request = Mock(spec=IncomingRequest, files={'photo': io.BytesIO(b'x' * 100)})
+    with pytest.raises(UploadTooLargeError):
+        unmarshal_param(param, request)
+
+
+def test_formdata_file_not_spooled(empty_swagger_spec):
+    param_spec = {'name': 'photo', 'in': 'formData', 'type': 'file'}
+    param = Param(empty_swagger_spec, Mock(spec=Operation), param_spec)
+    upload = io.BytesIO(b'x' * 100)
+    request = Mock(spec=IncomingRequest, files={'photo': upload})
+    assert unmarshal_param(param, request) is upload
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import pytest
+from mock import Mock
+
+from bravado_core.operation import Operation
+from bravado_core.param import Param
+from bravado_core.param import unmarshal_collection_format
+from bravado_core.param import unmarshal_param
+from bravado_core.request import IncomingRequest
+from bravado_core.spec import Spec
+
+
+@pytest.fixture
+def ids_param_spec():
+    return {
+        'name': 'ids',
+        'in': 'query',
+        'type': 'array',
+        'collectionFormat': 'csv',
+        'maxItems': 5000,
+        'items': {'type': 'integer'},
+    }
+
+
+@pytest.fixture
+def ids():
+    return ','.join(str(i) for i in range(5000))
+
+
+def test_unmarshal_collection_format(benchmark, minimal_swagger_spec, ids_param_spec, ids):
+    benchmark(unmarshal_collection_format, minimal_swagger_spec, ids_param_spec, ids)
+
+
+@pytest.mark.parametrize('typed_array_params', [False, True], ids=['list', 'array'])
+def test_unmarshal_param(benchmark, minimal_swagger_dict, ids_param_spec, ids, typed_array_params):
+    swagger_spec = Spec.from_dict(
+        minimal_swagger_dict,
+        config={'validate_requests': False, 'typed_array_params': typed_array_params},
+    )
+    param = Param(swagger_spec, Mock(spec=Operation), ids_param_spec)
+    benchmark(unmarshal_param, param, Mock(spec=IncomingRequest, query={'ids': ids}))
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+import copy
+import json
 import uuid
 
+import msgpack
 import pytest
 
 from bravado_core.spec import Spec
@@ -55,11 +58,24 @@ def large_pets(number_of_objects):
     params=[True, False],
     ids=['full-deref', 'with-refs'],
 )
-def perf_petstore_spec(request, petstore_spec):
+def internally_dereference_refs(request):
+    return request.param
+
+
+@pytest.fixture(
+    params=[True, False],
+    ids=['models', 'dicts'],
+)
+def use_models(request):
+    return request.param
+
+
+@pytest.fixture
+def perf_petstore_spec(internally_dereference_refs, petstore_spec):
     return Spec.from_dict(
         spec_dict=petstore_spec.spec_dict,
         origin_url=petstore_spec.origin_url,
-        config=dict(petstore_spec.config, internally_dereference_refs=request.param),
+        config=dict(petstore_spec.config, internally_dereference_refs=internally_dereference_refs),
     )
 
 
@@ -80,3 +96,31 @@ def petstore_op(request, perf_petstore_spec):
     op = perf_petstore_spec.resources['pet'].findPetsByStatus
     op.swagger_spec.config['validate_responses'] = request.param
     return op
+
+
+@pytest.fixture(
+    params=['application/json', 'application/msgpack'],
+    ids=['json', 'msgpack'],
+)
+def content_type(request):
+    return request.param
+
+
+@pytest.fixture
+def content_type_petstore_spec(content_type, perf_petstore_spec):
+    """Petstore spec whose findPetsByStatus and addPet operations only produce and consume content_type.
+    JSON bodies are decoded from bytes (via json_codec config) like msgpack bodies."""
+    spec_dict = copy.deepcopy(perf_petstore_spec.spec_dict)
+    spec_dict['paths']['/pet/findByStatus']['get']['produces'] = [content_type]
+    spec_dict['paths']['/pet']['post']['consumes'] = [content_type]
+    return Spec.from_dict(
+        spec_dict=spec_dict,
+        origin_url=perf_petstore_spec.origin_url,
+        config=dict(perf_petstore_spec.config, json_codec='json'),
+    )
+
+
+def encode_body(content_type, value):
+    if content_type == 'application/msgpack':
+        return msgpack.packb(value, use_bin_type=True)
+    return json.dumps(value).encode('utf-8')
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+from bravado_core.param import marshal_param
+from bravado_core.response import IncomingResponse
+from bravado_core.response import unmarshal_response
+from tests.profiling.conftest import encode_body
+
+
+class FakeResponse(IncomingResponse):
+
+    def __init__(self, content_type, raw_bytes):
+        self.raw_bytes = raw_bytes
+        self.status_code = 200
+        self.reason = 'OK'
+        self.headers = {'content-type': content_type}
+
+
+def test_unmarshal_response(benchmark, content_type, content_type_petstore_spec, large_pets):
+    op = content_type_petstore_spec.resources['pet'].findPetsByStatus
+    raw_bytes = encode_body(content_type, large_pets)
+    benchmark(lambda: unmarshal_response(FakeResponse(content_type, raw_bytes), op))
+
+
+def test_marshal_body_param(benchmark, content_type_petstore_spec, large_pets):
+    param = content_type_petstore_spec.resources['pet'].addPet.params['body']
+    benchmark(lambda: [marshal_param(param, pet, {'headers': {}}) for pet in large_pets])
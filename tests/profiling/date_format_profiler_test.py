@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import dateutil.parser
+import pytest
+
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+NUMBER_OF_VALUES = 1000
+
+
+@pytest.fixture(params=['Z', '+05:30', ''], ids=['utc', 'offset', 'naive'])
+def date_times(request):
+    return [
+        '2019-{:02d}-{:02d}T13:19:{:02d}.{:06d}{}'.format(index % 12 + 1, index % 28 + 1, index % 60, index, request.param)
+        for index in range(NUMBER_OF_VALUES)
+    ]
+
+
+@pytest.fixture
+def timestamps_spec(minimal_swagger_dict):
+    minimal_swagger_dict['definitions']['Event'] = {
+        'type': 'object',
+        'properties': {
+            'created_at': {'type': 'string', 'format': 'date-time'},
+            'day': {'type': 'string', 'format': 'date'},
+        },
+    }
+    return Spec.from_dict(minimal_swagger_dict, config={'use_models': False})
+
+
+@pytest.mark.parametrize('format_name', ['date-time', 'date'])
+def test_to_python(benchmark, minimal_swagger_spec, date_times, format_name):
+    to_python = minimal_swagger_spec.get_format(format_name).to_python
+    values = date_times if format_name == 'date-time' else [date_time[:10] for date_time in date_times]
+    benchmark(lambda: [to_python(value) for value in values])
+
+
+def test_dateutil_to_python(benchmark, date_times):
+    # Reference: parsing via dateutil, used by default formats for non RFC 3339 values
+    benchmark(lambda: [dateutil.parser.parse(value) for value in date_times])
+
+
+def test_to_wire(benchmark, minimal_swagger_spec, date_times):
+    to_wire = minimal_swagger_spec.get_format('date-time').to_wire
+    values = [dateutil.parser.parse(value) for value in date_times]
+    benchmark(lambda: [to_wire(value) for value in values])
+
+
+def test_unmarshal_timestamps(benchmark, timestamps_spec, date_times):
+    events_schema = {'type': 'array', 'items': timestamps_spec.spec_dict['definitions']['Event']}
+    events = [{'created_at': date_time, 'day': date_time[:10]} for date_time in date_times]
+    result = benchmark(unmarshal_schema_object, timestamps_spec, events_schema, events)
+    assert isinstance(result[0]['created_at'], datetime.datetime)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import decimal
+import uuid
+
+import pytest
+
+from bravado_core.formatter import NO_OP
+from bravado_core.formatter import SwaggerFormat
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+MONEY_FORMAT = SwaggerFormat(
+    format='money',
+    to_python=lambda value: decimal.Decimal(value).quantize(decimal.Decimal('0.01')),
+    to_wire=lambda value: str(value),
+    validate=NO_OP,
+    description='Converts [wire]string:money <=> python Decimal',
+)
+
+
+@pytest.fixture(params=[False, True], ids=['not-cached', 'cached'])
+def events_spec(request, minimal_swagger_dict):
+    minimal_swagger_dict['definitions']['Event'] = {
+        'type': 'object',
+        'properties': {
+            'day': {'type': 'string', 'format': 'date'},
+            'created_at': {'type': 'string', 'format': 'date-time'},
+            'amount': {'type': 'string', 'format': 'money'},
+        },
+    }
+    cached_formats = {'date': 1024, 'date-time': 1024, 'money': 1024} if request.param else {}
+    return Spec.from_dict(
+        minimal_swagger_dict,
+        config={'use_models': False, 'formats': [MONEY_FORMAT], 'cached_formats': cached_formats},
+    )
+
+
+@pytest.fixture
+def events(number_of_objects):
+    # A day's worth of events: the same days and amounts, a few distinct timestamps
+    return [
+        {
+            'day': '2019-01-{:02d}'.format(index % 2 + 1),
+            'created_at': '2019-01-01T{:02d}:00:00Z'.format(index % 24),
+            'amount': '{}.99'.format(index % 10),
+            'id': str(uuid.uuid4()),
+        }
+        for index in range(number_of_objects)
+    ]
+
+
+def test_unmarshal_formatted_values(benchmark, events_spec, events):
+    events_schema = {'type': 'array', 'items': events_spec.spec_dict['definitions']['Event']}
+    benchmark(unmarshal_schema_object, events_spec, events_schema, events)
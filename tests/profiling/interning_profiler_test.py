@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture(params=[False, True], ids=['not_interned', 'interned'])
+def pet_spec(request, petstore_spec):
+    return Spec.from_dict(
+        spec_dict=petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config={'intern_values': request.param},
+    )
+
+
+def test_unmarshal_models(benchmark, pet_spec, large_pets):
+    benchmark(
+        unmarshal_schema_object,
+        pet_spec,
+        {'type': 'array', 'items': pet_spec.spec_dict['definitions']['Pet']},
+        large_pets,
+    )
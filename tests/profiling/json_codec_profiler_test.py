@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from bravado_core.codec import get_json_codec
+from bravado_core.param import marshal_param
+from bravado_core.response import IncomingResponse
+from bravado_core.response import unmarshal_response
+from bravado_core.spec import Spec
+
+
+class FakeJsonResponse(IncomingResponse):
+
+    def __init__(self, raw_bytes):
+        self.raw_bytes = raw_bytes
+        self.status_code = 200
+        self.reason = 'OK'
+        self.headers = {'content-type': 'application/json'}
+
+    def json(self, **kwargs):
+        return json.loads(self.raw_bytes)
+
+
+@pytest.fixture(
+    params=[None, 'json', 'simplejson', 'orjson'],
+    ids=['default', 'json', 'simplejson', 'orjson'],
+)
+def json_codec_petstore_spec(request, petstore_spec):
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    return Spec.from_dict(
+        spec_dict=petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config=dict(petstore_spec.config, json_codec=request.param, validate_responses=False),
+    )
+
+
+def test_unmarshal_response(benchmark, json_codec_petstore_spec, large_pets):
+    op = json_codec_petstore_spec.resources['pet'].findPetsByStatus
+    response = FakeJsonResponse(json.dumps(large_pets).encode('utf-8'))
+    benchmark(unmarshal_response, response, op)
+
+
+def test_marshal_body_param(benchmark, json_codec_petstore_spec):
+    param = json_codec_petstore_spec.resources['pet'].addPet.params['body']
+    pet = {
+        'id': 1,
+        'name': 'Doggie',
+        'status': 'available',
+        'photoUrls': ['wagtail.png', 'bark.png'],
+        'category': {'id': 200, 'name': 'friendly'},
+        'tags': [{'id': 99, 'name': 'mini'}, {'id': 100, 'name': 'brown'}],
+    }
+    benchmark(lambda: marshal_param(param, pet, {'headers': {}}))
+
+
+@pytest.mark.parametrize('json_codec_name', ['json', 'simplejson', 'orjson'])
+def test_decode(benchmark, json_codec_name, large_pets):
+    if json_codec_name == 'orjson':
+        pytest.importorskip('orjson')
+    json_codec = get_json_codec(json_codec_name)
+    benchmark(json_codec.loads, json.dumps(large_pets).encode('utf-8'))
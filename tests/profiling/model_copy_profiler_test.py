@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import copy
+
+import pytest
+
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture(params=[False, True], ids=['dict', 'slots'])
+def pets(request, petstore_spec, large_pets):
+    pet_spec = Spec.from_dict(
+        spec_dict=petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config={'slotted_models': request.param},
+    )
+    return unmarshal_schema_object(
+        pet_spec,
+        {'type': 'array', 'items': pet_spec.spec_dict['definitions']['Pet']},
+        large_pets,
+    )
+
+
+def test_as_dict(benchmark, pets):
+    benchmark(lambda: [pet._as_dict() for pet in pets])
+
+
+def test_equality(benchmark, pets):
+    other_pets = copy.deepcopy(pets)
+    benchmark(lambda: pets == other_pets)
+
+
+def test_deepcopy(benchmark, pets):
+    benchmark(copy.deepcopy, pets)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import pytest
+
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.spec import Spec
+
+
+@pytest.fixture
+def pet_list(polymorphic_dict):
+    polymorphic_spec = Spec.from_dict(polymorphic_dict, origin_url='file:///polymorphic.json')
+    definitions = polymorphic_spec.definitions
+    pets = [
+        definitions['Dog'](name='dog{}'.format(index), type='Dog', birth_date=datetime.date(2019, 1, 1))
+        if index % 2 else
+        definitions['Cat'](name='cat{}'.format(index), type='Cat', color='black')
+        for index in range(1000)
+    ]
+    return polymorphic_spec, definitions['PetList'](number_of_pets=len(pets), list=pets)
+
+
+def test_isinstance_models(benchmark, pet_list):
+    polymorphic_spec, pets = pet_list
+    # Model types generated by a different Spec object
+    other_spec = Spec.from_dict(polymorphic_spec.spec_dict, origin_url=polymorphic_spec.origin_url)
+    model_types = tuple(other_spec.definitions.values())
+    benchmark(lambda: [isinstance(pet, model_type) for pet in pets.list for model_type in model_types])
+
+
+def test_marshal_polymorphic_models(benchmark, pet_list):
+    polymorphic_spec, pets = pet_list
+    benchmark(marshal_schema_object, polymorphic_spec, polymorphic_spec.spec_dict['definitions']['PetList'], pets)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+import pytest
+
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture(params=[{}, {'slotted_models': True}, {'sparse_models': True}], ids=['dict', 'slots', 'sparse'])
+def pets_spec(request, petstore_spec):
+    return Spec.from_dict(
+        spec_dict=petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config=request.param,
+    )
+
+
+@pytest.fixture
+def pets_schema(pets_spec):
+    return {'type': 'array', 'items': pets_spec.spec_dict['definitions']['Pet']}
+
+
+@pytest.fixture
+def pets(pets_spec, pets_schema, large_pets):
+    return unmarshal_schema_object(pets_spec, pets_schema, large_pets)
+
+
+def test_pickle_models(benchmark, pets):
+    benchmark(lambda: pickle.loads(pickle.dumps(pets, pickle.HIGHEST_PROTOCOL)))
+
+
+def test_pickle_marshaled_values(benchmark, pets_spec, pets_schema, pets):
+    # Alternative to pickling the models: pickle the marshaled values and unmarshal them again
+    def pickle_marshaled_values():
+        data = pickle.dumps(marshal_schema_object(pets_spec, pets_schema, pets), pickle.HIGHEST_PROTOCOL)
+        return unmarshal_schema_object(pets_spec, pets_schema, pickle.loads(data))
+
+    benchmark(pickle_marshaled_values)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import io
+
+import msgpack
+
+from bravado_core.codec import decode_msgpack
+from bravado_core.response import IncomingResponse
+from bravado_core.response import unmarshal_response
+
+
+class FakeMsgpackResponse(IncomingResponse):
+
+    def __init__(self, raw_bytes):
+        self.raw_bytes = raw_bytes
+        self.status_code = 200
+        self.reason = 'OK'
+        self.headers = {'content-type': 'application/msgpack'}
+
+
+def test_decode_bytes(benchmark, large_pets):
+    benchmark(decode_msgpack, msgpack.packb(large_pets, use_bin_type=True))
+
+
+def test_decode_file_like(benchmark, large_pets):
+    raw_bytes = msgpack.packb(large_pets, use_bin_type=True)
+    benchmark(lambda: decode_msgpack(io.BytesIO(raw_bytes)))
+
+
+def test_unmarshal_response(benchmark, petstore_op, large_pets):
+    raw_bytes = msgpack.packb(large_pets, use_bin_type=True)
+    benchmark(lambda: unmarshal_response(FakeMsgpackResponse(raw_bytes), petstore_op))
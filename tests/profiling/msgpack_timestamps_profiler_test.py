@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import pytest
+import pytz
+from mock import Mock
+
+from bravado_core.content_type import APP_MSGPACK
+from bravado_core.operation import Operation
+from bravado_core.param import marshal_param
+from bravado_core.param import Param
+from bravado_core.param import unmarshal_param
+from bravado_core.request import IncomingRequest
+from bravado_core.spec import Spec
+
+
+@pytest.fixture(params=[False, True], ids=['strings', 'timestamps'])
+def events_param(request, minimal_swagger_dict):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'msgpack_timestamps': request.param})
+    param_spec = {
+        'name': 'body',
+        'in': 'body',
+        'schema': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'properties': {
+                    'id': {'type': 'integer'},
+                    'created_at': {'type': 'string', 'format': 'date-time'},
+                    'updated_at': {'type': 'string', 'format': 'date-time'},
+                },
+            },
+        },
+    }
+    return Param(swagger_spec, Mock(spec=Operation, consumes=[APP_MSGPACK]), param_spec)
+
+
+@pytest.fixture
+def events():
+    now = datetime.datetime(2018, 5, 13, 10, 20, 30, 123456, tzinfo=pytz.utc)
+    return [
+        {'id': index, 'created_at': now, 'updated_at': now + datetime.timedelta(seconds=index)}
+        for index in range(1000)
+    ]
+
+
+def test_marshal_param(benchmark, events_param, events):
+    benchmark(lambda: marshal_param(events_param, events, {'headers': {}}))
+
+
+def test_unmarshal_param(benchmark, events_param, events):
+    request = {'headers': {}}
+    marshal_param(events_param, events, request)
+    raw_bytes = request['data']
+    benchmark(
+        lambda: unmarshal_param(
+            events_param,
+            Mock(spec=IncomingRequest, headers={'Content-Type': APP_MSGPACK}, raw_bytes=raw_bytes),
+        ),
+    )
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.param import marshal_param
+from bravado_core.request import IncomingRequest
+from bravado_core.request import unmarshal_request
+from bravado_core.spec import Spec
+
+
+# (name, schema, marshaled value, value sent by clients)
+_PARAMS = [
+    ('name', {'type': 'string'}, 'doggie', 'doggie'),
+    ('count', {'type': 'integer'}, 42, '42'),
+    ('weight', {'type': 'number'}, 4.2, '4.2'),
+    ('available', {'type': 'boolean'}, True, 'true'),
+    ('tags', {'type': 'array', 'collectionFormat': 'csv', 'items': {'type': 'string'}}, ['a', 'b'], 'a,b'),
+]
+
+_PET = {
+    'id': 1,
+    'name': 'doggie',
+    'status': 'available',
+    'photoUrls': ['wagtail.png', 'bark.png'],
+    'category': {'id': 200, 'name': 'friendly'},
+    'tags': [{'id': 99, 'name': 'mini'}, {'id': 100, 'name': 'brown'}],
+}
+
+
+class FakeRequest(IncomingRequest):
+
+    def __init__(self, path=None, query=None, headers=None, form=None, body=None):
+        self.path = path or {}
+        self.query = query or {}
+        self.headers = headers or {}
+        self.form = form or {}
+        self.files = {}
+        self.body = body
+
+    def json(self, **kwargs):
+        return self.body
+
+
+@pytest.fixture(
+    params=['path', 'query', 'header', 'formData', 'body'],
+)
+def location(request):
+    return request.param
+
+
+@pytest.fixture(
+    params=[True, False],
+    ids=['validate', 'not_validate'],
+)
+def location_op(request, location, petstore_spec):
+    if location == 'body':
+        parameters = [{'name': 'body', 'in': 'body', 'required': True, 'schema': {'$ref': '#/definitions/Pet'}}]
+    else:
+        parameters = [
+            dict(schema, name=name, **{'in': location, 'required': True})
+            for name, schema, _, _ in _PARAMS
+        ]
+    path_name = '/items' + ''.join('/{%s}' % name for name, _, _, _ in _PARAMS) if location == 'path' else '/items'
+    spec = Spec.from_dict(
+        {
+            'swagger': '2.0',
+            'info': {'title': 'Items API', 'version': '1.0.0'},
+            'consumes': ['application/json'],
+            'paths': {
+                path_name: {
+                    'post': {
+                        'operationId': 'add_item',
+                        'tags': ['items'],
+                        'parameters': parameters,
+                        'responses': {'200': {'description': 'OK'}},
+                    },
+                },
+            },
+            'definitions': petstore_spec.spec_dict['definitions'],
+        },
+        config={'validate_requests': request.param},
+    )
+    return spec.resources['items'].operations['add_item']
+
+
+def test_unmarshal_request(benchmark, location, location_op):
+    if location == 'body':
+        request = FakeRequest(headers={'Content-Type': 'application/json'}, body=_PET)
+    else:
+        values = {name: raw_value for name, _, _, raw_value in _PARAMS}
+        request = FakeRequest(**{
+            'path': {'path': values},
+            'query': {'query': values},
+            'header': {'headers': values},
+            'formData': {'form': values},
+        }[location])
+    benchmark(unmarshal_request, request, location_op)
+
+
+def test_marshal_params(benchmark, location, location_op):
+    if location == 'body':
+        values = {'body': _PET}
+    else:
+        values = {name: value for name, _, value, _ in _PARAMS}
+    params = location_op.params
+
+    def marshal_params():
+        request = {'url': location_op.path_name, 'params': {}, 'headers': {}}
+        for name, value in values.items():
+            marshal_param(params[name], value, request)
+        return request
+
+    benchmark(marshal_params)
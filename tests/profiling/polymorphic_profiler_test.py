@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+from bravado_core.validate import validate_schema_object
+from tests.conftest import get_url
+
+
+@pytest.fixture
+def perf_polymorphic_spec(internally_dereference_refs, use_models, polymorphic_dict, polymorphic_abspath):
+    return Spec.from_dict(
+        spec_dict=polymorphic_dict,
+        origin_url=get_url(polymorphic_abspath),
+        config={'internally_dereference_refs': internally_dereference_refs, 'use_models': use_models},
+    )
+
+
+@pytest.fixture
+def pet_list_schema(perf_polymorphic_spec):
+    return perf_polymorphic_spec.deref(perf_polymorphic_spec._internal_spec_dict['definitions']['PetList'])
+
+
+@pytest.fixture
+def pet_list(number_of_objects):
+    # Dogs and Cats (subtypes of GenericPet selected via its discriminator)
+    return {
+        'number_of_pets': number_of_objects,
+        'list': [
+            {'name': 'dog{}'.format(i), 'type': 'Dog', 'birth_date': '2017-03-09'}
+            if i % 2 else
+            {'name': 'cat{}'.format(i), 'type': 'Cat', 'color': 'white'}
+            for i in range(number_of_objects)
+        ],
+    }
+
+
+def test_unmarshal(benchmark, perf_polymorphic_spec, pet_list_schema, pet_list):
+    benchmark(unmarshal_schema_object, perf_polymorphic_spec, pet_list_schema, pet_list)
+
+
+def test_marshal(benchmark, perf_polymorphic_spec, pet_list_schema, pet_list):
+    unmarshaled_pet_list = unmarshal_schema_object(perf_polymorphic_spec, pet_list_schema, pet_list)
+    benchmark(marshal_schema_object, perf_polymorphic_spec, pet_list_schema, unmarshaled_pet_list)
+
+
+def test_validate(benchmark, perf_polymorphic_spec, pet_list_schema, pet_list):
+    benchmark(validate_schema_object, perf_polymorphic_spec, pet_list_schema, pet_list)
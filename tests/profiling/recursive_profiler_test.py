@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+from bravado_core.validate import validate_schema_object
+from tests.conftest import get_url
+
+# Nodes of every linked list
+_LIST_LENGTH = 10
+
+
+@pytest.fixture
+def perf_recursive_spec(internally_dereference_refs, use_models, minimal_swagger_dict, minimal_swagger_abspath, node_spec):
+    minimal_swagger_dict['definitions']['Node'] = node_spec
+    return Spec.from_dict(
+        spec_dict=minimal_swagger_dict,
+        origin_url=get_url(minimal_swagger_abspath),
+        config={'internally_dereference_refs': internally_dereference_refs, 'use_models': use_models},
+    )
+
+
+@pytest.fixture
+def node_list_schema(perf_recursive_spec):
+    return {'type': 'array', 'items': perf_recursive_spec._internal_spec_dict['definitions']['Node']}
+
+
+@pytest.fixture
+def linked_lists(number_of_objects):
+    linked_lists = []
+    for i in range(number_of_objects // _LIST_LENGTH):
+        node = None
+        for j in range(_LIST_LENGTH):
+            node = {'name': 'node{}-{}'.format(i, j), 'date': '2019-01-01', 'child': node}
+            if node['child'] is None:
+                del node['child']
+        linked_lists.append(node)
+    return linked_lists
+
+
+def test_unmarshal(benchmark, perf_recursive_spec, node_list_schema, linked_lists):
+    benchmark(unmarshal_schema_object, perf_recursive_spec, node_list_schema, linked_lists)
+
+
+def test_marshal(benchmark, perf_recursive_spec, node_list_schema, linked_lists):
+    nodes = unmarshal_schema_object(perf_recursive_spec, node_list_schema, linked_lists)
+    benchmark(marshal_schema_object, perf_recursive_spec, node_list_schema, nodes)
+
+
+def test_validate(benchmark, perf_recursive_spec, node_list_schema, linked_lists):
+    benchmark(validate_schema_object, perf_recursive_spec, node_list_schema, linked_lists)
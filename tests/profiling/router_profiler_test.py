@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.spec import Spec
+
+
+@pytest.fixture(scope='module')
+def large_spec():
+    paths = {}
+    for i in range(300):
+        paths['/resource{}'.format(i)] = {'get': {'responses': {'200': {'description': 'OK'}}}}
+        paths['/resource{}/{{id}}'.format(i)] = {
+            http_method: {'responses': {'200': {'description': 'OK'}}}
+            for http_method in ('get', 'put', 'delete')
+        }
+        paths['/resource{}/{{id}}/children/{{childId}}'.format(i)] = {'get': {'responses': {'200': {'description': 'OK'}}}}
+    return Spec.from_dict(
+        {
+            'swagger': '2.0',
+            'info': {'title': 'Large API', 'version': '1.0.0'},
+            'basePath': '/api',
+            'paths': paths,
+        },
+        config={'validate_swagger_spec': False},
+    )
+
+
+@pytest.mark.parametrize(
+    'http_method, path',
+    [
+        ('GET', '/api/resource299'),
+        ('DELETE', '/api/resource299/42'),
+        ('GET', '/api/resource299/42/children/7'),
+        ('POST', '/api/resource299/42'),
+    ],
+)
+def test_match_request(benchmark, large_spec, http_method, path):
+    benchmark(large_spec.match_request, http_method, path)
+
+
+def test_get_op_for_request(benchmark, large_spec):
+    benchmark(large_spec.get_op_for_request, 'GET', '/api/resource299/{id}/children/{childId}')
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import contextlib
+
+import pytest
+
+from bravado_core.schema_profiler import profile_schemas
+from bravado_core.schema_profiler import SchemaProfiler
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+from bravado_core.validate import validate_schema_object
+
+
+@pytest.fixture(
+    params=['disabled', 'enabled', 'profiling', 'profiling-without-allocations'],
+)
+def profiling_mode(request):
+    return request.param
+
+
+@pytest.fixture
+def pet_spec(profiling_mode, petstore_spec):
+    return Spec.from_dict(
+        spec_dict=petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config={'schema_profiling': profiling_mode != 'disabled'},
+    )
+
+
+def _run(profiling_mode, func, *args):
+    if profiling_mode.startswith('profiling'):
+        scope = profile_schemas(SchemaProfiler(count_allocations=profiling_mode == 'profiling'))
+    else:
+        scope = contextlib.nullcontext()
+    with scope:
+        func(*args)
+
+
+def test_unmarshal_models(benchmark, profiling_mode, pet_spec, large_pets):
+    benchmark(
+        _run,
+        profiling_mode,
+        unmarshal_schema_object,
+        pet_spec,
+        {'type': 'array', 'items': pet_spec.spec_dict['definitions']['Pet']},
+        large_pets,
+    )
+
+
+def test_validate_models(benchmark, profiling_mode, pet_spec, large_pets):
+    benchmark(
+        _run,
+        profiling_mode,
+        validate_schema_object,
+        pet_spec,
+        {'type': 'array', 'items': pet_spec.spec_dict['definitions']['Pet']},
+        large_pets,
+    )
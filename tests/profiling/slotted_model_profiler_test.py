@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture(params=[False, True], ids=['dict', 'slots'])
+def pet_spec(request, petstore_spec):
+    return Spec.from_dict(
+        spec_dict=petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config={'slotted_models': request.param},
+    )
+
+
+@pytest.fixture
+def pets(pet_spec, large_pets):
+    return unmarshal_schema_object(
+        pet_spec,
+        {'type': 'array', 'items': pet_spec.spec_dict['definitions']['Pet']},
+        large_pets,
+    )
+
+
+def test_unmarshal_models(benchmark, pet_spec, large_pets):
+    benchmark(
+        unmarshal_schema_object,
+        pet_spec,
+        {'type': 'array', 'items': pet_spec.spec_dict['definitions']['Pet']},
+        large_pets,
+    )
+
+
+def test_read_attributes(benchmark, pets):
+    benchmark(lambda: [(pet.id, pet.name, pet.status) for pet in pets])
+
+
+def test_marshal_models(benchmark, pets):
+    benchmark(lambda: [pet._marshal() for pet in pets])
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import tracemalloc
+
+import pytest
+
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+NUMBER_OF_PROPERTIES = 300
+NUMBER_OF_PROPERTIES_SET = 10
+
+
+@pytest.fixture(params=[False, True], ids=['dense', 'sparse'])
+def wide_spec(request, minimal_swagger_dict):
+    minimal_swagger_dict['definitions']['Wide'] = {
+        'type': 'object',
+        'properties': {
+            'property{}'.format(index): {'type': 'string'}
+            for index in range(NUMBER_OF_PROPERTIES)
+        },
+    }
+    return Spec.from_dict(minimal_swagger_dict, config={'sparse_models': request.param})
+
+
+@pytest.fixture
+def wide_values(number_of_objects):
+    return [
+        {
+            'property{}'.format(index * NUMBER_OF_PROPERTIES // NUMBER_OF_PROPERTIES_SET): str(object_index)
+            for index in range(NUMBER_OF_PROPERTIES_SET)
+        }
+        for object_index in range(number_of_objects)
+    ]
+
+
+def _unmarshal_wide_models(wide_spec, wide_values):
+    return unmarshal_schema_object(
+        wide_spec,
+        {'type': 'array', 'items': wide_spec.spec_dict['definitions']['Wide']},
+        wide_values,
+    )
+
+
+def test_unmarshal_wide_models(benchmark, wide_spec, wide_values):
+    tracemalloc.start()
+    try:
+        wide_models = _unmarshal_wide_models(wide_spec, wide_values)
+        benchmark.extra_info['allocated_bytes'] = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del wide_models
+
+    benchmark(_unmarshal_wide_models, wide_spec, wide_values)
+
+
+def test_marshal_wide_models(benchmark, wide_spec, wide_values):
+    wide_models = _unmarshal_wide_models(wide_spec, wide_values)
+    benchmark(lambda: [wide_model._marshal() for wide_model in wide_models])
+
+
+def test_read_wide_models(benchmark, wide_spec, wide_values):
+    wide_models = _unmarshal_wide_models(wide_spec, wide_values)
+    benchmark(lambda: [(wide_model.property0, wide_model.property1) for wide_model in wide_models])
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+from six.moves.cPickle import dumps
+from six.moves.cPickle import HIGHEST_PROTOCOL
+from six.moves.cPickle import loads
+
+
+def test_dumps(benchmark, perf_petstore_spec):
+    benchmark(dumps, perf_petstore_spec, HIGHEST_PROTOCOL)
+
+
+def test_loads(benchmark, perf_petstore_spec):
+    benchmark(loads, dumps(perf_petstore_spec, HIGHEST_PROTOCOL))
+
+
+def test_loads_and_rebuild_resources(benchmark, perf_petstore_spec):
+    pickled_spec = dumps(perf_petstore_spec, HIGHEST_PROTOCOL)
+    benchmark(lambda: loads(pickled_spec).resources)
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+import simplejson
+
+from bravado_core.util import strip_xscope
+from bravado_core.util import strip_xscope_view
+
+
+def test_strip_xscope(benchmark, perf_petstore_spec):
+    benchmark(strip_xscope, perf_petstore_spec.spec_dict)
+
+
+def test_serialize_stripped_copy(benchmark, perf_petstore_spec):
+    benchmark(lambda: simplejson.dumps(strip_xscope(perf_petstore_spec.spec_dict)))
+
+
+def test_serialize_stripped_view(benchmark, perf_petstore_spec):
+    benchmark(lambda: simplejson.dumps(strip_xscope_view(perf_petstore_spec.spec_dict), for_json=True))
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import pytest
+from mock import Mock
+
+from bravado_core.request import IncomingRequest
+from bravado_core.request import unmarshal_request
+from bravado_core.spec import Spec
+
+
+@pytest.fixture(
+    params=[True, False],
+    ids=['validate', 'not_validate'],
+)
+def search_op(request):
+    parameters = [
+        {'name': 'query{}'.format(i), 'in': 'query', 'type': param_type, 'required': False}
+        for i, param_type in enumerate(['string', 'integer', 'number', 'boolean'] * 5)
+    ]
+    parameters.append({
+        'name': 'tags', 'in': 'query', 'type': 'array', 'collectionFormat': 'csv', 'items': {'type': 'string'},
+    })
+    spec = Spec.from_dict(
+        {
+            'swagger': '2.0',
+            'info': {'title': 'Search API', 'version': '1.0.0'},
+            'paths': {
+                '/search': {
+                    'get': {
+                        'operationId': 'search',
+                        'tags': ['search'],
+                        'parameters': parameters,
+                        'responses': {'200': {'description': 'OK'}},
+                    },
+                },
+            },
+        },
+        config={'validate_requests': request.param},
+    )
+    return spec.resources['search'].operations['search']
+
+
+def test_unmarshal_request(benchmark, search_op):
+    query = {
+        'query{}'.format(i): value
+        for i, value in enumerate(['value', '42', '4.2', 'true'] * 5)
+    }
+    query['tags'] = 'a,b,c'
+    request = Mock(spec=IncomingRequest, query=query)
+    benchmark(unmarshal_request, request, search_op)
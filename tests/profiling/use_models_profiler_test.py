@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture
+def use_models_petstore_spec(use_models, perf_petstore_spec):
+    return Spec.from_dict(
+        spec_dict=perf_petstore_spec.spec_dict,
+        origin_url=perf_petstore_spec.origin_url,
+        config=dict(perf_petstore_spec.config, use_models=use_models),
+    )
+
+
+@pytest.fixture
+def pets_schema(use_models_petstore_spec):
+    return {'type': 'array', 'items': use_models_petstore_spec._internal_spec_dict['definitions']['Pet']}
+
+
+def test_unmarshal(benchmark, use_models_petstore_spec, pets_schema, large_pets):
+    benchmark(unmarshal_schema_object, use_models_petstore_spec, pets_schema, large_pets)
+
+
+def test_marshal(benchmark, use_models_petstore_spec, pets_schema, large_pets):
+    pets = unmarshal_schema_object(use_models_petstore_spec, pets_schema, large_pets)
+    benchmark(marshal_schema_object, use_models_petstore_spec, pets_schema, pets)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.response import get_response_spec
+from bravado_core.response import OutgoingResponse
+from bravado_core.response import validate_response
+from tests.profiling.conftest import encode_body
+
+
+class FakeOutgoingResponse(OutgoingResponse):
+
+    def __init__(self, content_type, raw_bytes):
+        self.content_type = content_type
+        self.raw_bytes = raw_bytes
+        self.text = raw_bytes
+        self.headers = {}
+
+
+@pytest.fixture
+def find_by_status_op(content_type_petstore_spec):
+    op = content_type_petstore_spec.resources['pet'].findPetsByStatus
+    op.swagger_spec.config['validate_responses'] = True
+    return op
+
+
+def test_small_objects(benchmark, content_type, find_by_status_op, small_pets):
+    response = FakeOutgoingResponse(content_type, encode_body(content_type, small_pets))
+    benchmark(validate_response, get_response_spec(200, find_by_status_op), find_by_status_op, response)
+
+
+def test_large_objects(benchmark, content_type, find_by_status_op, large_pets):
+    response = FakeOutgoingResponse(content_type, encode_body(content_type, large_pets))
+    benchmark(validate_response, get_response_spec(200, find_by_status_op), find_by_status_op, response)
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
+import threading
+import time
+
 import pytest
 from mock import Mock
+from mock import patch
 
 from bravado_core.exception import SwaggerMappingError
 from bravado_core.operation import Operation
+from bravado_core.param import _get_param_unmarshaling_method
+from bravado_core.request import _get_request_unmarshaling_method
 from bravado_core.request import IncomingRequest
 from bravado_core.request import unmarshal_request
 
@@ -55,3 +61,45 @@ def test_request_with_no_json_and_optional_body_parameter(petstore_spec):
         op_spec=op.op_spec,
     )
     assert unmarshal_request(request, op) == {'body': None}
+
+
+def test_request_with_multiple_parameters(petstore_spec):
+    request = Mock(
+        spec=IncomingRequest,
+        path={'petId': '1234'},
+        form={'name': 'Doggie'},
+        headers={},
+    )
+    op = petstore_spec.resources['pet'].operations['updatePetWithForm']
+    assert unmarshal_request(request, op) == {'petId': 1234, 'name': 'Doggie', 'status': None}
+
+
+def test_request_unmarshaling_method_is_built_once(getPetByIdPetstoreOperation):
+    unmarshaling_method = _get_request_unmarshaling_method(getPetByIdPetstoreOperation)
+    assert _get_request_unmarshaling_method(getPetByIdPetstoreOperation) is unmarshaling_method
+
+
+def test_concurrent_first_unmarshal_request(petstore_spec):
+    op = petstore_spec.resources['pet'].operations['getPetById']
+    errors = []
+
+    def slow_get_param_unmarshaling_method(param):
+        # Widen the window in which the request unmarshaling method is being built
+        time.sleep(0.1)
+        return _get_param_unmarshaling_method(param)
+
+    def unmarshal():
+        request = Mock(spec=IncomingRequest, path={'petId': '1234'}, headers={'api-key': 'key1'})
+        try:
+            assert unmarshal_request(request, op)['petId'] == 1234
+        except Exception as e:  # pragma: no cover  # executed only in case of failures
+            errors.append(e)
+
+    with patch('bravado_core.request._get_param_unmarshaling_method', side_effect=slow_get_param_unmarshaling_method):
+        threads = [threading.Thread(target=unmarshal) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert errors == []
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+import datetime
+
 import msgpack
 import pytest
+import pytz
 from jsonschema import ValidationError
 from mock import Mock
 from mock import patch
@@ -49,6 +52,22 @@ def test_json_content(empty_swagger_spec, response_spec):
         assert 'Monday' == unmarshal_response(response, op)
 
 
+def test_json_content_with_json_codec(minimal_swagger_dict, response_spec):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'json_codec': 'json'})
+    response = Mock(
+        spec=IncomingResponse,
+        status_code=200,
+        headers={'content-type': APP_JSON},
+        raw_bytes=b'"Monday"',
+    )
+
+    with patch('bravado_core.response.get_response_spec') as m:
+        m.return_value = response_spec
+        op = Mock(swagger_spec=swagger_spec)
+        assert 'Monday' == unmarshal_response(response, op)
+    assert not response.json.called
+
+
 def test_msgpack_content(empty_swagger_spec, response_spec):
     message = 'Monday'
     response = Mock(
@@ -193,3 +212,25 @@ def test_unmarshal_model_polymorphic_specs_with_xnullable_field(polymorphic_dict
     )
 
     assert response == PetList(number_of_pets=1, list=[None])
+
+
+def test_msgpack_content_with_timestamps(minimal_swagger_dict):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'msgpack_timestamps': True})
+    response_spec = {
+        'description': 'Last update',
+        'schema': {'type': 'string', 'format': 'date-time'},
+    }
+    updated_at = datetime.datetime(2018, 5, 13, 10, 20, 30, tzinfo=pytz.utc)
+    response = Mock(
+        spec=IncomingResponse,
+        status_code=200,
+        headers={'content-type': APP_MSGPACK},
+        raw_bytes=msgpack.packb(updated_at, use_bin_type=True, datetime=True),
+    )
+
+    with patch(
+        'bravado_core.response.get_response_spec',
+        return_value=response_spec,
+    ):
+        op = Mock(swagger_spec=swagger_spec)
+        assert updated_at == unmarshal_response(response, op)
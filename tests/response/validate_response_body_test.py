@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import msgpack
 import pytest
+from jsonschema import ValidationError
 from mock import Mock
 
 from bravado_core.content_type import APP_MSGPACK
@@ -9,6 +10,7 @@ from bravado_core.operation import Operation
 from bravado_core.response import EMPTY_BODIES
 from bravado_core.response import OutgoingResponse
 from bravado_core.response import validate_response_body
+from bravado_core.spec import Spec
 
 
 def test_success_spec_empty_and_body_empty(minimal_swagger_spec):
@@ -55,6 +57,29 @@ def test_success_json_response(minimal_swagger_spec):
     validate_response_body(op, response_spec, response)
 
 
+def test_json_response_with_json_codec(minimal_swagger_dict):
+    response_spec = {
+        'description': 'Address',
+        'schema': {
+            'type': 'object',
+            'required': ['first_name'],
+        },
+    }
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'json_codec': 'json'})
+    op = Operation(
+        swagger_spec, '/foo', 'get',
+        op_spec={'produces': ['application/json']},
+    )
+    response = Mock(
+        spec=OutgoingResponse,
+        content_type='application/json',
+        raw_bytes=b'{"last_name": "niwrad"}',
+    )
+    with pytest.raises(ValidationError):
+        validate_response_body(op, response_spec, response)
+    assert not response.json.called
+
+
 def test_success_msgpack_response(minimal_swagger_spec):
     response_spec = {
         'description': 'Address',
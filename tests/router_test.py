@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.router import Router
+from bravado_core.spec import Spec
+
+
+@pytest.fixture
+def router(minimal_swagger_dict):
+    minimal_swagger_dict['basePath'] = '/api/'
+    response_spec = {'responses': {'200': {'description': 'OK'}}}
+    minimal_swagger_dict['paths'] = {
+        path_name: {http_method: dict(response_spec, operationId=operation_id, tags=['files'])}
+        for path_name, http_method, operation_id in (
+            ('/', 'get', 'root'),
+            ('/files/{fileName}.{extension}', 'get', 'getFileWithExtension'),
+            ('/files/{fileName}', 'get', 'getFile'),
+            ('/files/{fileName}/content', 'put', 'putFileContent'),
+            ('/files/{folder}/{fileName}', 'get', 'getFolderFile'),
+            ('/files/{folder}/latest', 'post', 'postLatestFile'),
+        )
+    }
+    return Router(Spec.from_dict(minimal_swagger_dict, config={'validate_swagger_spec': False}))
+
+
+def _operation_id(route_match):
+    return route_match.operation.operation_id if route_match and route_match.operation else None
+
+
+@pytest.mark.parametrize(
+    'http_method, path, expected_operation_id, expected_path_params',
+    [
+        ('GET', '/api/', 'root', {}),
+        ('GET', '/api/files/a', 'getFile', {'fileName': 'a'}),
+        ('GET', '/api/files/a.json', 'getFileWithExtension', {'fileName': 'a', 'extension': 'json'}),
+        ('GET', '/api/files/a.b.json', 'getFileWithExtension', {'fileName': 'a', 'extension': 'b.json'}),
+        ('PUT', '/api/files/a/content', 'putFileContent', {'fileName': 'a'}),
+        ('GET', '/api/files/b/a', 'getFolderFile', {'folder': 'b', 'fileName': 'a'}),
+        # static segments are preferred, but paths with templated segments are used if the method is not allowed
+        ('GET', '/api/files/b/latest', 'getFolderFile', {'folder': 'b', 'fileName': 'latest'}),
+        ('POST', '/api/files/b/latest', 'postLatestFile', {'folder': 'b'}),
+    ],
+)
+def test_match(router, http_method, path, expected_operation_id, expected_path_params):
+    route_match = router.match(http_method, path)
+    assert _operation_id(route_match) == expected_operation_id
+    assert route_match.path_params == expected_path_params
+
+
+@pytest.mark.parametrize(
+    'path',
+    ['/api', '/apifiles/a', '/files/a', '/api/files', '/api/files/', '/api/files/a/b/c', '/api/files//content'],
+)
+def test_not_found(router, path):
+    assert router.match('GET', path) is None
+
+
+@pytest.mark.parametrize(
+    'http_method, path, expected_allowed_methods',
+    [
+        ('POST', '/api/files/a', ('GET',)),
+        # methods of all the matching paths: /files/{folder}/latest and /files/{folder}/{fileName}
+        ('DELETE', '/api/files/b/latest', ('GET', 'POST')),
+        ('PUT', '/api/files/a.json', ('GET',)),
+    ],
+)
+def test_method_not_allowed(router, http_method, path, expected_allowed_methods):
+    route_match = router.match(http_method, path)
+    assert route_match.operation is None
+    assert route_match.allowed_methods == expected_allowed_methods
+
+
+@pytest.mark.parametrize('http_method', ['GET', 'POST'])
+def test_allowed_methods_of_all_matching_paths(router, http_method):
+    assert router.match(http_method, '/api/files/b/latest').allowed_methods == ('GET', 'POST')
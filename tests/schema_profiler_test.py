@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+import copy
+
+import mock
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.schema_profiler import get_schema_label
+from bravado_core.schema_profiler import profile_schemas
+from bravado_core.schema_profiler import SchemaProfiler
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+from bravado_core.validate import validate_schema_object
+
+
+@pytest.fixture
+def pets_value():
+    return [
+        {
+            'id': pet_id,
+            'name': 'pet{}'.format(pet_id),
+            'photoUrls': ['wagtail.png'],
+            'category': {'id': 200, 'name': 'friendly'},
+            'tags': [{'id': 99, 'name': 'mini'}, {'id': 100, 'name': 'brown'}],
+        }
+        for pet_id in range(3)
+    ]
+
+
+@pytest.fixture
+def profiling_spec(petstore_spec):
+    return Spec.from_dict(
+        petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config={'schema_profiling': True},
+    )
+
+
+def _pets_schema(swagger_spec):
+    return {'type': 'array', 'items': swagger_spec.spec_dict['definitions']['Pet']}
+
+
+def test_costs_not_reported_by_default(petstore_spec, pets_value):
+    with profile_schemas() as profiler:
+        unmarshal_schema_object(petstore_spec, _pets_schema(petstore_spec), pets_value)
+    assert profiler.report() == []
+
+
+def test_costs_not_reported_outside_of_scope(profiling_spec, pets_value):
+    with mock.patch.object(SchemaProfiler, 'run') as mock_run:
+        pets = unmarshal_schema_object(profiling_spec, _pets_schema(profiling_spec), pets_value)
+        validate_schema_object(profiling_spec, _pets_schema(profiling_spec), pets_value)
+    assert pets[0].tags[1].name == 'brown'
+    assert not mock_run.called
+
+
+def test_unmarshal_costs(profiling_spec, pets_value):
+    with profile_schemas() as profiler:
+        pets = unmarshal_schema_object(profiling_spec, _pets_schema(profiling_spec), pets_value)
+    assert pets[2].category.name == 'friendly'
+
+    entries = {entry.label: entry for entry in profiler.report()}
+    assert entries['Pet[]'].calls == 1
+    assert entries['Pet'].calls == 3
+    assert entries['Pet.tags'].calls == 3
+    assert entries['Tag'].calls == 6
+    assert entries['Category'].calls == 3
+    assert entries['Category.name'].calls == 3
+    assert entries['Pet.photoUrls[]'].calls == 3
+    assert sum(entry.time_percentage for entry in entries.values()) == pytest.approx(100)
+
+
+def test_marshal_costs(profiling_spec, pets_value):
+    pets = unmarshal_schema_object(profiling_spec, _pets_schema(profiling_spec), pets_value)
+    with profile_schemas() as profiler:
+        assert marshal_schema_object(profiling_spec, _pets_schema(profiling_spec), pets) == pets_value
+
+    entries = {entry.label: entry for entry in profiler.report()}
+    assert entries['Pet'].calls == 3
+    assert entries['Tag'].calls == 6
+
+
+def test_validation_costs(profiling_spec, pets_value):
+    with profile_schemas() as profiler:
+        validate_schema_object(profiling_spec, _pets_schema(profiling_spec), pets_value)
+    labels = {entry.label for entry in profiler.report()}
+    assert {'Pet', 'Tag', 'Category', 'Pet.tags', 'Category.name'} <= labels
+
+
+def test_validation_errors_are_raised(profiling_spec, pets_value):
+    pets_value[1]['tags'][0]['name'] = 42
+    with profile_schemas(), pytest.raises(ValidationError) as excinfo:
+        validate_schema_object(profiling_spec, _pets_schema(profiling_spec), pets_value)
+    assert "42 is not of type 'string'" in str(excinfo.value)
+
+
+def test_profiler_accumulates_costs_of_multiple_scopes(profiling_spec, pets_value):
+    profiler = SchemaProfiler()
+    for _ in range(2):
+        with profile_schemas(profiler):
+            unmarshal_schema_object(profiling_spec, _pets_schema(profiling_spec), copy.deepcopy(pets_value))
+    assert {entry.label: entry.calls for entry in profiler.report()}['Pet'] == 6
+
+    profiler.reset()
+    assert profiler.report() == []
+
+
+def test_costs_exclude_nested_schemas():
+    profiler = SchemaProfiler()
+    with mock.patch('bravado_core.schema_profiler.default_timer', side_effect=[0.0, 1.0, 3.0, 10.0]):
+        profiler.run('Pet', profiler.run, ('Tag', lambda: None, ()))
+
+    assert [(entry.label, entry.calls, entry.time, entry.time_percentage) for entry in profiler.report()] == [
+        ('Pet', 1, 8.0, 80.0),
+        ('Tag', 1, 2.0, 20.0),
+    ]
+    assert profiler.format_report() == 'Pet 80.0%, Tag 20.0%'
+    assert profiler.format_report(limit=1) == 'Pet 80.0%'
+
+
+def test_costs_reported_if_failing():
+    profiler = SchemaProfiler()
+    with pytest.raises(ValueError):
+        profiler.run('Pet', int, ('not a number',))
+    assert profiler.report()[0].calls == 1
+
+
+def test_schema_labels(petstore_spec):
+    definitions = petstore_spec.spec_dict['definitions']
+    assert get_schema_label(petstore_spec, definitions['Pet']) == 'Pet'
+    assert get_schema_label(petstore_spec, {'$ref': '#/definitions/Category'}) == 'Category'
+    assert get_schema_label(petstore_spec, definitions['Pet']['properties']['tags']) == 'Pet.tags'
+    assert get_schema_label(petstore_spec, definitions['Pet']['properties']['photoUrls']['items']) == 'Pet.photoUrls[]'
+
+    find_by_status = petstore_spec.spec_dict['paths']['/pet/findByStatus']['get']
+    assert get_schema_label(petstore_spec, find_by_status['responses']['200']['schema']) == \
+        '#/paths/~1pet~1findByStatus/get/responses/200/schema'
+    assert get_schema_label(petstore_spec, find_by_status['parameters'][0]) == \
+        '#/paths/~1pet~1findByStatus/get/parameters/0'
+
+
+def test_schema_labels_of_schemas_not_in_spec(petstore_spec):
+    assert get_schema_label(petstore_spec, _pets_schema(petstore_spec)) == 'Pet[]'
+    assert get_schema_label(petstore_spec, {'type': 'string'}) == '<anonymous>'
+
+
+def test_allocations_not_counted(profiling_spec, pets_value):
+    with profile_schemas(SchemaProfiler(count_allocations=False)) as profiler:
+        unmarshal_schema_object(profiling_spec, _pets_schema(profiling_spec), pets_value)
+    assert profiler.report()
+    assert all(entry.allocated_blocks == 0 for entry in profiler.report())
@@ -293,3 +293,15 @@ def test_build_raises_in_case_of_duplicated_models_between_paths_and_definitions
     )
 
     assert expected_exception_string == str(exinfo.value)
+
+
+@pytest.mark.parametrize('msgpack_version', [(0, 6, 2), (0, 5, 6)])
+def test_build_msgpack_timestamps_requires_msgpack_1(minimal_swagger_dict, msgpack_version):
+    with patch('bravado_core.codec.msgpack.version', msgpack_version):
+        Spec.from_dict(minimal_swagger_dict)
+        with pytest.raises(ValueError, match='msgpack_timestamps config requires msgpack>=1.0'):
+            Spec.from_dict(minimal_swagger_dict, config={'msgpack_timestamps': True})
+
+
+def test_build_msgpack_timestamps(minimal_swagger_dict):
+    assert Spec.from_dict(minimal_swagger_dict, config={'msgpack_timestamps': True}).config['msgpack_timestamps']
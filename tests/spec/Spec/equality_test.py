@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
+import mock
 import pytest
 
 from bravado_core.spec import Spec
+from bravado_core.util import is_same_content
 from tests.conftest import get_url
 
 
@@ -98,3 +100,47 @@ def test_equality_early_exit(
     other_spec = Spec.from_dict(minimal_swagger_dict, origin_url=get_url(minimal_swagger_abspath))
     other_spec.__dict__.update(__dict__)
     assert not spec.is_equal(other_spec)
+
+
+def test_fingerprint_is_evaluated_by_build(petstore_dict, petstore_abspath):
+    spec = Spec.from_dict(petstore_dict, origin_url=get_url(petstore_abspath))
+    assert 'fingerprint' in spec.__dict__
+
+
+def test_fingerprint_depends_on_content(petstore_spec, petstore_dict, petstore_abspath, polymorphic_spec):
+    assert petstore_spec.fingerprint == Spec.from_dict(petstore_dict, origin_url=get_url(petstore_abspath)).fingerprint
+    assert petstore_spec.fingerprint != polymorphic_spec.fingerprint
+
+
+def test_fingerprint_includes_referenced_specs(multi_file_recursive_spec):
+    original_fingerprint = multi_file_recursive_spec.fingerprint
+    remote_document = next(
+        document
+        for uri, document in multi_file_recursive_spec.resolver.store.items()
+        if uri.endswith('aux_2.json')
+    )
+    remote_document['x-new-key'] = 'value'
+    del multi_file_recursive_spec.fingerprint
+
+    assert multi_file_recursive_spec.fingerprint != original_fingerprint
+
+
+def test_equality_does_not_compare_spec_trees_if_fingerprints_are_matching(petstore_spec, petstore_dict, petstore_abspath):
+    other_petstore_spec_instance = Spec.from_dict(petstore_dict, origin_url=get_url(petstore_abspath))
+    other_petstore_spec_instance.flattened_spec
+    assert 'flattened_spec' not in petstore_spec.__dict__
+
+    assert petstore_spec.is_equal(other_petstore_spec_instance)
+    # flattened_spec has not been evaluated for the comparison
+    assert 'flattened_spec' not in petstore_spec.__dict__
+
+
+def test_equality_confirms_matching_fingerprints_with_a_deep_comparison(petstore_spec, petstore_dict, petstore_abspath):
+    other_petstore_dict = dict(petstore_dict, info=dict(petstore_dict['info'], title='Other title'))
+    other_petstore_spec_instance = Spec.from_dict(other_petstore_dict, origin_url=get_url(petstore_abspath))
+    # Simulate a fingerprint collision
+    other_petstore_spec_instance.fingerprint = petstore_spec.fingerprint
+
+    with mock.patch('bravado_core.spec.is_same_content', wraps=is_same_content) as mock_is_same_content:
+        assert not petstore_spec.is_equal(other_petstore_spec_instance)
+    mock_is_same_content.assert_called_once_with(petstore_spec.spec_dict, other_petstore_spec_instance.spec_dict)
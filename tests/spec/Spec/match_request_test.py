@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from six.moves.cPickle import dumps
+from six.moves.cPickle import loads
+
+from bravado_core.router import RouteMatch
+from bravado_core.spec import Spec
+
+
+def test_found_with_basepath(petstore_spec, getPetByIdPetstoreOperation):
+    assert petstore_spec.match_request('GET', '/v2/pet/123') == RouteMatch(
+        operation=getPetByIdPetstoreOperation,
+        path_params={'petId': '123'},
+        allowed_methods=('DELETE', 'GET', 'POST'),
+    )
+
+
+def test_found_with_no_basepath(petstore_dict):
+    del petstore_dict['basePath']
+    petstore_spec = Spec.from_dict(petstore_dict)
+    route_match = petstore_spec.match_request('get', '/store/order/42')
+    assert route_match.operation == petstore_spec.resources['store'].operations['getOrderById']
+    assert route_match.path_params == {'orderId': '42'}
+
+
+def test_static_segments_are_preferred(petstore_spec):
+    route_match = petstore_spec.match_request('GET', '/v2/pet/findByStatus')
+    assert route_match.operation == petstore_spec.resources['pet'].operations['findPetsByStatus']
+    assert route_match.path_params == {}
+
+
+def test_method_not_allowed(petstore_spec):
+    assert petstore_spec.match_request('PATCH', '/v2/pet/123') == RouteMatch(
+        operation=None,
+        path_params={},
+        allowed_methods=('DELETE', 'GET', 'POST'),
+    )
+
+
+def test_not_found(petstore_spec):
+    assert petstore_spec.match_request('GET', '/v2/foo/123') is None
+    assert petstore_spec.match_request('GET', '/pet/123') is None
+    assert petstore_spec.match_request('GET', '/v2/pet/123/photos') is None
+
+
+def test_router_is_not_pickled(petstore_spec):
+    petstore_spec.match_request('GET', '/v2/pet/123')
+    restored_petstore_spec = loads(dumps(petstore_spec))
+
+    assert restored_petstore_spec._router is None
+    assert petstore_spec.is_equal(restored_petstore_spec)
+    assert restored_petstore_spec.match_request('GET', '/v2/pet/123').path_params == {'petId': '123'}
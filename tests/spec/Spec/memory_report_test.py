@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.response import unmarshal_response
+from bravado_core.spec import Spec
+from tests.conftest import get_url
+
+
+EXPECTED_REPORT_KEYS = {
+    'spec_dict',
+    '_internal_spec_dict',
+    'flattened_spec',
+    '_deref_flattened_spec',
+    'client_spec_dict',
+    'resolver_store',
+    'total',
+}
+
+
+def test_memory_report_shared_structures_are_counted_once(petstore_dict, petstore_abspath):
+    spec = Spec.from_dict(petstore_dict, origin_url=get_url(petstore_abspath))
+
+    report = spec.memory_report()
+
+    assert set(report) == EXPECTED_REPORT_KEYS
+    assert report['spec_dict'] > 0
+    # _internal_spec_dict and the resolver referrer are the same object as spec_dict
+    assert report['_internal_spec_dict'] == 0
+    assert report['resolver_store'] == 0
+    # Lazily evaluated structures are not created by the report
+    assert report['client_spec_dict'] == 0
+    assert 'client_spec_dict' not in spec.__dict__
+    assert report['total'] == sum(value for key, value in report.items() if key != 'total')
+
+
+def test_memory_report_includes_materialized_structures(petstore_dict, petstore_abspath):
+    spec = Spec.from_dict(petstore_dict, origin_url=get_url(petstore_abspath))
+    spec.client_spec_dict
+
+    assert spec.memory_report()['client_spec_dict'] > 0
+
+
+@pytest.mark.parametrize('discard_build_artifacts', [True, False])
+def test_discard_build_artifacts(minimal_swagger_dict, minimal_swagger_abspath, discard_build_artifacts):
+    spec = Spec.from_dict(
+        minimal_swagger_dict,
+        origin_url=get_url(minimal_swagger_abspath),
+        config={'internally_dereference_refs': True, 'discard_build_artifacts': discard_build_artifacts},
+    )
+
+    assert ('flattened_spec' in spec.__dict__) is not discard_build_artifacts
+    assert ('resolver' in spec.__dict__) is not discard_build_artifacts
+    assert (spec.memory_report()['flattened_spec'] == 0) is discard_build_artifacts
+
+
+def test_discard_build_artifacts_reduces_retained_memory(petstore_dict, petstore_abspath):
+    def build(discard_build_artifacts):
+        return Spec.from_dict(
+            petstore_dict,
+            origin_url=get_url(petstore_abspath),
+            config={'internally_dereference_refs': True, 'discard_build_artifacts': discard_build_artifacts},
+        )
+
+    assert build(True).memory_report()['total'] < build(False).memory_report()['total']
+
+
+def test_discard_build_artifacts_is_ignored_without_dereferencing(petstore_dict, petstore_abspath):
+    spec = Spec.from_dict(petstore_dict, origin_url=get_url(petstore_abspath), config={'discard_build_artifacts': True})
+
+    assert 'resolver' in spec.__dict__
+
+
+def test_spec_with_discarded_build_artifacts_is_usable(petstore_dict, petstore_abspath):
+    spec = Spec.from_dict(
+        petstore_dict,
+        origin_url=get_url(petstore_abspath),
+        config={'internally_dereference_refs': True, 'discard_build_artifacts': True},
+    )
+    op = spec.resources['pet'].operations['getPetById']
+
+    class Response(object):
+        status_code = 200
+        headers = {'content-type': 'application/json'}
+
+        def json(self):
+            return {'id': 1, 'name': 'Fido', 'photoUrls': []}
+
+    pet = unmarshal_response(Response(), op)
+
+    assert isinstance(pet, spec.definitions['Pet'])
+    assert pet.name == 'Fido'
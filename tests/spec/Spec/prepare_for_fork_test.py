@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+import mock
+
+from bravado_core.spec import Spec
+
+
+def test_prepare_for_fork(petstore_dict):
+    spec = Spec.from_dict(petstore_dict)
+
+    with mock.patch('bravado_core.spec.warmup_spec', autospec=True) as mock_warmup_spec, \
+            mock.patch('bravado_core.spec.gc', autospec=True) as mock_gc:
+        spec.prepare_for_fork()
+
+    mock_warmup_spec.assert_called_once_with(spec)
+    mock_gc.collect.assert_called_once_with()
+    mock_gc.freeze.assert_called_once_with()
+    assert mock_gc.mock_calls.index(mock.call.collect()) < mock_gc.mock_calls.index(mock.call.freeze())
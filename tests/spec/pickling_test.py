@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 import mock
 import pytest
+from six import iteritems
 from six.moves.cPickle import dumps
 from six.moves.cPickle import loads
 
+from bravado_core import version as _version
+from bravado_core.model import _to_pickleable_representation
 from bravado_core.spec import Spec
 from tests.conftest import get_url
 
@@ -29,3 +32,86 @@ def test_ensure_warning_presence_in_case_of_version_mismatch(petstore_spec):
     with pytest.warns(UserWarning, match='different bravado-core version.*created by version 0.0.0, current version'):
         restored_petstore_spec = loads(petstore_pickle)
     assert petstore_spec.is_equal(restored_petstore_spec)
+
+
+def _legacy_state(swagger_spec):
+    # State created by bravado-core versions pickling the whole Spec instance
+    state = {
+        k: v
+        for k, v in iteritems(swagger_spec.__dict__)
+        if k not in ('resolver', 'definitions')
+    }
+    state['definitions'] = {
+        model_name: _to_pickleable_representation(model_name, model_type)
+        for model_name, model_type in iteritems(swagger_spec.definitions)
+    }
+    state['__bravado_core_version__'] = _version
+    return state
+
+
+@pytest.mark.parametrize('internally_dereference_refs', [True, False])
+def test_pickled_state_does_not_contain_derived_structures(petstore_dict, petstore_abspath, internally_dereference_refs):
+    spec = Spec.from_dict(
+        spec_dict=petstore_dict,
+        origin_url=get_url(petstore_abspath),
+        config={'internally_dereference_refs': internally_dereference_refs},
+    )
+    spec.security_definitions
+    spec.json_codec
+    state = spec.__getstate__()
+
+    assert state['__pickle_format__'] == 2
+    assert not {
+        'resolver', 'resources', 'flattened_spec', 'client_spec_dict', '_security_definitions', 'json_codec',
+    } & set(state)
+    assert {model_name for _, model_name, _, _, _ in state['definitions']} == set(spec.definitions)
+    assert len(state['__model_specs__']) == (1 if internally_dereference_refs else 0)
+
+
+@pytest.mark.parametrize('internally_dereference_refs', [True, False])
+def test_pickle_is_smaller_than_legacy_pickle(petstore_dict, petstore_abspath, internally_dereference_refs):
+    spec = Spec.from_dict(
+        spec_dict=petstore_dict,
+        origin_url=get_url(petstore_abspath),
+        config={'internally_dereference_refs': internally_dereference_refs},
+    )
+    assert len(dumps(spec)) < len(dumps(_legacy_state(spec)))
+
+
+def test_resources_are_lazily_rebuilt(petstore_spec):
+    restored_petstore_spec = loads(dumps(petstore_spec))
+
+    assert 'resources' not in restored_petstore_spec.__dict__
+    assert restored_petstore_spec._request_to_op_map is None
+    op = restored_petstore_spec.resources['pet'].operations['getPetById']
+    assert op.swagger_spec is restored_petstore_spec
+    assert op.is_equal(petstore_spec.resources['pet'].operations['getPetById'], ignore_swagger_spec=True)
+    assert restored_petstore_spec.get_op_for_request('GET', '/v2/pet/{petId}') is op
+
+
+def test_models_of_dereferenced_specs_share_definitions(petstore_dict, petstore_abspath):
+    spec = Spec.from_dict(
+        spec_dict=petstore_dict,
+        origin_url=get_url(petstore_abspath),
+        config={'internally_dereference_refs': True},
+    )
+    restored_spec = loads(dumps(spec))
+
+    model_swagger_spec = restored_spec.definitions['Pet']._swagger_spec
+    assert model_swagger_spec is not restored_spec
+    assert model_swagger_spec is restored_spec.definitions['Category']._swagger_spec
+    assert model_swagger_spec.definitions is restored_spec.definitions
+    assert model_swagger_spec.spec_dict is restored_spec._internal_spec_dict
+    assert model_swagger_spec.http_client is restored_spec.http_client
+
+
+@pytest.mark.parametrize('internally_dereference_refs', [True, False])
+def test_legacy_state_is_restored(petstore_dict, petstore_abspath, internally_dereference_refs):
+    spec = Spec.from_dict(
+        spec_dict=petstore_dict,
+        origin_url=get_url(petstore_abspath),
+        config={'internally_dereference_refs': internally_dereference_refs},
+    )
+    restored_spec = Spec.__new__(Spec)
+    restored_spec.__setstate__(loads(dumps(_legacy_state(spec))))
+    assert spec.is_equal(restored_spec)
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import datetime
+
+import pytest
 from mock import patch
 
 from bravado_core.swagger20_validator import type_validator
@@ -72,3 +75,15 @@ def test_validate_when_not_nullable_property_schema_and_value_is_None(
     args = (None, prop_schema['type'], None, prop_schema)
     list(type_validator(minimal_swagger_spec, *args))
     m_draft4_type_validator.assert_called_once_with(*args)
+
+
+@pytest.mark.parametrize('msgpack_timestamps', [True, False])
+@patch('bravado_core.swagger20_validator._DRAFT4_TYPE_VALIDATOR')
+def test_datetime_values_of_date_time_schema(
+    m_draft4_type_validator, minimal_swagger_spec, msgpack_timestamps,
+):
+    minimal_swagger_spec.config['msgpack_timestamps'] = msgpack_timestamps
+    date_time_schema = {'type': 'string', 'format': 'date-time'}
+    args = (None, date_time_schema['type'], datetime.datetime(2018, 5, 13), date_time_schema)
+    list(type_validator(minimal_swagger_spec, *args))
+    assert m_draft4_type_validator.called is not msgpack_timestamps
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+from mock import Mock
+
+from bravado_core.exception import UploadTooLargeError
+from bravado_core.upload import is_iterator
+from bravado_core.upload import IteratorReader
+from bravado_core.upload import spool_upload
+from bravado_core.upload import SpooledUpload
+
+
+def test_iterator_reader_read_blocks():
+    reader = IteratorReader(iter([b'abc', b'de', b'', b'fghij']))
+    assert reader.read(4) == b'abcd'
+    assert reader.read(4) == b'efgh'
+    assert reader.read(4) == b'ij'
+    assert reader.read(4) == b''
+
+
+def test_iterator_reader_read_all():
+    reader = IteratorReader(iter([b'abc', b'de']))
+    assert reader.read(1) == b'a'
+    assert reader.read() == b'bcde'
+    assert reader.read() == b''
+
+
+def test_iterator_reader_iter():
+    reader = IteratorReader(iter([b'abc', b'de']))
+    assert reader.read(1) == b'a'
+    assert list(reader) == [b'bc', b'de']
+
+
+def test_iterator_reader_consumes_chunks_lazily():
+    consumed_chunks = []
+
+    def chunks():
+        for chunk in (b'abc', b'def', b'ghi'):
+            consumed_chunks.append(chunk)
+            yield chunk
+
+    reader = IteratorReader(chunks())
+    reader.read(2)
+    assert consumed_chunks == [b'abc']
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    (
+        (iter([b'a']), True),
+        ((chunk for chunk in [b'a']), True),
+        (io.BytesIO(b'a'), False),
+        (b'a', False),
+        ([b'a'], False),
+    ),
+)
+def test_is_iterator(value, expected):
+    assert is_iterator(value) is expected
+
+
+@pytest.mark.parametrize(
+    'upload',
+    (
+        b'x' * 100,
+        io.BytesIO(b'x' * 100),
+        iter([b'x' * 50, b'x' * 50]),
+        Mock(spec=['file', 'filename'], file=io.BytesIO(b'x' * 100), filename='x.txt'),
+    ),
+)
+def test_spool_upload(upload):
+    spooled_upload = spool_upload(upload, spool_size=1000)
+    assert isinstance(spooled_upload, SpooledUpload)
+    assert spooled_upload.size == 100
+    assert spooled_upload.read() == b'x' * 100
+    assert not spooled_upload._rolled
+
+
+def test_spool_upload_metadata():
+    upload = Mock(spec=['read', 'filename', 'content_type'], filename='cat.png', content_type='image/png')
+    upload.read.side_effect = [b'data', b'']
+    spooled_upload = spool_upload(upload, spool_size=1000)
+    assert spooled_upload.filename == 'cat.png'
+    assert spooled_upload.content_type == 'image/png'
+
+
+def test_spool_upload_rolls_over_to_file():
+    spooled_upload = spool_upload(io.BytesIO(b'x' * 100), spool_size=10)
+    assert spooled_upload._rolled
+    assert spooled_upload.read() == b'x' * 100
+
+
+def test_spool_upload_none():
+    assert spool_upload(None, spool_size=10) is None
+
+
+def test_spool_upload_too_large_stops_reading():
+    upload = iter([b'x' * 60] * 3)
+    with pytest.raises(UploadTooLargeError):
+        spool_upload(upload, spool_size=1000, max_size=100)
+    # Only the chunks needed to exceed the limit have been read
+    assert list(upload) == [b'x' * 60]
+
+
+def test_spool_upload_max_size_exactly():
+    assert spool_upload(b'x' * 100, spool_size=10, max_size=100).size == 100
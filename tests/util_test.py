@@ -1,18 +1,25 @@
 # -*- coding: utf-8 -*-
+import threading
+import time
 from inspect import getcallargs
 
 import mock
 import pytest
+import simplejson
 
 from bravado_core.util import AliasKeyDict
 from bravado_core.util import cached_property
+from bravado_core.util import deep_getsizeof
 from bravado_core.util import determine_object_type
+from bravado_core.util import fingerprint
+from bravado_core.util import is_same_content
 from bravado_core.util import lazy_class_attribute
 from bravado_core.util import memoize_by_id
 from bravado_core.util import ObjectType
 from bravado_core.util import RecursiveCallException
 from bravado_core.util import sanitize_name
 from bravado_core.util import strip_xscope
+from bravado_core.util import strip_xscope_view
 
 
 def test_cached_property():
@@ -76,6 +83,38 @@ def test_memoize_by_id_decorator_recursive_call():
     assert calls == [mock.sentinel.A]
 
 
+def test_memoize_by_id_decorator_concurrent_calls():
+    @memoize_by_id
+    def function(a):
+        time.sleep(0.1)
+        return [a]
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(function(mock.sentinel.A))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The recursive calls detection does not mistake concurrent calls for recursive calls
+    assert results == [[mock.sentinel.A], [mock.sentinel.A]]
+    assert function(mock.sentinel.A) in results
+
+
+def test_memoize_by_id_decorator_exception():
+    calls = []
+
+    @memoize_by_id
+    def function(a):
+        calls.append(a)
+        raise ValueError()
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            function(mock.sentinel.A)
+    assert calls == [mock.sentinel.A, mock.sentinel.A]
+
+
 def test_memoize_by_id_decorator():
     calls = []
 
@@ -260,3 +299,163 @@ def test_no_op():
 
 def test_petstore_spec(petstore_spec):
     assert petstore_spec.client_spec_dict == strip_xscope(petstore_spec.spec_dict)
+
+
+def test_strip_xscope_preserves_shared_and_recursive_objects():
+    shared = {'type': 'string', 'x-scope': ['file:///swagger.json']}
+    fragment = {'a': shared, 'b': [shared]}
+    fragment['self'] = fragment
+
+    result = strip_xscope(fragment)
+
+    assert result['a'] is result['b'][0]
+    assert result['a'] == {'type': 'string'}
+    assert result['self'] is result
+    assert 'x-scope' in shared
+
+
+def test_strip_xscope_preserves_types():
+    fragment = {
+        'alias_key_dict': AliasKeyDict({'x-scope': ['file:///swagger.json'], 'key': 'value'}),
+        'tuple': ({'x-scope': ['file:///swagger.json'], 'key': 'value'},),
+    }
+
+    result = strip_xscope(fragment)
+
+    assert type(result['alias_key_dict']) is AliasKeyDict
+    assert result['alias_key_dict'] == {'key': 'value'}
+    assert result['tuple'] == ({'key': 'value'},)
+
+
+def test_strip_xscope_view():
+    fragment = {
+        'MON': {
+            '$ref': '#/definitions/DayHours',
+            'x-scope': ['file:///happyhour/api_docs/swagger.json'],
+        },
+        'TUE': [{'$ref': '#/definitions/DayHours', 'x-scope': ['file:///happyhour/api_docs/swagger.json']}],
+        'x-scope': ['file:///happyhour/api_docs/swagger.json'],
+    }
+
+    view = strip_xscope_view(fragment)
+
+    assert view == strip_xscope(fragment)
+    assert len(view) == 2
+    assert 'x-scope' not in view
+    assert 'x-scope' not in view['MON']
+    assert view['TUE'] == [{'$ref': '#/definitions/DayHours'}]
+    with pytest.raises(KeyError):
+        view['x-scope']
+    # The view does not copy the underlying objects
+    fragment['MON']['description'] = 'Monday'
+    assert view['MON']['description'] == 'Monday'
+
+
+@pytest.mark.parametrize('fragment', [1, 'string', None])
+def test_strip_xscope_view_of_non_containers(fragment):
+    assert strip_xscope_view(fragment) is fragment
+
+
+def test_strip_xscope_view_serialization(petstore_spec):
+    assert simplejson.loads(
+        simplejson.dumps(petstore_spec.client_spec_view, for_json=True),
+    ) == petstore_spec.client_spec_dict
+
+
+def test_deep_getsizeof_counts_contained_objects():
+    shared = ['a', 'b']
+    obj = {'key1': shared, 'key2': shared}
+
+    assert deep_getsizeof(obj) > deep_getsizeof({'key1': None, 'key2': None})
+    # shared objects are counted once
+    assert deep_getsizeof(obj) < deep_getsizeof({'key1': ['a', 'b'], 'key2': ['c', 'd']})
+
+
+def test_deep_getsizeof_shares_accounting_via_seen():
+    shared = {'a': [1, 2, 3]}
+    seen = set()
+
+    assert deep_getsizeof(shared, seen) > 0
+    assert deep_getsizeof(shared, seen) == 0
+    assert id(shared) in seen
+
+
+def test_deep_getsizeof_supports_recursive_objects():
+    obj = {}
+    obj['self'] = obj
+
+    assert deep_getsizeof(obj) > 0
+
+
+def test_fingerprint_ignores_keys_order_and_xscope():
+    assert fingerprint({'a': 1, 'b': [{'c': 'd'}]}) == fingerprint(
+        {'b': [{'x-scope': ['file:///swagger.json'], 'c': 'd'}], 'a': 1},
+    )
+
+
+@pytest.mark.parametrize(
+    'fragment, other_fragment',
+    [
+        [{'a': 1}, {'a': '1'}],
+        [{'a': 1}, {'b': 1}],
+        [{'a': True}, {'a': 1}],
+        [{'a': None}, {'a': 'None'}],
+        [[1, 2], [2, 1]],
+        [{'a': [1]}, {'a': {'1': 1}}],
+        [{'ab': 'c'}, {'a': 'bc'}],
+    ],
+)
+def test_fingerprint_of_different_content(fragment, other_fragment):
+    assert fingerprint(fragment) != fingerprint(other_fragment)
+
+
+def test_fingerprint_does_not_depend_on_shared_objects():
+    shared = {'type': 'string'}
+    assert fingerprint({'a': shared, 'b': shared}) == fingerprint({'a': {'type': 'string'}, 'b': {'type': 'string'}})
+
+
+def test_fingerprint_supports_recursive_objects():
+    def recursive_fragment(property_type):
+        fragment = {'type': 'object', 'properties': {'value': {'type': property_type}}}
+        fragment['properties']['self'] = fragment
+        return fragment
+
+    assert fingerprint(recursive_fragment('string')) == fingerprint(recursive_fragment('string'))
+    assert fingerprint(recursive_fragment('string')) != fingerprint(recursive_fragment('integer'))
+
+
+def test_fingerprint_supports_non_string_keys():
+    assert fingerprint({200: 'ok', '200': 'ok'}) != fingerprint({'200': 'ok'})
+
+
+def test_is_same_content_ignores_keys_order_and_xscope():
+    assert is_same_content(
+        {'a': 1, 'b': [{'c': 'd'}]},
+        {'b': [{'x-scope': ['file:///swagger.json'], 'c': 'd'}], 'a': 1.0},
+    )
+
+
+@pytest.mark.parametrize(
+    'fragment, other_fragment',
+    [
+        [{'a': 1}, {'a': '1'}],
+        [{'a': 1}, {'b': 1}],
+        [{'a': True}, {'a': 1}],
+        [{'a': None}, {'a': 'None'}],
+        [[1, 2], [2, 1]],
+        [[1], [1, 1]],
+        [{'a': [1]}, {'a': {'1': 1}}],
+    ],
+)
+def test_is_same_content_of_different_content(fragment, other_fragment):
+    assert not is_same_content(fragment, other_fragment)
+
+
+def test_is_same_content_supports_recursive_objects():
+    def recursive_fragment(property_type):
+        fragment = {'type': 'object', 'properties': {'value': {'type': property_type}}}
+        fragment['properties']['self'] = fragment
+        return fragment
+
+    assert is_same_content(recursive_fragment('string'), recursive_fragment('string'))
+    assert not is_same_content(recursive_fragment('string'), recursive_fragment('integer'))
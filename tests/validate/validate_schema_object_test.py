@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import pytest
+from jsonschema import ValidationError
 
 from bravado_core.exception import SwaggerMappingError
+from bravado_core.validate import get_schema_object_validator
 from bravado_core.validate import validate_schema_object
 
 
@@ -24,3 +26,38 @@ def test_allOf_with_ref(composition_spec):
 
 def test_no_validation_when_no_type(minimal_swagger_spec):
     validate_schema_object(minimal_swagger_spec, {}, None)
+
+
+@pytest.mark.parametrize(
+    'schema_object_spec, valid_value, invalid_value',
+    [
+        ({'type': 'integer', 'maximum': 10}, 10, 11),
+        ({'type': 'array', 'items': {'type': 'string'}}, ['a'], [1]),
+        ({'type': 'object', 'required': ['a']}, {'a': 1}, {}),
+    ],
+)
+def test_get_schema_object_validator(minimal_swagger_spec, schema_object_spec, valid_value, invalid_value):
+    validate = get_schema_object_validator(minimal_swagger_spec, schema_object_spec)
+    validate(valid_value)
+    with pytest.raises(ValidationError):
+        validate(invalid_value)
+
+
+def test_get_schema_object_validator_unknown_type(minimal_swagger_spec):
+    validate = get_schema_object_validator(minimal_swagger_spec, {'type': 'unknown'})
+    with pytest.raises(SwaggerMappingError) as excinfo:
+        validate('foo')
+    assert 'Unknown type' in str(excinfo.value)
+
+
+@pytest.mark.parametrize('schema_object_spec', [{}, {'type': 'file'}])
+def test_get_schema_object_validator_no_validation(minimal_swagger_spec, schema_object_spec):
+    get_schema_object_validator(minimal_swagger_spec, schema_object_spec)(None)
+
+
+def test_get_schema_object_validator_scrubs_sensitive_values(minimal_swagger_spec):
+    validate = get_schema_object_validator(minimal_swagger_spec, {'type': 'string', 'x-sensitive': True})
+    with pytest.raises(ValidationError) as excinfo:
+        validate(123)
+    assert '123' not in str(excinfo.value.message)
+    assert excinfo.value.instance == '***'
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import mock
+import pytest
+
+from bravado_core.marshal import _get_marshaling_method
+from bravado_core.param import get_param_type_spec
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import _get_unmarshaling_method
+from bravado_core.warmup import _count_plans
+from bravado_core.warmup import _select_model_types
+from bravado_core.warmup import _select_operations
+from bravado_core.warmup import warmup_operation
+from bravado_core.warmup import warmup_spec
+
+
+def test_warmup_operation_builds_params_and_responses_plans(petstore_spec):
+    op = petstore_spec.resources['pet'].operations['findPetsByStatus']
+    warmup_operation(op)
+
+    plans_count = _count_plans()
+    for param in op.params.values():
+        param_spec = petstore_spec.deref(get_param_type_spec(param))
+        _get_marshaling_method(swagger_spec=petstore_spec, object_schema=param_spec)
+        _get_unmarshaling_method(swagger_spec=petstore_spec, object_schema=param_spec)
+    response_schema = petstore_spec.deref(op.op_spec['responses']['200']['schema'])
+    _get_unmarshaling_method(swagger_spec=petstore_spec, object_schema=response_schema)
+
+    assert _count_plans() == plans_count
+    assert {'consumes', 'produces', 'security_requirements'}.issubset(op.__dict__)
+
+
+def test_warmup_spec_evaluates_models_lazy_attributes(petstore_spec):
+    warmup_spec(petstore_spec)
+
+    for model_type in petstore_spec.definitions.values():
+        assert '_properties' in model_type.__dict__
+        assert '_inherits_from' in model_type.__dict__
+
+
+def test_warmup_spec_returns_number_of_built_plans(petstore_dict):
+    spec = Spec.from_dict(petstore_dict)
+
+    assert warmup_spec(spec).plans > 0
+    # Plans are memoized, so a second warmup does not build anything
+    assert warmup_spec(spec).plans == 0
+
+
+def test_warmup_spec_report(petstore_dict):
+    spec = Spec.from_dict(petstore_dict)
+    all_operations = {id(op) for resource in spec.resources.values() for op in resource.operations.values()}
+
+    warmup_report = warmup_spec(spec)
+
+    assert warmup_report.operations == len(all_operations)
+    assert warmup_report.plans > 0
+    assert warmup_report.duration >= 0
+
+
+@pytest.mark.parametrize(
+    'names, expected_operations',
+    [
+        [['getPetById'], {'getPetById'}],
+        [['store'], {'getInventory', 'placeOrder', 'getOrderById', 'deleteOrder'}],
+        [['store', 'getPetById', 'getOrderById'], {'getInventory', 'placeOrder', 'getOrderById', 'deleteOrder', 'getPetById'}],
+    ],
+)
+def test_warmup_spec_selected_operations(petstore_dict, names, expected_operations):
+    spec = Spec.from_dict(petstore_dict)
+
+    with mock.patch('bravado_core.warmup.warmup_operation', autospec=True) as mock_warmup_operation:
+        warmup_report = warmup_spec(spec, names=names)
+
+    assert {call[0][0].operation_id for call in mock_warmup_operation.call_args_list} == expected_operations
+    assert warmup_report.operations == len(expected_operations)
+
+
+def test_warmup_spec_warns_about_unknown_names(petstore_dict, caplog):
+    spec = Spec.from_dict(petstore_dict)
+
+    warmup_report = warmup_spec(spec, names=['getPetById', 'unknownOperation'])
+
+    assert warmup_report.operations == 1
+    assert 'No operations found for the following operationIds/tags: unknownOperation' in caplog.text
+
+
+@pytest.mark.parametrize(
+    'warmup, expected_operations',
+    [
+        [True, 20],
+        [['pet'], 8],
+    ],
+)
+def test_build_with_warmup(petstore_dict, warmup, expected_operations):
+    spec = Spec.from_dict(petstore_dict, config={'warmup': warmup})
+
+    assert spec.warmup_report.operations == expected_operations
+
+
+def test_build_without_warmup(petstore_dict):
+    with mock.patch('bravado_core.spec.warmup_spec', autospec=True) as mock_warmup_spec:
+        spec = Spec.from_dict(petstore_dict)
+
+    assert spec.warmup_report is None
+    assert not mock_warmup_spec.called
+
+
+@pytest.mark.parametrize(
+    'names, expected_models',
+    [
+        [['getPetById'], {'Category', 'Pet', 'Tag'}],
+        [['store'], {'Order'}],
+        [['getInventory'], set()],
+    ],
+)
+def test_warmup_spec_selected_operations_models(petstore_dict, names, expected_models):
+    spec = Spec.from_dict(petstore_dict)
+
+    warmup_spec(spec, names=names)
+
+    assert {
+        model_name
+        for model_name, model_type in spec.definitions.items()
+        if '_properties' in model_type.__dict__
+    } == expected_models
+
+
+def test_warmup_spec_selected_operations_models_include_polymorphic_models(polymorphic_spec):
+    model_types = _select_model_types(polymorphic_spec, _select_operations(polymorphic_spec))
+
+    # Bird and Whale are not used by any operation
+    assert {model_type.__name__ for model_type in model_types} == {'Cat', 'Dog', 'GenericPet', 'PetList'}